@@ -1,25 +1,38 @@
+# Importing the package does no work: the classes and the submodules are imported when they are first accessed
+# (PEP 562), e.g. `pandas_exp.QuantcoDataFrame` imports pandas_exp.dataframe. The examples are run with
+# `python -m pandas_exp`, see examples.py.
+from importlib import import_module
 
-from pandas_exp.dataframe import QuantcoDataFrame
+_attributes = {
+    "QuantcoDataFrame": "pandas_exp.dataframe",
+    "QuantcoSeries": "pandas_exp.series",
+    "QuantcoException": "pandas_exp.exception",
+    "QuantcoExpression": "pandas_exp.expression",
+    "QuantcoGroupBy": "pandas_exp.groupby",
+    "QuantcoSharedFrame": "pandas_exp.shared",
+    "QuantcoStream": "pandas_exp.streaming",
+    "lazy": "pandas_exp.expression",
+    "read_csv": "pandas_exp.reader",
+}
+_submodules = {
+    "bitmap", "buffer", "dataframe", "examples", "exception", "execution", "expression", "groupby", "index", "join",
+    "kernels", "profiling", "reader", "records", "series", "shared", "stats", "storage", "streaming",
+}
 
-df = QuantcoDataFrame({
-    'SKU' : ["X4E", "T3B", "F8D", "C7X"],
-    'price' : [7.0, 3.5, 8.0, 6.0],
-    'sales' : [5, 3, 1, 10],
-    'taxed' : [False, False, True, False]
-})
+__all__ = list(_attributes)
 
-# let's find all our tax free products/SKUs where the price our $5.0 shipping fee is more than $10 and we had more than 3 sales.
-print(df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]]["SKU"])
 
-df = QuantcoDataFrame({
-    'Student' : ["Harry Potter", "Hermione Granger", "Ron Weasley", "Draco Malfoy", "Neville Longbottom"],
-    'Course Attendance - DarkArts' : [True, False, True, None, False],
-    'Grade - DarkArts' : [9, 9, 8, 8, 7],
-    'Friends' : [2, 2, 2, 5, 10],
-    'House': ["Gryffindor", "Gryffindor", "Gryffindor", "Slytherin", None],
-    "Quiditch-Seeker": [True, None, False, True, None]
-})
-# let's award 1.0 grade points to Gryfinndor and see which student has greater than 8 grade points.
-# Filter those students who have >=2 friends and have attended the darkarts course and is also a quiditch seeker.
-result = df[(df["Grade - DarkArts"] + 1.0 > 8) & (df['House'] == "Gryffindor") & (df['Friends'] >=2) & (df["Course Attendance - DarkArts"] == True) & (df['Quiditch-Seeker'] == True)]
-print(result["Student"])
\ No newline at end of file
+def __getattr__(name:str):
+    if name in _attributes:
+        value = getattr(import_module(_attributes[name]), name)
+    elif name in _submodules:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Kept in the globals of the package, so that __getattr__ is called only for the first access.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_attributes) | _submodules)
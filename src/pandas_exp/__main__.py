@@ -0,0 +1,4 @@
+from pandas_exp.examples import products_example, students_example
+
+products_example()
+students_example()
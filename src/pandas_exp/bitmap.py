@@ -0,0 +1,145 @@
+from typing import Iterable
+
+# Translations between the bytes holding one row per byte (0 or 1) and the digits of a binary number.
+_to_digits = bytes([48] + [49] * 255)
+_from_digits = bytes.maketrans(b"01", b"\x00\x01")
+
+
+class QuantcoBitmap(object):
+    # One bit per row: the bit of row i is the bit i % 8 of the byte i // 8. The bits after the last row are always 0.
+    # The bitwise operators convert the bitmaps to Python ints, so that they run over the whole bitmap at once
+    # instead of row by row.
+
+    def __init__(self, data, length:int) -> None:
+        # The data is a bytearray owned by the bitmap or a read-only memoryview, e.g. on a memory-mapped file.
+        self._data = data
+        self._length = length
+
+    def __getstate__(self):
+        return {"_data": bytearray(self._data), "_length": self._length}
+
+    @classmethod
+    def from_bytes(cls, flags):
+        # Packs one row per byte (0 is False, anything else is True), e.g. a bytearray or a bool generator.
+        flags = bytes(flags)
+        if not flags:
+            return cls(bytearray(), 0)
+        return cls.from_int(int(flags.translate(_to_digits)[::-1], 2), len(flags))
+
+    @classmethod
+    def from_int(cls, value:int, length:int):
+        value &= (1 << length) - 1
+        return cls(bytearray(value.to_bytes((length + 7) // 8, "little")), length)
+
+    @classmethod
+    def zeros(cls, length:int):
+        return cls(bytearray((length + 7) // 8), length)
+
+    @classmethod
+    def ones(cls, length:int):
+        return cls.from_int(-1, length)
+
+    @classmethod
+    def concat(cls, bitmaps:Iterable["QuantcoBitmap"]):
+        return cls.from_bytes(b"".join(bitmap.unpack() for bitmap in bitmaps))
+
+    @property
+    def data(self):
+        return self._data
+
+    def to_int(self) -> int:
+        return int.from_bytes(self._data, "little")
+
+    def unpack(self) -> bytes:
+        # One row per byte, 0 or 1.
+        if self._length == 0:
+            return b""
+        digits = bin(self.to_int())[2:].encode("ascii")[::-1]
+        return digits.ljust(self._length, b"0").translate(_from_digits)
+
+    def tolist(self):
+        return list(self.unpack())
+
+    def tobytes(self) -> bytes:
+        return bytes(self._data)
+
+    def copy(self):
+        return QuantcoBitmap(bytearray(self._data), self._length)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self.unpack())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={self._length}, bits={self.unpack().translate(_to_digits).decode('ascii')})"
+
+    def __getitem__(self, position):
+        if type(position) == slice:
+            start, stop, step = position.indices(self._length)
+            if step != 1:
+                return QuantcoBitmap.from_bytes(self.unpack()[position])
+            if stop <= start:
+                return QuantcoBitmap(bytearray(), 0)
+            # Only the bytes holding the rows of the slice are converted.
+            bits = int.from_bytes(self._data[start >> 3:(stop + 7) >> 3], "little") >> (start & 7)
+            return QuantcoBitmap.from_int(bits, stop - start)
+        if position < 0:
+            position += self._length
+        if position < 0 or position >= self._length:
+            raise IndexError("list index out of range")
+        return (self._data[position >> 3] >> (position & 7)) & 1
+
+    def __setitem__(self, position:int, value) -> None:
+        if position < 0:
+            position += self._length
+        if position < 0 or position >= self._length:
+            raise IndexError("list assignment index out of range")
+        if value:
+            self._data[position >> 3] |= 1 << (position & 7)
+        else:
+            self._data[position >> 3] &= ~(1 << (position & 7)) & 0xFF
+
+    def append(self, value) -> None:
+        if self._length % 8 == 0:
+            self._data.append(0)
+        self._length += 1
+        self[self._length - 1] = value
+
+    def count(self, value) -> int:
+        ones = bin(self.to_int()).count("1")
+        return ones if value else self._length - ones
+
+    def find(self, value, start:int=0) -> int:
+        # The position of the first row from start holding the value, -1 if there is none.
+        if start >= self._length:
+            return -1
+        bits = self.to_int() >> start
+        if not value:
+            bits = ~bits
+        bits &= (1 << (self._length - start)) - 1
+        if bits == 0:
+            return -1
+        return start + (bits & -bits).bit_length() - 1
+
+    def __contains__(self, value) -> bool:
+        return self.find(value) >= 0
+
+    def __eq__(self, other) -> bool:
+        if type(other) != QuantcoBitmap:
+            return NotImplemented
+        return self._length == other._length and self.to_int() == other.to_int()
+
+    def __and__(self, other:"QuantcoBitmap"):
+        return QuantcoBitmap.from_int(self.to_int() & other.to_int(), self._length)
+
+    def __or__(self, other:"QuantcoBitmap"):
+        return QuantcoBitmap.from_int(self.to_int() | other.to_int(), self._length)
+
+    def __xor__(self, other:"QuantcoBitmap"):
+        return QuantcoBitmap.from_int(self.to_int() ^ other.to_int(), self._length)
+
+    def __invert__(self):
+        return QuantcoBitmap.from_int(~self.to_int(), self._length)
+
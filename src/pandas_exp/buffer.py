@@ -0,0 +1,401 @@
+from array import array
+from collections.abc import Sequence
+from itertools import repeat
+from operator import is_not
+from typing import Any, List, Optional
+
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.exception import QuantcoException
+from pandas_exp.stats import QuantcoStatistics
+
+
+class QuantcoBuffer(object):
+    # int and float columns are kept in contiguous typed arrays, bool columns in a bitmap, str and NoneType columns in a list.
+    typecodes = {int: 'q', float: 'd', bool: 'b'}
+
+    def __init__(self, values, validity:Optional[QuantcoBitmap]=None, value_type:type=type(None)) -> None:
+        self._values = values
+        # A bitmap with the bit of a row set if the row holds a value and unset if it holds None. None when there are no nulls.
+        # The values and the validity are either owned by the buffer or view read-only memory, e.g. a memory-mapped file.
+        self._validity = validity
+        self._type = value_type
+        # True when the values are shared with another buffer. A shared buffer copies its values before they are modified.
+        self._shared = False
+        # True when the values can't be modified, e.g. they are in shared memory viewed by other processes.
+        self._read_only = False
+        # Results computed from the values, e.g. the statistics. Shared with the buffers sharing the values.
+        self._cache = {}
+
+    def __getstate__(self):
+        # A buffer is pickled to run a task in another process. The values viewing memory (e.g. a memory-mapped file)
+        # are copied, and the cache is not pickled.
+        values = self._values
+        if type(values) == memoryview:
+            values = array(self.typecodes[self._type], values)
+        elif type(values) not in (list, array, QuantcoBitmap, QuantcoDictionaryValues):
+            values = list(values)
+        return {"_values": values, "_validity": self._validity, "_type": self._type, "_shared": False, "_read_only": False, "_cache": {}}
+
+    @classmethod
+    def from_list(cls, list_to_convert:List[Any], value_type:type):
+        typecode = cls.typecodes.get(value_type)
+        if typecode is None:
+            return cls(list(list_to_convert), None, value_type)
+        validity = None
+        values = list_to_convert
+        if None in list_to_convert:
+            validity = QuantcoBitmap.from_bytes(map(is_not, list_to_convert, repeat(None)))
+            fill = value_type()
+            values = [fill if value is None else value for value in list_to_convert]
+        try:
+            return cls(cls.__pack__(value_type, values), validity, value_type)
+        except OverflowError:
+            # Python ints are unbounded; keep the column as a list when it doesn't fit into 64 bits.
+            return cls(list(list_to_convert), None, value_type)
+
+    @classmethod
+    def concat(cls, buffers:List["QuantcoBuffer"], value_type:type):
+        typecode = cls.typecodes.get(value_type)
+        if typecode is None or any(not buffer.is_typed or buffer.type != value_type for buffer in buffers):
+            values = []
+            for buffer in buffers:
+                values.extend(buffer.to_list())
+            return cls.from_list(values, value_type)
+        validity = None
+        if any(buffer.validity is not None for buffer in buffers):
+            validity = QuantcoBitmap.concat(QuantcoBitmap.ones(len(buffer)) if buffer.validity is None else buffer.validity for buffer in buffers)
+        if value_type == bool:
+            return cls(QuantcoBitmap.concat(buffer.values for buffer in buffers), validity, value_type)
+        values = array(typecode)
+        for buffer in buffers:
+            values.extend(buffer.values)
+        return cls(values, validity, value_type)
+
+    @classmethod
+    def __pack__(cls, value_type:type, values):
+        # The typed storage of the values: a bitmap for bool and an array for int and float.
+        if value_type == bool:
+            return QuantcoBitmap.from_bytes(values)
+        return array(cls.typecodes[value_type], values)
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def validity(self):
+        return self._validity
+
+    @property
+    def type(self):
+        return self._type
+
+    @property
+    def read_only(self):
+        return self._read_only
+
+    @property
+    def is_typed(self):
+        return self._type in self.typecodes and type(self._values) != list
+
+    def null_count(self):
+        if self.is_typed:
+            return 0 if self._validity is None else self._validity.count(0)
+        return self._values.count(None)
+
+    def first_null(self):
+        if self.is_typed:
+            return -1 if self._validity is None else self._validity.find(0)
+        return self._values.index(None) if None in self._values else -1
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, position:int):
+        length = len(self._values)
+        if position < 0:
+            position += length
+        if position < 0 or position >= length:
+            raise IndexError("list index out of range")
+        if self._validity is not None and not self._validity[position]:
+            return None
+        value = self._values[position]
+        if self._type == bool:
+            return bool(value)
+        return value
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Any]:
+        if not self.is_typed:
+            return list(self._values)
+        values = self._values.tolist()
+        if self._type == bool:
+            values = list(map(bool, values))
+        if self._validity is not None:
+            values = [value if valid else None for value, valid in zip(values, self._validity)]
+        return values
+
+    def share(self):
+        # Returns a buffer viewing the same values without copying them. Both buffers copy the values on their next modification.
+        self._shared = True
+        buffer = QuantcoBuffer(self._values, self._validity, self._type)
+        buffer._shared = True
+        buffer._read_only = self._read_only
+        buffer._cache = self._cache
+        return buffer
+
+    def statistics(self) -> QuantcoStatistics:
+        if "statistics" not in self._cache:
+            self._cache["statistics"] = QuantcoStatistics(self._values, self._validity, self._type)
+        return self._cache["statistics"]
+
+    def set(self, position:int, value:Any) -> None:
+        if position < -len(self._values) or position >= len(self._values):
+            raise IndexError("list assignment index out of range")
+        self._cache = {}
+        if self._shared:
+            if self.is_typed:
+                self._values = self._values.copy() if self._type == bool else array(self.typecodes[self._type], self._values)
+            else:
+                self._values = self._values.copy() if type(self._values) == QuantcoDictionaryValues else list(self._values)
+            self._validity = None if self._validity is None else self._validity.copy()
+            self._shared = False
+        if not self.is_typed:
+            self._values[position] = value
+            return
+        if value is None:
+            if self._validity is None:
+                self._validity = QuantcoBitmap.ones(len(self._values))
+            self._validity[position] = 0
+            return
+        try:
+            self._values[position] = value
+        except OverflowError:
+            values = self.to_list()
+            values[position] = value
+            self._values = values
+            self._validity = None
+            return
+        if self._validity is not None:
+            self._validity[position] = 1
+
+    def slice(self, start:int, stop:int):
+        validity = None if self._validity is None else self._validity[start:stop]
+        buffer = QuantcoBuffer(self._values[start:stop], validity, self._type)
+        buffer._read_only = self._read_only
+        return buffer
+
+    def null_positions(self):
+        if not self.is_typed:
+            return {position for position, value in enumerate(self._values) if value is None}
+        positions = set()
+        if self._validity is not None:
+            validity = self._validity.unpack()
+            position = validity.find(0)
+            while position >= 0:
+                positions.add(position)
+                position = validity.find(0, position + 1)
+        return positions
+
+
+class QuantcoDictionaryValues(Sequence):
+    # The values of a dictionary-encoded str column: the table of the unique values and the position of the value of each
+    # row in the table (its code). None has the code -1.
+    def __init__(self, codes:array, dictionary:List[str], positions:Optional[dict]=None) -> None:
+        self._codes = codes
+        self._dictionary = dictionary
+        self._positions = {value: code for code, value in enumerate(dictionary)} if positions is None else positions
+
+    @classmethod
+    def encode(cls, values):
+        positions = {}
+        codes = array('q', [-1 if value is None else positions.setdefault(value, len(positions)) for value in values])
+        return cls(codes, list(positions), positions)
+
+    @property
+    def codes(self):
+        return self._codes
+
+    @property
+    def dictionary(self):
+        return self._dictionary
+
+    def code(self, value:Any) -> int:
+        # -2 for a value which is not in the dictionary, so that it is not equal to any code.
+        if value is None:
+            return -1
+        return self._positions.get(value, -2)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __getitem__(self, position):
+        if type(position) == slice:
+            return QuantcoDictionaryValues(self._codes[position], self._dictionary, self._positions)
+        code = self._codes[position]
+        return None if code == -1 else self._dictionary[code]
+
+    def __setitem__(self, position:int, value:Any) -> None:
+        code = self.code(value)
+        if code == -2:
+            # The dictionary may be shared with slices of the values, so it is copied before a value is added.
+            code = len(self._dictionary)
+            self._dictionary = self._dictionary + [value]
+            self._positions = dict(self._positions)
+            self._positions[value] = code
+        self._codes[position] = code
+
+    def __iter__(self):
+        # The code -1 of None picks the None appended at the end of the table.
+        return map((self._dictionary + [None]).__getitem__, self._codes)
+
+    def __contains__(self, value:Any) -> bool:
+        return self.code(value) in self._codes
+
+    def count(self, value:Any) -> int:
+        return self._codes.count(self.code(value))
+
+    def index(self, value:Any) -> int:
+        return self._codes.index(self.code(value))
+
+    def copy(self):
+        return QuantcoDictionaryValues(array('q', self._codes), self._dictionary, self._positions)
+
+
+class QuantcoScalar(object):
+    # A single value broadcast to the length of a series. It behaves like a QuantcoBuffer without expanding the value into a list.
+    def __init__(self, value:Any, length:int, value_type:type) -> None:
+        self._value = value
+        self._length = length
+        self._type = value_type
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def values(self):
+        return repeat(self._value, self._length)
+
+    @property
+    def validity(self):
+        return None
+
+    @property
+    def type(self):
+        return self._type
+
+    @property
+    def is_typed(self):
+        return self._type in QuantcoBuffer.typecodes
+
+    def null_count(self):
+        return self._length if self._value is None else 0
+
+    def first_null(self):
+        return 0 if self._value is None and self._length > 0 else -1
+
+    def null_positions(self):
+        return set(range(self._length)) if self._value is None else set()
+
+    def slice(self, start:int, stop:int):
+        return QuantcoScalar(self._value, len(range(self._length)[start:stop]), self._type)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, position:int):
+        if position < -self._length or position >= self._length:
+            raise IndexError("list index out of range")
+        return self._value
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def to_list(self) -> List[Any]:
+        return [self._value] * self._length
+
+
+class QuantcoBufferBuilder(object):
+    # Appends the values of a column one by one into a typed buffer, checking the type of each value as it arrives.
+    allowed_data_types = {str, bool, int, float, type(None)}
+
+    def __init__(self, value_type:type=type(None)) -> None:
+        self._type = value_type
+        self.__reset__()
+
+    @property
+    def type(self):
+        return self._type
+
+    def __len__(self):
+        return len(self._values)
+
+    def __reset__(self) -> None:
+        # The bool values and the validity are collected one byte per row and packed into bitmaps by finish.
+        typecode = QuantcoBuffer.typecodes.get(self._type)
+        if typecode is None:
+            self._values = []
+        else:
+            self._values = bytearray() if self._type == bool else array(typecode)
+        self._validity = None
+
+    def append(self, value:Any) -> None:
+        if value is None:
+            self.__append_none__()
+            return
+        value_type = type(value)
+        if value_type != self._type:
+            if value_type not in self.allowed_data_types:
+                raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.")
+            if self._type != type(None):
+                raise QuantcoException(f"The elements in the series are not of same type.")
+            self.__set_type__(value_type)
+        try:
+            self._values.append(value)
+        except OverflowError:
+            # Python ints are unbounded; the column is kept as a list once a value doesn't fit into 64 bits.
+            self._values = self.finish().to_list()
+            self._values.append(value)
+            return
+        if self._validity is not None:
+            self._validity.append(1)
+
+    def __append_none__(self) -> None:
+        if type(self._values) == list:
+            self._values.append(None)
+            return
+        if self._validity is None:
+            self._validity = bytearray(b"\x01" * len(self._values))
+        self._values.append(self._type())
+        self._validity.append(0)
+
+    def __set_type__(self, value_type:type) -> None:
+        # All the values appended so far are None.
+        length = len(self._values)
+        self._type = value_type
+        self.__reset__()
+        if type(self._values) != list:
+            self._values.extend(repeat(self._type(), length))
+            self._validity = bytearray(length)
+        else:
+            self._values.extend([None] * length)
+
+    def __widen__(self) -> None:
+        # The int values appended so far are converted to float, e.g. when a csv column holding 7 reads 3.5 next.
+        self._type = float
+        if type(self._values) == list:
+            self._values = [None if value is None else float(value) for value in self._values]
+        else:
+            self._values = array(QuantcoBuffer.typecodes[float], self._values)
+
+    def finish(self) -> QuantcoBuffer:
+        # Returns the buffer of the values appended so far and starts a new one, keeping the type of the column.
+        values = QuantcoBitmap.from_bytes(self._values) if type(self._values) == bytearray else self._values
+        validity = None if self._validity is None else QuantcoBitmap.from_bytes(self._validity)
+        buffer = QuantcoBuffer(values, validity, self._type)
+        buffer.statistics().__compute__()
+        self.__reset__()
+        return buffer
@@ -1,4 +1,7 @@
+from array import array
+from itertools import repeat
 from typing import Any, Dict, List, Union
+from pandas_exp import execution, index, kernels, profiling
 from pandas_exp.exception import QuantcoException
 from pandas_exp.series import QuantcoSeries
 
@@ -8,21 +11,144 @@ class QuantcoDataFrame(object):
 
     def __init__(self, frame_dict:Dict[str, List[Union[str, bool, int, float]]]={}) -> None:
         self._frame = self.initialize_frame(frame_dict)
+        self._selection = None
+        self._columns = {}
+
+    @classmethod
+    def __from_view__(cls, frame:Dict[str, QuantcoSeries], selection, rows:int, columns:Dict[str, QuantcoSeries]={}):
+        # A filtered frame keeps the columns of the frame it was filtered from, along with the selected row positions.
+        # The selected rows of a column are gathered only when the column is accessed.
+        data_frame = cls.__new__(cls)
+        data_frame._frame = frame
+        data_frame._selection = selection
+        data_frame._columns = dict(columns)
+        data_frame.rows = rows
+        data_frame.columns = len(frame)
+        return data_frame
 
     @property
     def frame(self):
-        return self._frame
+        missing = [k for k in self._frame.keys() if k not in self._columns]
+        if self._selection is not None and len(missing) > 1 and execution.get_backend() != "serial":
+            # The columns of a filtered frame are gathered as separate tasks.
+            buffers = execution.map_tasks(kernels.take, [self._frame[k]._buffer for k in missing], repeat(self._selection))
+            self._columns.update({k: QuantcoSeries.__from_buffer__(buffer) for k, buffer in zip(missing, buffers)})
+        return {k: self.__column__(k) for k in self._frame.keys()}
     
     def __getitem__(self, key):
-        if type(key) == list or type(key) == QuantcoSeries:
+        if profiling.profiler is not None:
+            return profiling.profiler("QuantcoDataFrame.__getitem__", self.rows, self.__access__, key)
+        return self.__access__(key)
+
+    def __access__(self, key):
+        if type(key) == list or isinstance(key, QuantcoSeries):
             filter_series = QuantcoSeries.convert_list_to_quantco_series(key)
-            new_frame = dict()
-            for k,v in self._frame.items():
-                new_frame[k] = v[filter_series]
-            return QuantcoDataFrame(new_frame)
+            return self.__filter_frame__(filter_series)
+
+        return self.__column__(key)
+
+    def __setitem__(self, key, value):
+        self.__check_key__(key)
+        self.__check_series_none__(key, value)
+        if type(value) != list and not isinstance(value, QuantcoSeries):
+            raise QuantcoException(f"The series with name: {key} should be a list or a QuantcoSeries.")
+        if len(self._frame) > 0:
+            self.__check_length_of_list__(value, self.rows)
+        # The columns are gathered and the dict is copied, so that the frames sharing them with this frame are not modified.
+        frame = self.frame
+        frame[key] = QuantcoSeries.__from_buffer__(value._buffer.share(), normalize=False) if isinstance(value, QuantcoSeries) else QuantcoSeries(value)
+        self._frame = frame
+        self._selection = None
+        self._columns = {}
+        self.rows = len(value)
+        self.columns = len(frame)
+
+    def __column__(self, key) -> QuantcoSeries:
+        # A column is returned as a view on the buffer of the frame. The values are copied when either of them is modified.
+        series = self._frame[key]
+        if self._selection is not None:
+            if key not in self._columns:
+                self._columns[key] = QuantcoSeries.__from_buffer__(kernels.take(series._buffer, self._selection))
+            series = self._columns[key]
+        return QuantcoSeries.__from_buffer__(series._buffer.share(), normalize=False)
 
-        return self._frame[key]
+    def select(self, column_names:List[str]):
+        # Returns a frame with a subset of the columns, sharing the columns and the selected rows with this frame.
+        frame = {k: self._frame[k] for k in column_names}
+        columns = {k: v for k, v in self._columns.items() if k in frame}
+        return QuantcoDataFrame.__from_view__(frame, self._selection, self.rows, columns)
+
+    def __filter_frame__(self, filter_series:QuantcoSeries):
+        if len(self._frame) == 0:
+            return QuantcoDataFrame()
+        # The mask is checked and converted to the positions of the selected rows once, and the positions are shared by all the columns.
+        QuantcoSeries.__check_filter_list__(filter_series, self.rows)
+        selection = kernels.selection(filter_series._buffer, self._selection)
+        return QuantcoDataFrame.__from_view__(self._frame, selection, len(selection))
     
+    def create_index(self, column_name:str):
+        # Builds the hash index of the column, see QuantcoSeries.create_index.
+        self.__column__(column_name).create_index()
+        return self
+
+    def lookup(self, column_name:str, keys):
+        # Returns the rows whose value of the column is the key, or one of the keys when a list is given. The rows are
+        # found with the hash index of the column, which is built on the first lookup, and are gathered only when accessed.
+        keys = keys if type(keys) == list else [keys]
+        positions = index.create_hash_index(self.__column__(column_name)._buffer).positions(keys)
+        if self._selection is not None:
+            positions = array('q', map(self._selection.__getitem__, positions))
+        return QuantcoDataFrame.__from_view__(self._frame, positions, len(positions))
+
+    def groupby(self, keys:Union[str, List[str]]):
+        # df.groupby("House").agg({"sales": "sum", "price": ["mean", "max"]})
+        from pandas_exp.groupby import QuantcoGroupBy
+        return QuantcoGroupBy(self, keys)
+
+    def merge(self, other, on:Union[str, List[str]], how:str="inner", suffixes=("_x", "_y")):
+        # Joins the rows of the other frame whose keys are equal to the keys of the rows of this frame, see join.merge.
+        from pandas_exp.join import merge
+        return merge(self, other, on, how, suffixes)
+
+    def save(self, path:str) -> None:
+        from pandas_exp.storage import save_frame
+        save_frame(self, path)
+
+    @classmethod
+    def open(cls, path:str):
+        # The file is memory-mapped, so the frame is constructed without reading or validating its values.
+        from pandas_exp.storage import open_frame
+        return open_frame(path)
+
+    def to_shared_memory(self):
+        # Places the frame in a block of shared memory, see shared.QuantcoSharedFrame.
+        from pandas_exp.shared import QuantcoSharedFrame
+        return QuantcoSharedFrame.create(self)
+
+    @classmethod
+    def from_shared_memory(cls, name:str):
+        # The frame in the block of shared memory with the name. Its values are viewed without copying or validating them.
+        from pandas_exp.shared import QuantcoSharedFrame
+        return QuantcoSharedFrame(name).frame
+
+    @classmethod
+    def from_records(cls, records, columns:List[str]=None, schema:Dict[str, type]={}):
+        # The rows are dicts, e.g. [{"SKU": "X4E", "sales": 5}], written straight into the columns, see records.py.
+        from pandas_exp.records import from_records
+        return from_records(records, columns, schema)
+
+    @classmethod
+    def from_rows(cls, rows, columns:List[str], schema:Dict[str, type]={}):
+        # The rows are tuples in the order of the columns, e.g. [("X4E", 5)], written straight into the columns.
+        from pandas_exp.records import from_rows
+        return from_rows(rows, columns, schema)
+
+    @classmethod
+    def read_csv(cls, path:str, chunksize:int=None, **kwargs):
+        # The values are appended to the typed buffers of the columns while the file is parsed, without a list per column.
+        from pandas_exp.reader import read_csv
+        return read_csv(path, chunksize, **kwargs)
+
     def __len__(self):
         return len(self._frame.keys())
     
@@ -43,14 +169,20 @@ class QuantcoDataFrame(object):
                 self.columns = 0
             return frame
         except Exception as e:
-            raise QuantcoException(f"The frame is malformed and couldn't be converted to a dataframe. The exception is: {e}")
+            raise QuantcoException(f"The frame is malformed and couldn't be converted to a dataframe. The exception is: {e}", column=getattr(e, "column", None), row=getattr(e, "row", None))
     
     def __construct_frame__(self, frame_dict) -> Dict[str, QuantcoSeries]:
+        # The lists are validated and packed into the buffers of the columns, on the workers of the execution backend
+        # when it isn't serial.
+        names = [k for k,v in frame_dict.items() if not isinstance(v, QuantcoSeries)]
+        buffers = dict(zip(names, execution.map_tasks(_ingest, names, [frame_dict[k] for k in names])))
         frame = {}
         for k,v in frame_dict.items():
-            if type(v) == QuantcoSeries:
-                v = v.series
-            frame[k] = QuantcoSeries(v)
+            if isinstance(v, QuantcoSeries):
+                # The series was validated when it was constructed, so its buffer is shared instead of being validated and copied again.
+                frame[k] = QuantcoSeries.__from_buffer__(v._buffer.share(), normalize=False)
+            else:
+                frame[k] = QuantcoSeries.__from_buffer__(buffers[k], normalize=False)
         return frame
 
     def size(self):
@@ -78,3 +210,11 @@ class QuantcoDataFrame(object):
     def __check_series_none__(self, name_of_series, list_to_check):
         if list_to_check is None:
             raise QuantcoException(f"The series with name: {name_of_series} can't be None.")
+
+
+def _ingest(name:str, values:List[Any]):
+    try:
+        return QuantcoSeries(values)._buffer
+    except QuantcoException as e:
+        e.column = name
+        raise
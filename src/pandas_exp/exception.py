@@ -1,3 +1,10 @@
 class QuantcoException(Exception):
-    def __init__(self, *args: object) -> None:
-        super().__init__(*args)
\ No newline at end of file
+    def __init__(self, *args: object, column=None, row=None) -> None:
+        super().__init__(*args)
+        # The name of the series and the position of the row which failed, when the exception is about a value.
+        self.column = column
+        self.row = row
+
+    def __reduce__(self):
+        # The column and the row are kept when the exception is pickled, e.g. raised in a worker process.
+        return self.__class__, self.args, {"column": self.column, "row": self.row}
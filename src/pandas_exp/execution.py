@@ -0,0 +1,88 @@
+import atexit
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Callable, Iterable, List, Optional
+
+from pandas_exp import index
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.exception import QuantcoException
+
+# The backends running the kernels:
+#   serial    - in the calling thread (the default).
+#   threads   - in a pool of threads. The kernels hold the GIL, so this scales only on a free-threaded Python build.
+#   processes - in a pool of processes. The buffers of a task are pickled to the worker, so this pays off for
+#               expensive kernels over large chunks.
+backends = ["serial", "threads", "processes"]
+# Number of rows of a task when a single operation is split into tasks.
+chunk_size = 1 << 20
+
+_backend = "serial"
+_workers = None
+_pools = {}
+
+
+def set_backend(backend:str="serial", workers:Optional[int]=None) -> None:
+    global _backend, _workers
+    if backend not in backends:
+        raise QuantcoException(f"The execution backend {backend} is not supported. The supported backends are: {', '.join(backends)}.")
+    if workers is not None and (type(workers) != int or workers <= 0):
+        raise QuantcoException(f"The number of workers should be a positive integer. The provided number is {workers}.")
+    _backend = backend
+    _workers = workers
+
+
+def get_backend() -> str:
+    return _backend
+
+
+@contextmanager
+def execution(backend:str, workers:Optional[int]=None):
+    # Within the context, the operations run on the backend.
+    previous = (_backend, _workers)
+    set_backend(backend, workers)
+    try:
+        yield
+    finally:
+        set_backend(*previous)
+
+
+def executor():
+    # The pool of the current backend (a concurrent.futures.Executor), None for the serial backend. The pools are
+    # created once and kept. concurrent.futures is imported with the first pool, as it imports multiprocessing.
+    if _backend == "serial":
+        return None
+    key = (_backend, _workers)
+    if key not in _pools:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        _pools[key] = ThreadPoolExecutor(_workers) if _backend == "threads" else ProcessPoolExecutor(_workers)
+    return _pools[key]
+
+
+def map_tasks(function:Callable, *arguments:Iterable) -> List:
+    # Like map, runs a task calling the function for every set of arguments on the current backend. The results are in
+    # the order of the tasks, and the exception of the first failing task is raised, as it would be by running the
+    # tasks one after the other.
+    pool = executor()
+    if pool is None:
+        return list(map(function, *arguments))
+    return list(pool.map(function, *arguments))
+
+
+def run(kernel:Callable, operator:Callable, *buffers) -> QuantcoBuffer:
+    # Runs an element-wise kernel, split into tasks of chunk_size rows when the backend is not serial.
+    length = len(buffers[0])
+    if _backend == "serial" or length <= chunk_size or index.sorted_index(buffers[0]) is not None or index.hash_index(buffers[0]) is not None:
+        # An indexed buffer is compared as a whole, as the slices don't have the index.
+        return kernel(operator, *buffers)
+    starts = range(0, length, chunk_size)
+    slices = [[buffer.slice(start, min(start + chunk_size, length)) for start in starts] for buffer in buffers]
+    results = map_tasks(kernel, repeat(operator, len(starts)), *slices)
+    types = [result.type for result in results if result.type != type(None)]
+    return QuantcoBuffer.concat(results, types[0] if types else type(None))
+
+
+@atexit.register
+def _shutdown() -> None:
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from operator import and_, or_
+from threading import local
+from typing import Callable, Tuple
+
+from pandas_exp import execution
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+# Number of rows evaluated at a time by a lazy expression.
+chunk_size = 65536
+
+_state = local()
+
+
+@contextmanager
+def lazy():
+    # Within the context, the operators of QuantcoSeries build a QuantcoExpression instead of computing their result.
+    previous = is_lazy()
+    _state.lazy = True
+    try:
+        yield
+    finally:
+        _state.lazy = previous
+
+
+def is_lazy() -> bool:
+    return getattr(_state, "lazy", False)
+
+
+class QuantcoExpression(QuantcoSeries):
+    # An operation over series and/or other expressions which is evaluated only when its values are needed.
+    # The type checks of the operators are still performed when the expression is built.
+
+    def __init__(self, operator:Callable, kernel:Callable, value_type:type, operands:Tuple[QuantcoSeries, ...]) -> None:
+        self._operator = operator
+        self._kernel = kernel
+        # The series are held as snapshots, so that modifying them later doesn't change the result of the expression.
+        self._operands = tuple(map(_snapshot, operands))
+        self._length = len(operands[0])
+        self._type = value_type if self._length > 0 else type(None)
+        self._result = None
+
+    @property
+    def _buffer(self):
+        if self._result is None:
+            self._result = self.evaluate()._buffer
+        return self._result
+
+    def __len__(self):
+        return self._length
+
+    def __setitem__(self, position, value):
+        raise QuantcoException(f"Unsupported operation. An expression can't be modified, evaluate it to get a series that can be modified.")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)}, operator={self._operator.__name__}, type={self._type})"
+
+    def evaluate(self) -> QuantcoSeries:
+        # The expression tree is evaluated chunk by chunk, so the intermediate results never exceed the chunk size.
+        # With a parallel execution backend, the chunks are evaluated as separate tasks.
+        ranges = [(start, min(start + chunk_size, self._length)) for start in range(0, self._length, chunk_size)]
+        if execution.get_backend() == "serial":
+            chunks = [self.__evaluate_chunk__(start, stop) for start, stop in ranges]
+        else:
+            chunks = execution.map_tasks(_evaluate_slice, [self.__slice__(start, stop) for start, stop in ranges])
+        if len(chunks) == 1:
+            return QuantcoSeries.__from_buffer__(chunks[0])
+        return QuantcoSeries.__from_buffer__(QuantcoBuffer.concat(chunks, self._type))
+
+    def __evaluate_chunk__(self, start:int, stop:int) -> QuantcoBuffer:
+        buffers = []
+        for operand in self._operands:
+            if buffers and self.__short_circuit__(buffers[0]):
+                return buffers[0]
+            if isinstance(operand, QuantcoExpression):
+                buffers.append(operand.__evaluate_chunk__(start, stop))
+            else:
+                buffers.append(operand._buffer.slice(start, stop))
+        return self._kernel(self._operator, *buffers)
+
+    def __slice__(self, start:int, stop:int):
+        # The expression over the rows from start to stop, holding only these rows of the series, so that a task sent
+        # to another process doesn't carry the whole series.
+        operands = tuple(operand.__slice__(start, stop) if isinstance(operand, QuantcoExpression) else QuantcoSeries.__from_buffer__(operand._buffer.slice(start, stop), normalize=False) for operand in self._operands)
+        return QuantcoExpression(self._operator, self._kernel, self._type, operands)
+
+    def __short_circuit__(self, left:QuantcoBuffer) -> bool:
+        # The left side alone decides the chunk of `&` when it holds only False and the chunk of `|` when it holds only True.
+        # The right side is not evaluated for such a chunk, so the exceptions it would raise there, e.g. for a None
+        # value or a division by zero, are not raised.
+        if not left.is_typed or left.validity is not None:
+            return False
+        if self._operator == and_:
+            return 1 not in left.values
+        if self._operator == or_:
+            return 0 not in left.values
+        return False
+
+
+def _evaluate_slice(expression:QuantcoExpression) -> QuantcoBuffer:
+    return expression.__evaluate_chunk__(0, len(expression))
+
+
+def _snapshot(operand:QuantcoSeries) -> QuantcoSeries:
+    # The buffer is shared without copying its values; either side copies them before it modifies them.
+    if isinstance(operand, QuantcoExpression) or type(operand._buffer) != QuantcoBuffer:
+        return operand
+    return QuantcoSeries.__from_buffer__(operand._buffer.share(), normalize=False)
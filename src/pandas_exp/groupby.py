@@ -0,0 +1,137 @@
+from array import array
+from itertools import compress, repeat
+from operator import is_not
+from typing import Dict, List, Union
+
+from pandas_exp import kernels
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+aggregations = ["sum", "count", "mean", "min", "max", "var"]
+numeric_aggregations = {"sum", "mean", "var"}
+numeric_types = {int, float}
+
+
+class QuantcoGroupBy(object):
+    # The rows of a frame grouped by the values of the key columns. Every row is assigned the code of its group once,
+    # in a single pass over the key columns, and the aggregations accumulate the values of each group by its code.
+    # The groups are in the order in which they first appear in the frame.
+
+    def __init__(self, frame:QuantcoDataFrame, keys:Union[str, List[str]]) -> None:
+        keys = keys if type(keys) == list else [keys]
+        if not keys:
+            raise QuantcoException(f"The frame can't be grouped without the names of the key series.")
+        for key in keys:
+            if key not in frame._frame:
+                raise QuantcoException(f"The series with name: {key} doesn't exist in the frame.")
+        self._frame = frame
+        self._keys = keys
+        groups = {}
+        if len(keys) == 1:
+            values = frame[keys[0]].series
+        else:
+            values = list(zip(*[frame[key].series for key in keys]))
+        self._codes = array('q', [groups.setdefault(value, len(groups)) for value in values])
+        self._groups = list(groups)
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={self._keys}, groups={len(self)})"
+
+    def agg(self, aggregation_dict:Dict[str, Union[str, List[str]]]) -> QuantcoDataFrame:
+        # {"sales": "sum"} gives the column "sales", {"price": ["mean", "max"]} the columns "price_mean" and "price_max".
+        frame = {}
+        for position, key in enumerate(self._keys):
+            values = self._groups if len(self._keys) == 1 else [group[position] for group in self._groups]
+            frame[key] = QuantcoSeries.__from_buffer__(QuantcoBuffer.from_list(values, self._frame[key].type))
+        for name, names_of_aggregations in aggregation_dict.items():
+            if name not in self._frame._frame:
+                raise QuantcoException(f"The series with name: {name} doesn't exist in the frame.")
+            if type(names_of_aggregations) == list:
+                for aggregation in names_of_aggregations:
+                    frame[f"{name}_{aggregation}"] = self.__aggregate__(name, aggregation)
+            else:
+                frame[name] = self.__aggregate__(name, names_of_aggregations)
+        return QuantcoDataFrame.__from_view__(frame, None, len(self))
+
+    def __aggregate__(self, name:str, aggregation:str) -> QuantcoSeries:
+        series = self._frame[name]
+        if aggregation not in aggregations:
+            raise QuantcoException(f"The aggregation {aggregation} is not supported. The supported aggregations are: {', '.join(aggregations)}.")
+        if aggregation in numeric_aggregations and series.type not in numeric_types and series.type != type(None):
+            raise QuantcoException(f"The aggregation {aggregation} doesn't work on {series.type} type series. The aggregation works on only int and float type series.")
+        value_type = series.type
+        if value_type == type(None) and aggregation == "sum":
+            # A series holding only None values, e.g. a numeric series filtered down to its nulls, sums to 0 like
+            # QuantcoSeries.sum; its mean and variance are None.
+            value_type = int
+        result, result_type = getattr(self, f"__{aggregation}__")(self.__rows__(series._buffer), value_type)
+        return QuantcoSeries.__from_buffer__(QuantcoBuffer.from_list(result, result_type))
+
+    def __rows__(self, buffer):
+        # The code of the group and the value of each row which isn't None, read in one pass from the typed values of
+        # the buffer and its validity rather than from the list of the values of the series.
+        if buffer.type == type(None):
+            return iter(())
+        if buffer.is_typed and buffer.type != bool:
+            rows = zip(self._codes, buffer.values)
+            return rows if buffer.validity is None else compress(rows, buffer.validity.unpack())
+        values = buffer.to_list() if buffer.type == bool else buffer.values
+        return compress(zip(self._codes, values), map(is_not, values, repeat(None)))
+
+    def __sum__(self, rows, value_type:type):
+        if value_type == float:
+            # The float values of each group are summed with fsum (kernels.float_sum), like QuantcoSeries.sum.
+            groups = [[] for _ in range(len(self))]
+            for code, value in rows:
+                groups[code].append(value)
+            return [kernels.float_sum(values) for values in groups], float
+        sums = [value_type()] * len(self)
+        for code, value in rows:
+            sums[code] += value
+        return sums, value_type
+
+    def __count__(self, rows, value_type:type):
+        counts = [0] * len(self)
+        for code, _ in rows:
+            counts[code] += 1
+        return counts, int
+
+    def __min__(self, rows, value_type:type):
+        minimums = [None] * len(self)
+        for code, value in rows:
+            minimum = minimums[code]
+            if minimum is None or value < minimum:
+                minimums[code] = value
+        return minimums, value_type
+
+    def __max__(self, rows, value_type:type):
+        maximums = [None] * len(self)
+        for code, value in rows:
+            maximum = maximums[code]
+            if maximum is None or value > maximum:
+                maximums[code] = value
+        return maximums, value_type
+
+    def __moments__(self, rows):
+        # Welford's algorithm: the count, mean and sum of squared differences from the mean, updated value by value.
+        counts, means, squares = [0] * len(self), [0.0] * len(self), [0.0] * len(self)
+        for code, value in rows:
+            counts[code] += 1
+            delta = value - means[code]
+            means[code] += delta / counts[code]
+            squares[code] += delta * (value - means[code])
+        return counts, means, squares
+
+    def __mean__(self, rows, value_type:type):
+        counts, means, _ = self.__moments__(rows)
+        return [mean if count > 0 else None for count, mean in zip(counts, means)], float
+
+    def __var__(self, rows, value_type:type):
+        # The sample variance, None for the groups with less than two values.
+        counts, _, squares = self.__moments__(rows)
+        return [square / (count - 1) if count > 1 else None for count, square in zip(counts, squares)], float
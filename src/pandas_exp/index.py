@@ -0,0 +1,122 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress, repeat
+from operator import eq, ge, gt, is_not, le, lt, ne
+from typing import Any, Callable, List, Optional
+
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.exception import QuantcoException
+
+
+class QuantcoSortedIndex(object):
+    # The positions of the rows of a buffer ordered by their values (argsort), along with the values in that order.
+    # A comparison with a value bisects the sorted values and selects the rows in O(log n + k) for k selected rows.
+    # The rows holding None are not in the index.
+
+    def __init__(self, buffer:QuantcoBuffer) -> None:
+        statistics = buffer.statistics()
+        if buffer.type == type(None):
+            raise QuantcoException(f"The sorted index can't be created on a series of type {buffer.type}.")
+        if buffer.type == float and statistics.minimum is None and statistics.null_count < len(buffer):
+            raise QuantcoException(f"The sorted index can't be created on a series holding NaN values.")
+        self._length = len(buffer)
+        if statistics.is_sorted:
+            # The rows are in order already, so a selected range of the index is a range of the rows.
+            self._positions = None
+            self._values = buffer.values
+            return
+        values = buffer.to_list()
+        positions = compress(range(self._length), map(is_not, values, repeat(None)))
+        self._positions = array('q', sorted(positions, key=values.__getitem__))
+        sorted_values = list(map(values.__getitem__, self._positions))
+        self._values = QuantcoBuffer.__pack__(buffer.type, sorted_values) if buffer.is_typed else sorted_values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)}, sorted={self._positions is None})"
+
+    def range(self, operator:Callable, value):
+        # The range of the index holding the rows for which `operator(row, value)` is True.
+        if operator == gt:
+            return bisect_right(self._values, value), len(self._values)
+        if operator == ge:
+            return bisect_left(self._values, value), len(self._values)
+        if operator == lt:
+            return 0, bisect_left(self._values, value)
+        if operator == le:
+            return 0, bisect_right(self._values, value)
+        return bisect_left(self._values, value), bisect_right(self._values, value)
+
+    def compare(self, operator:Callable, value) -> QuantcoBuffer:
+        start, stop = self.range(eq if operator == ne else operator, value)
+        if self._positions is None:
+            bitmap = QuantcoBitmap.from_int(((1 << (stop - start)) - 1) << start, self._length)
+            return index_mask(operator, array('q', range(start, stop)), self._length, bitmap)
+        return index_mask(operator, array('q', sorted(self._positions[start:stop])), self._length)
+
+
+class QuantcoHashIndex(object):
+    # The positions of the rows of a buffer by their values, so that the rows holding a value are found in O(1).
+
+    def __init__(self, buffer:QuantcoBuffer) -> None:
+        self._length = len(buffer)
+        self._positions = {}
+        for position, value in enumerate(buffer.to_list()):
+            self._positions.setdefault(value, []).append(position)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={self._length}, keys={len(self)})"
+
+    def positions(self, values:List[Any]) -> array:
+        # The positions of the rows holding any of the values, in the order of the rows.
+        found = [self._positions[value] for value in dict.fromkeys(values) if value in self._positions]
+        if len(found) == 1:
+            return array('q', found[0])
+        return array('q', sorted(chain.from_iterable(found)))
+
+    def compare(self, operator:Callable, value) -> QuantcoBuffer:
+        return index_mask(operator, self.positions([value]), self._length)
+
+
+def index_mask(operator:Callable, selection:array, length:int, bitmap:Optional[QuantcoBitmap]=None) -> QuantcoBuffer:
+    # Returns the bool buffer selecting the rows at the positions, inverted for `!=`. The positions are kept in the
+    # cache of the buffer, so that filtering a frame with it doesn't scan the mask again.
+    if bitmap is None:
+        flags = bytearray(length)
+        for position in selection:
+            flags[position] = 1
+        bitmap = QuantcoBitmap.from_bytes(flags)
+    if operator == ne:
+        return QuantcoBuffer(~bitmap, None, bool)
+    result = QuantcoBuffer(bitmap, None, bool)
+    result._cache["selection"] = selection
+    return result
+
+
+def hash_index(buffer:QuantcoBuffer) -> Optional[QuantcoHashIndex]:
+    return buffer._cache.get("hash_index") if type(buffer) == QuantcoBuffer else None
+
+
+def create_hash_index(buffer:QuantcoBuffer) -> QuantcoHashIndex:
+    # Kept in the cache of the buffer like the sorted index.
+    if "hash_index" not in buffer._cache:
+        buffer._cache["hash_index"] = QuantcoHashIndex(buffer)
+    return buffer._cache["hash_index"]
+
+
+def sorted_index(buffer:QuantcoBuffer) -> Optional[QuantcoSortedIndex]:
+    return buffer._cache.get("sorted_index") if type(buffer) == QuantcoBuffer else None
+
+
+def create_sorted_index(buffer:QuantcoBuffer) -> QuantcoSortedIndex:
+    # The index is kept in the cache of the buffer, so it is shared with the views of the series and dropped when the
+    # series is modified.
+    if "sorted_index" not in buffer._cache:
+        buffer._cache["sorted_index"] = QuantcoSortedIndex(buffer)
+    return buffer._cache["sorted_index"]
@@ -0,0 +1,76 @@
+from array import array
+from typing import List, Tuple, Union
+
+from pandas_exp import kernels
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+join_types = ["inner", "left"]
+
+
+def merge(left:QuantcoDataFrame, right:QuantcoDataFrame, on:Union[str, List[str]], how:str="inner", suffixes:Tuple[str, str]=("_x", "_y")) -> QuantcoDataFrame:
+    # A hash join: the right frame is the build side and the left frame is probed row by row, so the smaller frame
+    # should be on the right. The result holds the rows of the left frame in their order, each repeated for every
+    # matching row of the right frame (in its order), and the columns of the left frame followed by the columns of the
+    # right frame other than the keys. A row whose key holds None doesn't match any row.
+    keys = on if type(on) == list else [on]
+    if how not in join_types:
+        raise QuantcoException(f"The join {how} is not supported. The supported joins are: {', '.join(join_types)}.")
+    if not keys:
+        raise QuantcoException(f"The frames can't be joined without the names of the key series.")
+    for key in keys:
+        if key not in left._frame or key not in right._frame:
+            raise QuantcoException(f"The series with name: {key} doesn't exist in both frames.")
+        if left[key].type != right[key].type:
+            raise QuantcoException(f"The series with name: {key} can't be joined. The types of the series are {left[key].type} and {right[key].type}.")
+
+    left_positions, right_positions = _probe(_key_values(left, keys), _build(_key_values(right, keys)), how == "left")
+    frame = {}
+    for name in left._frame:
+        frame[name if name not in right._frame or name in keys else name + suffixes[0]] = QuantcoSeries.__from_buffer__(kernels.take(left[name]._buffer, left_positions))
+    for name in right._frame:
+        if name not in keys:
+            column = name if name not in left._frame else name + suffixes[1]
+            frame[column] = QuantcoSeries.__from_buffer__(kernels.take_or_none(right[name]._buffer, right_positions))
+    return QuantcoDataFrame.__from_view__(frame, None, len(left_positions))
+
+
+def _key_values(frame:QuantcoDataFrame, keys:List[str]):
+    if len(keys) == 1:
+        return frame[keys[0]].series
+    return list(zip(*[frame[key].series for key in keys]))
+
+
+def _build(key_values) -> Tuple[dict, array]:
+    # The first position of every key, and for every position the next position holding the same key (-1 for none).
+    # The memory of the build side is a dict entry per distinct key and 8 bytes per row.
+    heads = {}
+    chain = array('q', bytes(8 * len(key_values)))
+    for position in range(len(key_values) - 1, -1, -1):
+        key = key_values[position]
+        if _is_null(key):
+            chain[position] = -1
+            continue
+        chain[position] = heads.get(key, -1)
+        heads[key] = position
+    return heads, chain
+
+
+def _probe(key_values, build:Tuple[dict, array], keep_unmatched:bool) -> Tuple[array, array]:
+    heads, chain = build
+    left_positions, right_positions = array('q'), array('q')
+    for position, key in enumerate(key_values):
+        match = -1 if _is_null(key) else heads.get(key, -1)
+        if match < 0 and keep_unmatched:
+            left_positions.append(position)
+            right_positions.append(-1)
+        while match >= 0:
+            left_positions.append(position)
+            right_positions.append(match)
+            match = chain[match]
+    return left_positions, right_positions
+
+
+def _is_null(key) -> bool:
+    return key is None or (type(key) == tuple and None in key)
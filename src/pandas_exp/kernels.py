@@ -0,0 +1,296 @@
+from array import array
+from collections import deque
+from itertools import compress, islice, repeat
+from math import fsum
+from operator import eq, ge, gt, is_not, le, lt, ne, truediv
+from typing import Any, Callable, List, Optional
+
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.buffer import QuantcoBuffer, QuantcoDictionaryValues, QuantcoScalar
+from pandas_exp.exception import QuantcoException
+from pandas_exp.index import hash_index, index_mask, sorted_index
+
+numeric_types = {int, float}
+
+
+def arithmetic(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> QuantcoBuffer:
+    if not _is_numeric(left) or not _is_numeric(right) or len(left) != len(right):
+        return _generic(operator, left, right)
+    _raise_on_first_null(operator, left, right)
+    return _collect(arithmetic_type(operator, left.type, right.type), operator, left.values, right.values)
+
+
+def arithmetic_type(operator:Callable, left_type:type, right_type:type) -> type:
+    if left_type in numeric_types and right_type in numeric_types:
+        return float if operator == truediv or float in (left_type, right_type) else int
+    return left_type
+
+
+def compare(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> QuantcoBuffer:
+    result = _prune(operator, left, right)
+    if result is not None:
+        bitmap = QuantcoBitmap.ones(len(left)) if result else QuantcoBitmap.zeros(len(left))
+        return QuantcoBuffer(bitmap, None, bool)
+    index = sorted_index(left)
+    if index is not None and _is_comparable(left, right) and (operator == eq or operator == ne or left.null_count() == 0):
+        # The rows holding None are not in the index; they raise a TypeError for <, <=, > and >=.
+        return index.compare(operator, right.value)
+    index = hash_index(left)
+    if index is not None and _is_comparable(left, right) and (operator == eq or operator == ne):
+        return index.compare(operator, right.value)
+    if (operator == eq or operator == ne) and type(left.values) == QuantcoDictionaryValues:
+        codes = _dictionary_codes(left.values, right)
+        if codes is not None:
+            return _collect(bool, operator, left.values.codes, codes)
+    if not left.is_typed or not right.is_typed or len(left) != len(right):
+        return _generic(operator, left, right)
+    if operator == eq or operator == ne:
+        # Equality is defined for None, so the rows holding None are compared one by one instead of failing.
+        result = _collect(bool, operator, left.values, right.values)
+        for position in left.null_positions() | right.null_positions():
+            result.values[position] = operator(left[position], right[position])
+        return result
+    _raise_on_first_null(operator, left, right)
+    return _collect(bool, operator, left.values, right.values)
+
+
+def logical(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> QuantcoBuffer:
+    # The bitmaps are combined with a single bitwise operation, e.g. `and_(left, right)` is `left & right`.
+    _raise_on_first_null(operator, left, right)
+    if type(left.values) == QuantcoBitmap and type(right.values) == QuantcoBitmap:
+        return QuantcoBuffer(operator(left.values, right.values), None, bool)
+    return _collect(bool, operator, left.values, right.values)
+
+
+def invert(operator:Callable, buffer:QuantcoBuffer) -> QuantcoBuffer:
+    # None is stored as False, so inverting the stored values gives the same result as `not None`.
+    if type(buffer.values) == QuantcoBitmap:
+        return QuantcoBuffer(~buffer.values, None, bool)
+    return _collect(bool, operator, buffer.values)
+
+
+def isin(buffer:QuantcoBuffer, values:List[Any]) -> QuantcoBuffer:
+    # A row holding None is in the values when None is one of them.
+    index = hash_index(buffer)
+    if index is not None:
+        return index_mask(eq, index.positions(values), len(buffer))
+    return _collect(bool, set(values).__contains__, buffer.to_list())
+
+
+def filter_by_mask(buffer:QuantcoBuffer, mask:QuantcoBuffer) -> QuantcoBuffer:
+    # None rows of the mask are stored as False and are dropped like the False rows.
+    flags = _flags(mask.values)
+    if type(buffer.values) == QuantcoDictionaryValues:
+        codes = array('q', compress(buffer.values.codes, flags))
+        return QuantcoBuffer(QuantcoDictionaryValues(codes, buffer.values.dictionary), None, buffer.type)
+    if not buffer.is_typed:
+        return QuantcoBuffer(list(compress(buffer.values, flags)), None, buffer.type)
+    validity = None
+    if buffer.validity is not None:
+        validity = QuantcoBitmap.from_bytes(compress(buffer.validity.unpack(), flags))
+    return QuantcoBuffer(QuantcoBuffer.__pack__(buffer.type, compress(_flags(buffer.values), flags)), validity, buffer.type)
+
+
+def selection(mask:QuantcoBuffer, base=None) -> array:
+    # Positions of the True rows of the mask. When a base selection is given, the positions are taken from it instead,
+    # so that a filter applied on top of another filter composes the positions of both.
+    positions = range(len(mask)) if base is None else base
+    if type(mask) == QuantcoBuffer and "selection" in mask._cache:
+        # The positions were found by an index.
+        selected = mask._cache["selection"]
+        return selected if base is None else array('q', map(base.__getitem__, selected))
+    if type(mask.values) == QuantcoBitmap and 1 not in mask.values:
+        return array('q')
+    return array('q', compress(positions, _flags(mask.values)))
+
+
+def take(buffer:QuantcoBuffer, positions:array) -> QuantcoBuffer:
+    if type(buffer.values) == QuantcoDictionaryValues:
+        codes = array('q', map(buffer.values.codes.__getitem__, positions))
+        return QuantcoBuffer(QuantcoDictionaryValues(codes, buffer.values.dictionary), None, buffer.type)
+    if not buffer.is_typed:
+        return QuantcoBuffer(list(map(buffer.values.__getitem__, positions)), None, buffer.type)
+    validity = None
+    if buffer.validity is not None:
+        validity = QuantcoBitmap.from_bytes(map(buffer.validity.unpack().__getitem__, positions))
+    return QuantcoBuffer(QuantcoBuffer.__pack__(buffer.type, map(_flags(buffer.values).__getitem__, positions)), validity, buffer.type)
+
+
+def take_or_none(buffer:QuantcoBuffer, positions:array) -> QuantcoBuffer:
+    # Like take, the rows at the position -1 hold None.
+    found = QuantcoBitmap.from_bytes(map(ge, positions, repeat(0)))
+    if 0 not in found:
+        return take(buffer, positions)
+    if 1 not in found:
+        return QuantcoBuffer([None] * len(positions), None, type(None))
+    result = take(buffer, array('q', map(max, positions, repeat(0))))
+    if not result.is_typed:
+        return QuantcoBuffer([value if valid else None for value, valid in zip(result.to_list(), found)], None, buffer.type)
+    validity = found if result.validity is None else found & result.validity
+    return QuantcoBuffer(result.values, validity, buffer.type)
+
+
+def reduce_sum(buffer:QuantcoBuffer, skip_none:bool=False):
+    # The float values are summed with fsum, which is exactly rounded, so the result doesn't depend on the order of the
+    # values and doesn't lose the small values next to large ones. The int values are summed exactly anyway.
+    values = _non_null_values("sum", buffer, skip_none)
+    if buffer.type == float:
+        return float_sum(values)
+    return sum(values, 0)
+
+
+def reduce_mean(buffer:QuantcoBuffer, skip_none:bool=False) -> Optional[float]:
+    # None when there are no values.
+    values = _non_null_values("mean", buffer, skip_none)
+    if len(values) == 0:
+        return None
+    return (float_sum(values) if buffer.type == float else sum(values)) / len(values)
+
+
+def float_sum(values) -> float:
+    # fsum raises for the sums which aren't finite: ValueError when the values hold both inf and -inf and
+    # OverflowError when the exact sum overflows. The plain sum gives the nan or inf of the IEEE arithmetic then.
+    try:
+        return fsum(values)
+    except (ValueError, OverflowError):
+        return sum(values, 0.0)
+
+
+def reduce_min(buffer:QuantcoBuffer, skip_none:bool=False):
+    return _bound("min", buffer, skip_none)
+
+
+def reduce_max(buffer:QuantcoBuffer, skip_none:bool=False):
+    return _bound("max", buffer, skip_none)
+
+
+def reduce_any(buffer:QuantcoBuffer, skip_none:bool=False) -> bool:
+    # The None rows are stored as False, so they never make any() True.
+    _non_null_count("any", buffer, skip_none)
+    return 1 in buffer.values
+
+
+def reduce_all(buffer:QuantcoBuffer, skip_none:bool=False) -> bool:
+    _non_null_count("all", buffer, skip_none)
+    if buffer.validity is None:
+        return 0 not in buffer.values
+    # The None rows are skipped by setting their bits.
+    return 0 not in (buffer.values | ~buffer.validity)
+
+
+def _bound(reduction:str, buffer:QuantcoBuffer, skip_none:bool):
+    # The minimum and maximum are the ones of the statistics of the buffer, which are kept after they are computed.
+    # A NaN value makes the result NaN. None when there are no values.
+    if _non_null_count(reduction, buffer, skip_none) == 0:
+        return None
+    statistics = buffer.statistics()
+    if statistics.minimum is None:
+        return float("nan")
+    return statistics.minimum if reduction == "min" else statistics.maximum
+
+
+def _non_null_count(reduction:str, buffer:QuantcoBuffer, skip_none:bool) -> int:
+    null_count = buffer.null_count()
+    if null_count > 0 and not skip_none:
+        raise QuantcoException(f"The {reduction} of the series can't be computed. The series holds {null_count} None values, use skip_none=True to skip them.")
+    return len(buffer) - null_count
+
+
+def _non_null_values(reduction:str, buffer:QuantcoBuffer, skip_none:bool):
+    _non_null_count(reduction, buffer, skip_none)
+    values = _flags(buffer.values)
+    if not buffer.is_typed:
+        return list(compress(values, map(is_not, values, repeat(None))))
+    if buffer.validity is not None:
+        return list(compress(values, buffer.validity.unpack()))
+    return values
+
+
+def _flags(values):
+    # A bitmap is unpacked into one byte per row before it is iterated or indexed row by row.
+    return values.unpack() if type(values) == QuantcoBitmap else values
+
+
+def _is_numeric(buffer:QuantcoBuffer) -> bool:
+    return buffer.is_typed and buffer.type in numeric_types
+
+
+def _prune(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> Optional[bool]:
+    # Decides the comparison of every row with a scalar from the minimum and maximum of the left side, without comparing
+    # the rows, e.g. `sales > 1000` is False for every row when the maximum is 10. None when the rows have to be compared.
+    # Only the statistics which are already known are used (computed for the series or read from a file), as
+    # computing them scans the rows as well: a derived series, e.g. `df["price"] + 5.0 > 10.0`, is compared directly.
+    if len(left) == 0 or not _is_comparable(left, right) or "statistics" not in left._cache:
+        return None
+    statistics = left._cache["statistics"]
+    if operator != eq and operator != ne and statistics.null_count > 0:
+        # The rows holding None raise a TypeError.
+        return None
+    minimum, maximum, value = statistics.minimum, statistics.maximum, right.value
+    if minimum is None:
+        return None
+    if operator == gt:
+        return True if minimum > value else False if maximum <= value else None
+    if operator == ge:
+        return True if minimum >= value else False if maximum < value else None
+    if operator == lt:
+        return True if maximum < value else False if minimum >= value else None
+    if operator == le:
+        return True if maximum <= value else False if minimum > value else None
+    if value < minimum or value > maximum:
+        return operator == ne
+    if minimum == maximum == value and statistics.null_count == 0:
+        return operator == eq
+    return None
+
+
+def _is_comparable(left:QuantcoBuffer, right:QuantcoBuffer) -> bool:
+    # True when the right side is a value, other than None and NaN, which can be ordered with the values of the left side.
+    if type(left) != QuantcoBuffer or type(right) != QuantcoScalar or right.value is None or right.value != right.value:
+        return False
+    return left.type == right.type or (left.type in numeric_types and right.type in numeric_types)
+
+
+def _dictionary_codes(values:QuantcoDictionaryValues, right:QuantcoBuffer):
+    # The value of a scalar is looked up in the dictionary once, and the rows are compared by their codes.
+    # The codes of another column can be compared only when both columns share the same dictionary.
+    if type(right) == QuantcoScalar:
+        return repeat(values.code(right.value), len(values))
+    if type(right.values) == QuantcoDictionaryValues and right.values.dictionary is values.dictionary:
+        return right.values.codes
+    return None
+
+
+def _raise_on_first_null(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> None:
+    positions = [position for position in (left.first_null(), right.first_null()) if position >= 0]
+    if not positions:
+        return
+    position = min(positions)
+    # Evaluate the rows in front of the first None, so that an error raised there (e.g. a division by zero)
+    # surfaces first, exactly as it would in a row by row loop. The None row itself raises the TypeError.
+    deque(map(operator, islice(left.values, position), islice(right.values, position)), maxlen=0)
+    operator(left[position], right[position])
+
+
+def _collect(result_type:type, operator:Callable, *operands) -> QuantcoBuffer:
+    try:
+        return QuantcoBuffer(QuantcoBuffer.__pack__(result_type, map(operator, *operands)), None, result_type)
+    except OverflowError:
+        return QuantcoBuffer(list(map(operator, *operands)), None, result_type)
+
+
+def _generic(operator:Callable, left:QuantcoBuffer, right:QuantcoBuffer) -> QuantcoBuffer:
+    left_values = left.to_list()
+    if type(right) == QuantcoScalar:
+        values = list(map(operator, left_values, right.values))
+    else:
+        right_values = right.to_list()
+        values = [operator(left_values[i], right_values[i]) for i in range(len(left_values))]
+    return QuantcoBuffer.from_list(values, _infer_type(values))
+
+
+def _infer_type(values:List[Any]) -> type:
+    for value in values:
+        if value is not None:
+            return type(value)
+    return type(None)
@@ -0,0 +1,153 @@
+import linecache
+import os
+import sys
+import time
+from contextlib import contextmanager
+from threading import local
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# The active profiler, None when profiling is disabled. The instrumented operations (the operators of QuantcoSeries,
+# its construction and QuantcoDataFrame.__getitem__) check it before anything else, so the disabled path costs a
+# single comparison.
+profiler = None
+
+_package = os.path.dirname(os.path.abspath(__file__))
+
+
+class QuantcoTraceRecord(NamedTuple):
+    operation: str
+    # Seconds since the profiler started, and the elapsed seconds of the operation.
+    start: float
+    seconds: float
+    input_rows: int
+    output_rows: Optional[int]
+    # The peak of the memory allocated during the operation, None when the memory isn't profiled.
+    allocated_bytes: Optional[int]
+    # The file, line and source of the code outside of pandas_exp calling the operation.
+    caller: str
+    # Number of recorded operations the operation was called from, e.g. the comparison within a filter is 1 deep.
+    depth: int
+
+
+class QuantcoProfiler(object):
+    # Records the instrumented operations called while it is active, see profile(). The records are kept in the
+    # order in which the operations finished (the trace) unless trace=False, and are summed per operation (the
+    # counters) either way. The hook, if any, is called with every record, e.g. to forward it to a metrics system.
+
+    def __init__(self, memory:bool=False, trace:bool=True, hook:Optional[Callable[[QuantcoTraceRecord], Any]]=None) -> None:
+        self._memory = memory
+        self._trace = trace
+        self._hook = hook
+        self._records = []
+        self._counters = {}
+        self._state = local()
+        self._start = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(operations={sum(counter['calls'] for counter in self._counters.values())}, memory={self._memory})"
+
+    @property
+    def records(self) -> List[QuantcoTraceRecord]:
+        return list(self._records)
+
+    def counters(self) -> Dict[str, Dict[str, Any]]:
+        # The number of calls, the elapsed seconds and the rows (and bytes) of each operation, summed over its calls.
+        return {operation: dict(counter) for operation, counter in self._counters.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"counters": self.counters(), "trace": [record._asdict() for record in self._records]}
+
+    def save(self, path:str) -> None:
+        import json
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def __call__(self, operation:str, input_rows:int, function:Callable, *arguments):
+        stack = self.__stack__()
+        if self._memory:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            stack.append([current, 0])
+        else:
+            stack.append(None)
+        start = time.perf_counter()
+        try:
+            result = function(*arguments)
+        finally:
+            seconds = time.perf_counter() - start
+            allocated_bytes = None
+            if self._memory:
+                _, peak = tracemalloc.get_traced_memory()
+                before, inner_peak = stack.pop()
+                peak = max(peak, inner_peak)
+                allocated_bytes = max(peak - before, 0)
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+            else:
+                stack.pop()
+        self.__record__(QuantcoTraceRecord(operation, start - self._start, seconds, input_rows, _rows(result), allocated_bytes, _caller(), len(stack)))
+        return result
+
+    def __stack__(self) -> list:
+        # The operations in progress in the current thread.
+        if not hasattr(self._state, "stack"):
+            self._state.stack = []
+        return self._state.stack
+
+    def __record__(self, record:QuantcoTraceRecord) -> None:
+        if self._trace:
+            self._records.append(record)
+        counter = self._counters.setdefault(record.operation, {"calls": 0, "seconds": 0.0, "input_rows": 0, "output_rows": 0, "allocated_bytes": 0})
+        counter["calls"] += 1
+        counter["seconds"] += record.seconds
+        counter["input_rows"] += record.input_rows
+        counter["output_rows"] += record.output_rows or 0
+        counter["allocated_bytes"] += record.allocated_bytes or 0
+        if self._hook is not None:
+            self._hook(record)
+
+
+@contextmanager
+def profile(memory:bool=False, trace:bool=True, hook:Optional[Callable[[QuantcoTraceRecord], Any]]=None):
+    # Within the context, the instrumented operations are recorded by the profiler it returns:
+    #   with profiling.profile() as profiler:
+    #       df[df["price"] > 10.0]
+    #   profiler.counters()
+    # memory=True measures the memory allocated by each operation with tracemalloc, which makes them a few times slower.
+    # tracemalloc is imported when profiling starts rather than with the package.
+    import tracemalloc
+    global profiler
+    previous = profiler
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    profiler = QuantcoProfiler(memory, trace, hook)
+    try:
+        yield profiler
+    finally:
+        profiler = previous
+        if started:
+            tracemalloc.stop()
+
+
+def _rows(result) -> Optional[int]:
+    rows = getattr(result, "rows", None)
+    if type(rows) == int:
+        return rows
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _caller() -> str:
+    frame = sys._getframe(1)
+    while frame is not None and os.path.dirname(os.path.abspath(frame.f_code.co_filename)) == _package:
+        frame = frame.f_back
+    if frame is None:
+        return ""
+    filename, line = frame.f_code.co_filename, frame.f_lineno
+    return f"{filename}:{line} {linecache.getline(filename, line).strip()}"
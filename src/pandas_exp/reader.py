@@ -0,0 +1,102 @@
+import csv
+import re
+from typing import Dict, Iterator, Optional
+
+from pandas_exp.buffer import QuantcoBufferBuilder
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+_int_pattern = re.compile(r"[+-]?\d+")
+_float_pattern = re.compile(r"[+-]?((\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?|(?i:nan|inf|infinity))")
+_bool_values = {"True": True, "False": False}
+
+
+def read_csv(path:str, chunksize:Optional[int]=None, delimiter:str=",", encoding:str="utf-8", schema:Dict[str, type]={}):
+    # Reads the file into a QuantcoDataFrame. When a chunk size is given, a generator of frames with at most chunksize
+    # rows is returned instead, so that the file is never held in memory at once.
+    if chunksize is not None:
+        if type(chunksize) != int or chunksize <= 0:
+            raise QuantcoException(f"The chunk size should be a positive integer. The provided chunk size is {chunksize}.")
+        return read_csv_chunks(path, chunksize, delimiter, encoding, schema)
+    frames = list(read_csv_chunks(path, None, delimiter, encoding, schema))
+    return frames[0] if frames else QuantcoDataFrame()
+
+
+def read_csv_chunks(path:str, chunksize:Optional[int], delimiter:str=",", encoding:str="utf-8", schema:Dict[str, type]={}) -> Iterator[QuantcoDataFrame]:
+    with open(path, newline="", encoding=encoding) as file:
+        rows = csv.reader(file, delimiter=delimiter)
+        header = next(rows, None)
+        if header is None:
+            return
+        builders = _builders(header, schema)
+        # The type of a column is inferred from its first value which is not None, and every later value, also in
+        # the later chunks, is parsed as that type. An int column which isn't typed by the schema is widened to float
+        # when a float value follows; the chunks already read keep the int type.
+        widen = {name for name in header if name not in schema}
+        length = 0
+        for row_number, row in enumerate(rows, start=1):
+            if not row:
+                # A blank line, e.g. the empty line at the end of the file.
+                continue
+            if len(row) != len(header):
+                raise QuantcoException(f"The row {row_number} of the file {path} has {len(row)} values, the header has {len(header)} columns.", row=row_number)
+            for name, text in zip(header, row):
+                _append(builders[name], name, text, row_number, name in widen)
+            length += 1
+            if length == chunksize:
+                yield _frame(builders, length)
+                length = 0
+        if length > 0 or chunksize is None:
+            yield _frame(builders, length)
+
+
+def _builders(header, schema:Dict[str, type]) -> Dict[str, QuantcoBufferBuilder]:
+    builders = {}
+    for name in header:
+        if name in builders:
+            raise QuantcoException(f"The series with name: {name} is defined more than once.")
+        value_type = schema.get(name, type(None))
+        if value_type not in QuantcoBufferBuilder.allowed_data_types:
+            raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.")
+        builders[name] = QuantcoBufferBuilder(value_type)
+    return builders
+
+
+def _append(builder:QuantcoBufferBuilder, name:str, text:str, row_number:int, widen:bool=False) -> None:
+    if widen and builder.type == int and not _int_pattern.fullmatch(text) and _float_pattern.fullmatch(text):
+        builder.__widen__()
+    try:
+        builder.append(parse_value(text, builder.type))
+    except QuantcoException as e:
+        raise QuantcoException(f"The value {text!r} in the row {row_number} of the series with name: {name} couldn't be read. The exception is: {e}", column=name, row=row_number)
+
+
+def _frame(builders:Dict[str, QuantcoBufferBuilder], rows:int) -> QuantcoDataFrame:
+    # A chunk keeps the type of the column fixed by its builder, also when the chunk holds only None values.
+    frame = {name: QuantcoSeries.__from_buffer__(builder.finish(), normalize=False) for name, builder in builders.items()}
+    return QuantcoDataFrame.__from_view__(frame, None, rows)
+
+
+def parse_value(text:str, value_type:type=type(None)):
+    # An empty field is None. A NoneType column has no values yet, so the type of the value is inferred from the text.
+    if text == "":
+        return None
+    if value_type == type(None):
+        if text in _bool_values:
+            return _bool_values[text]
+        if _int_pattern.fullmatch(text):
+            return int(text)
+        if _float_pattern.fullmatch(text):
+            return float(text)
+        return text
+    if value_type == str:
+        return text
+    if value_type == bool:
+        if text not in _bool_values:
+            raise QuantcoException(f"The elements in the series are not of same type.")
+        return _bool_values[text]
+    try:
+        return value_type(text)
+    except ValueError:
+        raise QuantcoException(f"The elements in the series are not of same type.")
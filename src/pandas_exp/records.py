@@ -0,0 +1,103 @@
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from pandas_exp.buffer import QuantcoBuffer, QuantcoBufferBuilder
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+
+def from_records(records:Iterable[Dict[str, Any]], columns:Optional[List[str]]=None, schema:Dict[str, type]={}) -> QuantcoDataFrame:
+    # A frame from dicts mapping the names of the series to the values of a row, e.g. [{"SKU": "X4E", "sales": 5}].
+    # The columns are the keys of the first record unless they are given; the other keys of the records are ignored.
+    if columns is None:
+        if type(records) not in (list, tuple):
+            records = iter(records)
+            first = next(records, None)
+            if first is None:
+                return QuantcoDataFrame()
+            return _transpose(chain([first], records), list(first), list(first), schema)
+        if not records:
+            return QuantcoDataFrame()
+        columns = list(records[0])
+    return _transpose(records, columns, columns, schema)
+
+
+def from_rows(rows:Iterable[Sequence[Any]], columns:List[str], schema:Dict[str, type]={}) -> QuantcoDataFrame:
+    # A frame from tuples (or lists) holding the values of a row in the order of the columns.
+    return _transpose(rows, columns, range(len(columns)), schema, check_length=True)
+
+
+def _transpose(rows, columns:List[str], keys, schema:Dict[str, type], check_length:bool=False) -> QuantcoDataFrame:
+    # The values are written into the typed buffers of the columns without building the dict of lists. A list of rows
+    # is read column by column: the values of a column are gathered, their types collected and packed, each in a
+    # pass in C. Any other iterable is read once, row by row, into a builder per column. The rows are scanned one by
+    # one only to locate an error.
+    types = {}
+    for name in columns:
+        if name is None:
+            raise QuantcoException(f"The name of the series can't be None.")
+        if name in types:
+            raise QuantcoException(f"The series with name: {name} is defined more than once.")
+        types[name] = schema.get(name, type(None))
+        if types[name] not in QuantcoBufferBuilder.allowed_data_types:
+            raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.", column=name)
+    if type(rows) in (list, tuple):
+        if check_length and set(map(len, rows)) - {len(columns)}:
+            _check_lengths(rows, len(columns))
+        frame = {name: _column(rows, name, key, types[name]) for name, key in zip(columns, keys)}
+        length = len(rows)
+    else:
+        builders = {name: QuantcoBufferBuilder(types[name]) for name in columns}
+        length = 0
+        for row_number, row in enumerate(rows):
+            if check_length and len(row) != len(columns):
+                _check_lengths([row], len(columns), row_number)
+            for name, key in zip(columns, keys):
+                _append(builders[name], name, _value(row, key, name, row_number), row_number)
+            length += 1
+        frame = {name: builder.finish() for name, builder in builders.items()}
+    # A column typed by the schema keeps its type, also when it holds only None values, like the columns of read_csv.
+    frame = {name: QuantcoSeries.__from_buffer__(buffer, normalize=name not in schema) for name, buffer in frame.items()}
+    return QuantcoDataFrame.__from_view__(frame, None, length)
+
+
+def _column(rows, name:str, key, value_type:type) -> QuantcoBuffer:
+    # Only the list of the values of one column is held at a time, besides the buffers of the columns already read.
+    try:
+        values = [row[key] for row in rows]
+    except (KeyError, IndexError):
+        for row_number, row in enumerate(rows):
+            _value(row, key, name, row_number)
+    types = set(map(type, values))
+    types.discard(type(None))
+    if value_type == type(None) and len(types) == 1 and types <= QuantcoBufferBuilder.allowed_data_types:
+        value_type = types.pop()
+    elif types - {value_type}:
+        builder = QuantcoBufferBuilder(value_type)
+        for row_number, value in enumerate(values):
+            _append(builder, name, value, row_number)
+    buffer = QuantcoBuffer.from_list(values, value_type)
+    buffer.statistics().__compute__()
+    return buffer
+
+
+def _value(row, key, name:str, row_number:int):
+    try:
+        return row[key]
+    except (KeyError, IndexError):
+        raise QuantcoException(f"The row {row_number} has no value for the series with name: {name}.", column=name, row=row_number)
+
+
+def _append(builder:QuantcoBufferBuilder, name:str, value, row_number:int) -> None:
+    try:
+        builder.append(value)
+    except QuantcoException as e:
+        raise QuantcoException(f"The value {value!r} in the row {row_number} of the series with name: {name} couldn't be read. The exception is: {e}", column=name, row=row_number)
+
+
+def _check_lengths(rows, length:int, start:int=0) -> None:
+    for row_number, row in enumerate(rows, start=start):
+        if len(row) != length:
+            raise QuantcoException(f"The row {row_number} has {len(row)} values, the frame has {length} columns.", row=row_number)
+
@@ -1,56 +1,185 @@
+import sys
+from operator import add, and_, eq, ge, gt, le, lt, mul, ne, not_, or_, sub, truediv, xor
+from pandas_exp import execution, index, kernels, profiling
+from pandas_exp.buffer import QuantcoBuffer, QuantcoDictionaryValues, QuantcoScalar
 from pandas_exp.exception import QuantcoException
 
 class QuantcoSeries(object):
     allowed_data_types = {str, bool, int, float, type(None)}
 
     def __init__(self, series_list, **kwargs) -> None:
-        self._series = series_list
+        if profiling.profiler is not None:
+            # The input is validated by __initialize__, so its length is taken only when it is a list.
+            profiling.profiler("QuantcoSeries.__init__", len(series_list) if type(series_list) == list else 0, self.__initialize__, series_list)
+            return
+        self.__initialize__(series_list)
+
+    def __initialize__(self, series_list):
         self._type = self.__check_type_of_each_element_same__(series_list)
+        self._buffer = QuantcoBuffer.from_list(series_list, self._type)
+        # The statistics of the ingested values are computed with them, so that the comparisons can be pruned; the
+        # series derived from other series (__from_buffer__) compute them when they are first accessed.
+        self._buffer.statistics().__compute__()
+        return self
+
+    @classmethod
+    def __from_buffer__(cls, buffer:QuantcoBuffer, normalize:bool=True):
+        # Derived series are built from buffers whose type is already known, so the element-wise type check is skipped.
+        if normalize and buffer.type != type(None) and buffer.null_count() == len(buffer):
+            # A series holding only None values is a NoneType series.
+            buffer = QuantcoBuffer([None] * len(buffer), None, type(None))
+        series = cls.__new__(cls)
+        series._buffer = buffer
+        series._type = buffer.type
+        return series
     
     @property
     def series(self):
-        return self._series
+        return self._buffer.to_list()
     
     @property
     def type(self):
         return self._type
+
+    @property
+    def statistics(self):
+        # The statistics are computed when they are first accessed and kept until the series is modified.
+        return self._buffer.statistics()
     
     def __len__(self):
-        return len(self._series)
+        return len(self._buffer)
     
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(len={len(self)}, series={self._series}, type={self._type})"
+        return f"{self.__class__.__name__}(len={len(self)}, series={self.series}, type={self._type})"
     
     def __getitem__(self, access):
         if type(access) == int:
-            return self._series[access]
-        elif type(access) == list or type(access) == QuantcoSeries:
+            return self._buffer[access]
+        elif type(access) == list or isinstance(access, QuantcoSeries):
             return self.__filter_series__(QuantcoSeries.convert_list_to_quantco_series(access))
         else:
             raise QuantcoException(f"Unsupported operation. Accessibility of the series could be performed only using an integer or list of boolean values.")
     
+    def __setitem__(self, position, value):
+        if type(position) != int:
+            raise QuantcoException(f"Unsupported operation. Assignment to the series could be performed only using an integer.")
+        if type(value) not in self.allowed_data_types:
+            raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.")
+        if value is not None and self._type != type(None) and type(value) != self._type:
+            raise QuantcoException(f"The elements in the series are not of same type.")
+        if self._buffer.read_only:
+            raise QuantcoException(f"The series is read-only. Its values are in shared memory.")
+        if value is not None and self._type == type(None):
+            values = self._buffer.to_list()
+            values[position] = value
+            self._type = type(value)
+            self._buffer = QuantcoBuffer.from_list(values, self._type)
+            return
+        self._buffer.set(position, value)
+        if value is None and self._type != type(None) and self._buffer.null_count() == len(self):
+            self._type = type(None)
+            self._buffer = QuantcoBuffer([None] * len(self), None, type(None))
+
     def __filter_series__(self, filter_list):
+        QuantcoSeries.__check_filter_list__(filter_list, len(self))
+        return QuantcoSeries.__from_buffer__(kernels.filter_by_mask(self._buffer, filter_list._buffer))
+
+    @staticmethod
+    def __check_filter_list__(filter_list, length:int):
         if filter_list.type != bool and filter_list.type != type(None):
             raise QuantcoException(f"Unsupported operation. The filtering on the series works on bool type series/list. The provided type is {filter_list.type}.")
-        if len(filter_list.series) != len(self._series):
+        if len(filter_list) != length:
             raise QuantcoException(f"The length of the series and the filter list/series is not equal.")
-        return QuantcoSeries([self._series[i] for i in range(len(filter_list.series)) if filter_list.series[i]])
+
+    def create_sorted_index(self):
+        # Sorts the positions of the rows by their values once, so that the comparisons with a value find the selected
+        # rows by bisection. The index is shared with the views of the series and dropped when the series is modified.
+        index.create_sorted_index(self._buffer)
+        return self
+
+    def create_index(self):
+        # Maps the values to the positions of the rows holding them, so that == / != with a value and isin find the
+        # rows in O(1) per value. Kept like the sorted index.
+        index.create_hash_index(self._buffer)
+        return self
+
+    def isin(self, values:list):
+        # A bool series which is True for the rows holding one of the values.
+        if type(values) != list:
+            raise QuantcoException(f"A valid list was not provided to check the values of the series.")
+        return QuantcoSeries.__from_buffer__(kernels.isin(self._buffer, values))
+
+    def dictionary_encode(self):
+        # Returns the series with its values stored as codes into a table of the unique values. Meant for str series with
+        # few unique values: the repeated strings are stored once and == / != with a str compare the codes of the rows.
+        if self._type != str:
+            raise QuantcoException(f"Unsupported operation. The dictionary encoding works on only str type series. The provided type is {self._type}.")
+        return QuantcoSeries.__from_buffer__(QuantcoBuffer(QuantcoDictionaryValues.encode(self._buffer.values), None, str))
+
+    # Reductions. A series holding None values raises an exception unless skip_none=True.
+    def __check_reduction_type__(self, reduction:str, allowed_types):
+        if self._type not in allowed_types and self._type != type(None):
+            raise QuantcoException(f"The {reduction} of the series with type {self._type} is not supported.")
+
+    def sum(self, skip_none:bool=False):
+        self.__check_reduction_type__("sum", {int, float})
+        return kernels.reduce_sum(self._buffer, skip_none)
+
+    def mean(self, skip_none:bool=False):
+        self.__check_reduction_type__("mean", {int, float})
+        return kernels.reduce_mean(self._buffer, skip_none)
+
+    def min(self, skip_none:bool=False):
+        return kernels.reduce_min(self._buffer, skip_none)
+
+    def max(self, skip_none:bool=False):
+        return kernels.reduce_max(self._buffer, skip_none)
+
+    def count(self) -> int:
+        # The number of values which are not None.
+        return len(self) - self._buffer.null_count()
+
+    def any(self, skip_none:bool=False) -> bool:
+        self.__check_reduction_type__("any", {bool})
+        return kernels.reduce_any(self._buffer, skip_none)
+
+    def all(self, skip_none:bool=False) -> bool:
+        self.__check_reduction_type__("all", {bool})
+        return kernels.reduce_all(self._buffer, skip_none)
+
+    def __evaluate__(self, operator, kernel, value_type, *operands):
+        if profiling.profiler is not None:
+            # Recorded under the name of the operator method calling __evaluate__, e.g. QuantcoSeries.__gt__.
+            operation = f"QuantcoSeries.{sys._getframe(1).f_code.co_name}"
+            return profiling.profiler(operation, len(self), self.__compute__, operator, kernel, value_type, *operands)
+        return self.__compute__(operator, kernel, value_type, *operands)
+
+    def __compute__(self, operator, kernel, value_type, *operands):
+        from pandas_exp.expression import QuantcoExpression, is_lazy
+        if is_lazy():
+            return QuantcoExpression(operator, kernel, value_type, (self,) + operands)
+        return QuantcoSeries.__from_buffer__(execution.run(kernel, operator, self._buffer, *[operand._buffer for operand in operands]))
 
     def __check_type_of_each_element_same__(self, list_to_check, **kwargs):
-        list_type = type(None)
         if list_to_check is None:
             raise QuantcoException(f"The series can't be None")
         if type(list_to_check) != list:
             raise QuantcoException(f"A valid list was not provided to construct the series.")
-        for i in range(0, len(list_to_check)):
-            if type(list_to_check[i]) not in self.allowed_data_types:
-                raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.")
-            if list_to_check[i] != None and i-1>=0 and list_to_check[i-1] != None and type(list_to_check[i-1]) != type(list_to_check[i]):
-                raise QuantcoException(f"The elements in the series are not of same type.")
-            if list_type == type(None) and list_to_check[i]!= None:
-                list_type = type(list_to_check[i])
-
-        return list_type
+        # The types of the elements are collected in a single pass in C. The rows are scanned one by one only to find
+        # the row of an error.
+        types = set(map(type, list_to_check))
+        types.discard(type(None))
+        if len(types) <= 1 and types <= self.allowed_data_types:
+            return types.pop() if types else type(None)
+        list_type = type(None)
+        for row, value in enumerate(list_to_check):
+            if type(value) not in self.allowed_data_types:
+                raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.", row=row)
+            if value is not None:
+                if list_type == type(None):
+                    list_type = type(value)
+                elif type(value) != list_type:
+                    raise QuantcoException(f"The elements in the series are not of same type.", row=row)
 
     # Arithmetic operations overloading:
     def __check_arithmetic_compatibility__(self, operand_type, **kwargs):
@@ -73,44 +202,44 @@ class QuantcoSeries(object):
 
     def __add__(self, operand, **kwargs):
         operand = self.__convert_arithmetric_operand__(operand)
-        return QuantcoSeries([self._series[i] + operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(add, kernels.arithmetic, kernels.arithmetic_type(add, self._type, operand.type), operand)
     
     def __sub__(self, operand, **kwargs):
         operand = self.__convert_arithmetric_operand__(operand)
-        return QuantcoSeries([self._series[i] - operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(sub, kernels.arithmetic, kernels.arithmetic_type(sub, self._type, operand.type), operand)
     
     def __mul__(self, operand, **kwargs):
         operand = self.__convert_arithmetric_operand__(operand)
-        return QuantcoSeries([self._series[i] * operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(mul, kernels.arithmetic, kernels.arithmetic_type(mul, self._type, operand.type), operand)
     
     def __truediv__(self, operand, **kwargs):
         return self.__div__(operand)
 
     def __div__(self, operand, **kwargs):
         operand = self.__convert_arithmetric_operand__(operand)
-        return QuantcoSeries([self._series[i] / operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(truediv, kernels.arithmetic, kernels.arithmetic_type(truediv, self._type, operand.type), operand)
     
     # Comparison operations overloading:
     
     def __ge__(self, operand, **kwargs):
         operand = self.__convert_object_to_quantco_series__(operand)
-        return QuantcoSeries([self._series[i] >= operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(ge, kernels.compare, bool, operand)
     
     def __gt__(self, operand, **kwargs):
         operand = self.__convert_object_to_quantco_series__(operand)
-        return QuantcoSeries([self._series[i] > operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(gt, kernels.compare, bool, operand)
     
     def __le__(self, operand, **kwargs):
         operand = self.__convert_object_to_quantco_series__(operand)
-        return QuantcoSeries([self._series[i] <= operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(le, kernels.compare, bool, operand)
     
     def __lt__(self, operand, **kwargs):
         operand = self.__convert_object_to_quantco_series__(operand)
-        return QuantcoSeries([self._series[i] < operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(lt, kernels.compare, bool, operand)
     
     def __ne__(self, operand, **kwargs):
         operand = self.__convert_object_to_quantco_series__(operand)
-        return QuantcoSeries([self._series[i] != operand[i] for i in range(len(self._series))])
+        return self.__evaluate__(ne, kernels.compare, bool, operand)
     
     # List comptabile function overloading:
     def __check_boolean_operator_compatibility__(self, operand_list, **kwargs):
@@ -124,29 +253,29 @@ class QuantcoSeries(object):
         #     raise QuantcoException(f"The boolean operations don't work on {self.type} type series and {operand_list_type} type operand list.")
         # if operand_list_type == type(None):
         #     raise QuantcoException(f"The boolean operations don't work on {operand_list_type} type operand list. Either the operand list is empty or has all None values.")
-        if len(operand_list.series) != len(self._series):
-            raise QuantcoException(f"The operand series or list provided is of length {len(operand_list.series)} and is not compatible for the operation with the list of length {len(self._series)}. Both the series length should be equal.")
+        if len(operand_list) != len(self):
+            raise QuantcoException(f"The operand series or list provided is of length {len(operand_list)} and is not compatible for the operation with the list of length {len(self)}. Both the series length should be equal.")
 
     def __and__(self, operand, **kwargs):
         operand = QuantcoSeries.convert_list_to_quantco_series(operand)
         self.__check_boolean_operator_compatibility__(operand)
-        return QuantcoSeries([self._series[i] & operand.series[i] for i in range(len(self._series))])
+        return self.__evaluate__(and_, kernels.logical, bool, operand)
     
     def __or__(self, operand, **kwargs):
         operand = QuantcoSeries.convert_list_to_quantco_series(operand)
         self.__check_boolean_operator_compatibility__(operand)
-        return QuantcoSeries([self._series[i] | operand.series[i] for i in range(len(self._series))])
+        return self.__evaluate__(or_, kernels.logical, bool, operand)
     
     def __xor__(self, operand, **kwargs):
         operand = QuantcoSeries.convert_list_to_quantco_series(operand)
         self.__check_boolean_operator_compatibility__(operand)
-        return QuantcoSeries([self._series[i] ^ operand.series[i] for i in range(len(self._series))])
+        return self.__evaluate__(xor, kernels.logical, bool, operand)
     
     def __invert__(self, **kwargs):
         if self._type == bool:
-            return QuantcoSeries([not self._series[i] for i in range(len(self._series))])
-        elif len(self._series) == 0:
-            return QuantcoSeries(self._series)
+            return self.__evaluate__(not_, kernels.invert, bool)
+        elif len(self) == 0:
+            return QuantcoSeries([])
         else:
             raise QuantcoException(f"The invert operation of the series with type {self._type} is not supported.")
     
@@ -155,23 +284,31 @@ class QuantcoSeries(object):
         # Comment lines 156-157 to perform element-wise equality between 2 series.
         if operand.type != self.type:
             raise QuantcoException(f"The series types are not same. The series are of types: {self._type} and {operand.type}.")
-        if len(operand.series) != len(self._series):
-            raise QuantcoException(f"The length of the series provided are not equal. The lengths are {len(self._series)} and {len(operand.series)}.")
-        return QuantcoSeries([self._series[i] == operand.series[i] for i in range(len(self._series))])
+        if len(operand) != len(self):
+            raise QuantcoException(f"The length of the series provided are not equal. The lengths are {len(self)} and {len(operand)}.")
+        return self.__evaluate__(eq, kernels.compare, bool, operand)
     
     def __convert_object_to_quantco_series__(self, __o):
         object_type = type(__o)
-        if object_type != list and object_type != QuantcoSeries:
-            __o = QuantcoSeries.convert_list_to_quantco_series([__o] * len(self._series))
+        if object_type != list and not isinstance(__o, QuantcoSeries):
+            __o = self.__broadcast_scalar__(__o)
         elif object_type == list:
             __o = QuantcoSeries.convert_list_to_quantco_series(__o)
-        if (len(__o) != len(self._series)) and (__o.type != type(None) and self._type != type(None)):
-            raise QuantcoException(f"The length of the series provided are not equal. The lengths are {len(self._series)} and {len(__o.series)}.")
+        if (len(__o) != len(self)) and (__o.type != type(None) and self._type != type(None)):
+            raise QuantcoException(f"The length of the series provided are not equal. The lengths are {len(self)} and {len(__o)}.")
         return __o
 
+    def __broadcast_scalar__(self, value):
+        # The scalar is type checked once and broadcast lazily instead of being expanded to the length of the series.
+        if len(self) == 0:
+            return QuantcoSeries([])
+        if type(value) not in self.allowed_data_types:
+            raise QuantcoException(f"The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float.")
+        return QuantcoSeries.__from_buffer__(QuantcoScalar(value, len(self), type(value)))
+
     def convert_list_to_quantco_series(__o:object, **kwargs):
         operand_list_type = type(__o)
-        if operand_list_type != list and operand_list_type != QuantcoSeries:
+        if operand_list_type != list and not isinstance(__o, QuantcoSeries):
             raise QuantcoException(f"The operand list provided in not of type list or QuantcoSeries.")
         if operand_list_type == list:
             __o = QuantcoSeries(__o)
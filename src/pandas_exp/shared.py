@@ -0,0 +1,91 @@
+import sys
+from multiprocessing import shared_memory
+
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.storage import decode_frame, encode_frame
+
+
+class QuantcoSharedFrame(object):
+    # A frame placed in a block of shared memory, in the file format of storage.py. The block is created once by the
+    # parent process and attached by name in the workers: the frame of a worker views the block, so its values are
+    # neither copied nor validated, and its series are read-only. The handle is pickled as the name of the block, so
+    # passing it to a worker costs a few bytes whatever the size of the frame.
+    # The creator unlinks the block when it is no longer needed (or uses the handle as a context manager); the
+    # memory is freed once every process has released its frames.
+
+    def __init__(self, name:str) -> None:
+        self._memory = _attach(name)
+        self._owner = False
+        self._frame = None
+
+    @classmethod
+    def create(cls, frame:QuantcoDataFrame):
+        parts = encode_frame(frame)
+        memory = _SharedMemory(create=True, size=sum(map(len, parts)))
+        start = 0
+        for part in parts:
+            memory.buf[start:start + len(part)] = part
+            start += len(part)
+        shared = cls.__new__(cls)
+        shared._memory = memory
+        shared._owner = True
+        shared._frame = None
+        return shared
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name}, size={self._memory.size})"
+
+    def __reduce__(self):
+        return QuantcoSharedFrame, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def frame(self) -> QuantcoDataFrame:
+        if self._frame is None:
+            view = self._memory.buf.toreadonly()
+            self._frame = decode_frame(view, f"shared memory block {self.name}", read_only=True)
+        return self._frame
+
+    def close(self) -> None:
+        # Releases the block in this process. The frames already taken from the handle keep viewing it.
+        self._frame = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    def close(self):
+        # The series of a frame view the memory, so it is unmapped with the last of them, like a memory-mapped file.
+        try:
+            super().close()
+        except BufferError:
+            pass
+
+
+def _attach(name:str) -> _SharedMemory:
+    # The block belongs to the creator, so it isn't destroyed when an attached process exits.
+    if sys.version_info >= (3, 13):
+        return _SharedMemory(name, track=False)
+    # Before Python 3.13 an attached block is registered with the resource tracker of the process, which unlinks it
+    # when the process exits, e.g. a worker started with subprocess rather than multiprocessing. The registration is
+    # undone unless the tracker was already running: the creator and the processes it started with multiprocessing
+    # share the tracker of the creator, which holds the block once and keeps it until the creator unlinks it.
+    from multiprocessing import resource_tracker
+    shared_tracker = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+    memory = _SharedMemory(name)
+    if not shared_tracker:
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
@@ -0,0 +1,98 @@
+from itertools import compress, islice, repeat
+from math import isnan
+from operator import is_not, le
+from typing import Any, List
+
+from pandas_exp.bitmap import QuantcoBitmap
+
+
+class QuantcoStatistics(object):
+    # Statistics of the values of a buffer. Each of them is computed when it is first accessed and kept afterwards.
+    # The statistics keep the values they were computed from, which are copied by a buffer before it modifies them.
+
+    def __init__(self, values, validity:QuantcoBitmap, value_type:type, **known) -> None:
+        self._values = values
+        self._validity = validity
+        self._type = value_type
+        # Statistics known upfront, e.g. read from a file.
+        self._known = dict(known)
+
+    def __known__(self, name:str, compute):
+        if name not in self._known:
+            self._known[name] = compute()
+        return self._known[name]
+
+    @property
+    def null_count(self) -> int:
+        return self.__known__("null_count", self.__null_count__)
+
+    @property
+    def minimum(self):
+        # None when the values hold a NaN or there are no values.
+        return self.__known__("minimum", lambda: self.__bounds__()[0])
+
+    @property
+    def maximum(self):
+        return self.__known__("maximum", lambda: self.__bounds__()[1])
+
+    @property
+    def distinct_count(self) -> int:
+        # The number of distinct values, None excluded.
+        return self.__known__("distinct_count", lambda: len(set(self.__non_null_values__())))
+
+    @property
+    def is_sorted(self) -> bool:
+        # True when there are no None values and every value is less than or equal to the next one.
+        return self.__known__("is_sorted", self.__is_sorted__)
+
+    def __compute__(self):
+        # Computes the null count and the bounds up front, e.g. while the values are ingested.
+        for name in ("null_count", "minimum", "maximum"):
+            getattr(self, name)
+        return self
+
+    def to_dict(self):
+        return {"null_count": self.null_count, "minimum": self.minimum, "maximum": self.maximum, "is_sorted": self.is_sorted}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(null_count={self.null_count}, minimum={self.minimum!r}, maximum={self.maximum!r})"
+
+    def __null_count__(self) -> int:
+        if self._validity is not None:
+            return self._validity.count(0)
+        if type(self._values) == list or self._type not in (int, float, bool):
+            return self._values.count(None)
+        return 0
+
+    def __bounds__(self):
+        if "bounds" not in self._known:
+            values = self.__non_null_values__()
+            if not values or (self._type == float and any(map(isnan, values))):
+                self._known["bounds"] = (None, None)
+            elif self._type == bool:
+                self._known["bounds"] = (bool(min(values)), bool(max(values)))
+            else:
+                self._known["bounds"] = (min(values), max(values))
+        return self._known["bounds"]
+
+    def __is_sorted__(self) -> bool:
+        if self.null_count > 0:
+            return False
+        values = self.__flags__()
+        return all(map(le, values, islice(values, 1, None)))
+
+    def __flags__(self):
+        return self._values.unpack() if type(self._values) == QuantcoBitmap else self._values
+
+    def __non_null_values__(self) -> List[Any]:
+        from pandas_exp.buffer import QuantcoDictionaryValues
+        if type(self._values) == QuantcoDictionaryValues:
+            # The codes in use pick the values from the dictionary.
+            dictionary = self._values.dictionary
+            return [dictionary[code] for code in set(self._values.codes) if code != -1]
+        values = self.__flags__()
+        if self._validity is not None:
+            return list(compress(values, self._validity.unpack()))
+        if type(self._values) == list or self._type not in (int, float, bool):
+            return list(compress(values, map(is_not, values, repeat(None))))
+        return values
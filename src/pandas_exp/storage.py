@@ -0,0 +1,158 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import List
+
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+from pandas_exp.stats import QuantcoStatistics
+
+# File layout:
+#   magic (4 bytes) | version (uint32) | header length (uint64) | header (json) | column sections
+# Every section starts at a multiple of 8 bytes, relative to the end of the header. For each column the header
+# holds its name, type and the (offset, length) of its sections: "values" and "validity" for int, float and bool
+# columns, and "offsets", "data" and "validity" for str columns. The bool values and the validity are bitmaps.
+# The header also holds the statistics of each column, so that an opened frame has them without reading its values.
+magic = b"QCDF"
+version = 2
+alignment = 8
+type_names = {int: "int", float: "float", bool: "bool", str: "str", type(None): "NoneType"}
+types_by_name = {name: value_type for value_type, name in type_names.items()}
+_prefix = struct.Struct("<4sIQ")
+
+
+def save_frame(frame:QuantcoDataFrame, path:str) -> None:
+    with open(path, "wb") as file:
+        for part in encode_frame(frame):
+            file.write(part)
+
+
+def encode_frame(frame:QuantcoDataFrame) -> List[bytes]:
+    # The parts of the file of the frame, in order: the prefix with the header, followed by the column sections.
+    sections = []
+    columns = []
+    size = 0
+
+    def add_section(data:bytes):
+        nonlocal size
+        section = (size, len(data))
+        sections.append(data + b"\x00" * (-len(data) % alignment))
+        size += len(sections[-1])
+        return section
+
+    for name, series in frame.frame.items():
+        buffer = series._buffer
+        column = {"name": name, "type": type_names[buffer.type], "statistics": buffer.statistics().to_dict()}
+        if buffer.type in QuantcoBuffer.typecodes:
+            if not buffer.is_typed:
+                raise QuantcoException(f"The series with name: {name} can't be saved. The values don't fit into 64 bits.")
+            if buffer.type == bool:
+                column["values"] = add_section(buffer.values.tobytes())
+            else:
+                column["values"] = add_section(array(QuantcoBuffer.typecodes[buffer.type], buffer.values).tobytes())
+            if buffer.validity is not None:
+                column["validity"] = add_section(buffer.validity.tobytes())
+        elif buffer.type == str:
+            values = buffer.to_list()
+            encoded = [b"" if value is None else value.encode("utf-8") for value in values]
+            offsets = array('q', [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            column["offsets"] = add_section(offsets.tobytes())
+            column["data"] = add_section(b"".join(encoded))
+            if None in values:
+                column["validity"] = add_section(QuantcoBitmap.from_bytes(value is not None for value in values).tobytes())
+        columns.append(column)
+
+    header = json.dumps({"rows": frame.rows, "byteorder": sys.byteorder, "columns": columns}).encode("utf-8")
+    prefix = _prefix.pack(magic, version, len(header)) + header
+    return [prefix + b"\x00" * (-len(prefix) % alignment)] + sections
+
+
+def open_frame(path:str) -> QuantcoDataFrame:
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped.
+            raise QuantcoException(f"The file {path} is not a QuantcoDataFrame file.")
+    return decode_frame(memoryview(data), f"file {path}")
+
+
+def decode_frame(view:memoryview, source:str, read_only:bool=False) -> QuantcoDataFrame:
+    # Constructs the frame viewing the read-only memory holding a file, e.g. a memory-mapped file. The buffers of the
+    # frame copy their values before they are modified, or can't be modified at all when read_only is True.
+    if len(view) < _prefix.size or bytes(view[:len(magic)]) != magic:
+        raise QuantcoException(f"The {source} is not a QuantcoDataFrame file.")
+    _, file_version, header_length = _prefix.unpack(view[:_prefix.size])
+    if file_version != version:
+        raise QuantcoException(f"The {source} has the version {file_version}, only the version {version} is supported.")
+    try:
+        header = json.loads(bytes(view[_prefix.size:_prefix.size + header_length]).decode("utf-8"))
+        byteorder, rows, columns = header["byteorder"], header["rows"], header["columns"]
+    except (ValueError, KeyError, TypeError):
+        # The header is truncated or isn't the json of a frame.
+        raise QuantcoException(f"The {source} is not a QuantcoDataFrame file.")
+    if byteorder != sys.byteorder:
+        raise QuantcoException(f"The {source} was saved with a {byteorder} endian byte order.")
+    start = _prefix.size + header_length
+    start += -start % alignment
+
+    def section(column, key, format:str="B"):
+        if key not in column:
+            return None
+        offset, length = column[key]
+        if start + offset + length > len(view):
+            # The file is truncated.
+            raise QuantcoException(f"The {source} is not a QuantcoDataFrame file.")
+        return view[start + offset:start + offset + length].cast(format)
+
+    def bitmap(column, key):
+        data = section(column, key)
+        return None if data is None else QuantcoBitmap(data, rows)
+
+    frame = {}
+    for column in columns:
+        value_type = types_by_name[column["type"]]
+        if value_type == bool:
+            buffer = QuantcoBuffer(bitmap(column, "values"), bitmap(column, "validity"), value_type)
+        elif value_type in QuantcoBuffer.typecodes:
+            buffer = QuantcoBuffer(section(column, "values", QuantcoBuffer.typecodes[value_type]), bitmap(column, "validity"), value_type)
+        elif value_type == str:
+            buffer = QuantcoBuffer(QuantcoStringValues(section(column, "offsets", 'q'), section(column, "data"), bitmap(column, "validity")), None, str)
+        else:
+            buffer = QuantcoBuffer([None] * rows, None, value_type)
+        # The memory is read-only, so the buffer copies its values before they are modified.
+        buffer._shared = True
+        buffer._read_only = read_only
+        buffer._cache["statistics"] = QuantcoStatistics(buffer.values, buffer.validity, value_type, **column.get("statistics", {}))
+        frame[column["name"]] = QuantcoSeries.__from_buffer__(buffer, normalize=False)
+    return QuantcoDataFrame.__from_view__(frame, None, rows)
+
+
+class QuantcoStringValues(Sequence):
+    # The values of a str column of a memory-mapped file, decoded when they are accessed.
+    def __init__(self, offsets:memoryview, data:memoryview, validity:QuantcoBitmap=None) -> None:
+        self._offsets = offsets
+        self._data = data
+        self._validity = validity
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position):
+        if type(position) == slice:
+            return [self[i] for i in range(len(self))[position]]
+        if position < 0:
+            position += len(self)
+        if position < 0 or position >= len(self):
+            raise IndexError("list index out of range")
+        if self._validity is not None and not self._validity[position]:
+            return None
+        return str(self._data[self._offsets[position]:self._offsets[position + 1]], "utf-8")
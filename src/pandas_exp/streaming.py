@@ -0,0 +1,78 @@
+from typing import Any, Callable, Iterable, Iterator, List
+
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+
+class QuantcoStream(object):
+    # A query over a stream of QuantcoDataFrame chunks, e.g. the chunks of read_csv(path, chunksize=n).
+    # The operations are applied to one chunk at a time while the stream is iterated, so only one chunk is held in memory.
+    # A stream built from a generator can be iterated only once.
+
+    def __init__(self, chunks:Iterable[QuantcoDataFrame], operations:List[Callable]=[]) -> None:
+        self._chunks = chunks
+        self._operations = list(operations)
+
+    def __iter__(self) -> Iterator[QuantcoDataFrame]:
+        for chunk in self._chunks:
+            if type(chunk) != QuantcoDataFrame:
+                raise QuantcoException(f"Unsupported operation. The stream works on QuantcoDataFrame chunks. The provided type is {type(chunk)}.")
+            for operation in self._operations:
+                chunk = operation(chunk)
+            # The chunks without any rows left are dropped.
+            if chunk.rows > 0:
+                yield chunk
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(operations={len(self._operations)})"
+
+    def filter(self, predicate:Callable[[QuantcoDataFrame], QuantcoSeries]):
+        # The predicate is called with each chunk and returns the bool series/list used to filter it, e.g. lambda df: df["price"] > 10.0
+        def filter_chunk(chunk:QuantcoDataFrame) -> QuantcoDataFrame:
+            filter_series = predicate(chunk)
+            if type(filter_series) != list and not isinstance(filter_series, QuantcoSeries):
+                raise QuantcoException(f"Unsupported operation. The predicate of the stream should return a bool type series/list. The provided type is {type(filter_series)}.")
+            return chunk[filter_series]
+        return QuantcoStream(self._chunks, self._operations + [filter_chunk])
+
+    def select(self, column_names:List[str]):
+        return QuantcoStream(self._chunks, self._operations + [lambda chunk: chunk.select(column_names)])
+
+    def aggregate(self, function:Callable[[Any, QuantcoDataFrame], Any], initial:Any) -> Any:
+        # Folds the chunks into a single result, e.g. stream.aggregate(lambda count, df: count + df.rows, 0)
+        result = initial
+        for chunk in self:
+            result = function(result, chunk)
+        return result
+
+    def count(self) -> int:
+        return self.aggregate(lambda count, chunk: count + chunk.rows, 0)
+
+    def collect(self) -> QuantcoDataFrame:
+        # Concatenates the chunks into a single frame. The result has to fit into the memory.
+        return concat(list(self))
+
+
+def concat(frames:List[QuantcoDataFrame]) -> QuantcoDataFrame:
+    if not frames:
+        return QuantcoDataFrame()
+    names = list(frames[0].frame.keys())
+    for frame in frames:
+        if list(frame.frame.keys()) != names:
+            raise QuantcoException(f"The frames can't be concatenated. The names of the series are not equal.")
+    frame = {name: _concat_series(name, [chunk[name] for chunk in frames]) for name in names}
+    return QuantcoDataFrame.__from_view__(frame, None, sum(chunk.rows for chunk in frames))
+
+
+def _concat_series(name:str, series:List[QuantcoSeries]) -> QuantcoSeries:
+    # A chunk holding only None values is a NoneType series, the type of the column is taken from the other chunks.
+    types = {item.type for item in series} - {type(None)}
+    if types == {int, float}:
+        # The chunks of a csv column read before its first float value are int chunks, the column is widened to float.
+        types = {float}
+    if len(types) > 1:
+        raise QuantcoException(f"The frames can't be concatenated. The series with name: {name} has elements of different types.")
+    value_type = types.pop() if types else type(None)
+    return QuantcoSeries.__from_buffer__(QuantcoBuffer.concat([item._buffer for item in series], value_type))
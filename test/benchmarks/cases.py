@@ -0,0 +1,103 @@
+import random
+from operator import add, and_, eq, ge, gt, invert, le, lt, mul, ne, or_, sub, truediv, xor
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.series import QuantcoSeries
+
+houses = ["Gryffindor", "Hufflepuff", "Ravenclaw", "Slytherin"]
+
+
+class Case(NamedTuple):
+    # A benchmark: `setup(data, frame)` is not timed and returns the function which is timed. The operators raising
+    # for None values (arithmetic, <, >, &, |) run only on frames without None values.
+    name: str
+    setup: Callable[[Dict[str, List[Any]], QuantcoDataFrame], Callable[[], Any]]
+    nullable: bool = True
+
+
+def generate(rows:int, null_density:float=0.0, columns:int=5, seed:int=0) -> Dict[str, List[Any]]:
+    # The columns of the README example (SKU, price, sales, taxed) and House, followed by float columns up to `columns`.
+    # Every value is None with the probability null_density.
+    generator = random.Random(seed)
+
+    def column(value:Callable[[], Any]) -> List[Any]:
+        return [None if null_density and generator.random() < null_density else value() for _ in range(rows)]
+
+    data = {
+        'SKU': column(lambda: f"{generator.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{generator.randrange(10)}{generator.choice('ABCDEF')}"),
+        'price': column(lambda: round(generator.uniform(0.5, 20.0), 2)),
+        'sales': column(lambda: generator.randrange(100)),
+        'taxed': column(lambda: generator.random() < 0.5),
+        'House': column(lambda: generator.choice(houses)),
+    }
+    for position in range(len(data), columns):
+        data[f"column_{position}"] = column(generator.random)
+    return data
+
+
+def _binary(operator:Callable, left:str, right) -> Callable:
+    # The operator applied to a column and either another column or a value.
+    def setup(data, frame):
+        series = frame[left]
+        operand = frame[right] if type(right) == str and right in data else right
+        return lambda: operator(series, operand)
+    return setup
+
+
+def _from_records(data, frame):
+    records = [dict(zip(data.keys(), row)) for row in zip(*data.values())]
+    return lambda: QuantcoDataFrame.from_records(records)
+
+
+def _from_rows(data, frame):
+    rows = list(zip(*data.values()))
+    return lambda: QuantcoDataFrame.from_rows(rows, list(data.keys()))
+
+
+def _filter_series(data, frame):
+    series, mask = frame["price"], frame["House"] == "Gryffindor"
+    return lambda: series[mask]
+
+
+def _filter_frame(data, frame):
+    mask = frame["House"] == "Gryffindor"
+    return lambda: frame[mask].frame
+
+
+def _readme_query(data, frame):
+    return lambda: frame[(frame["price"] + 5 > 10.0) & (frame["sales"] > 3) & ~frame["taxed"]].frame
+
+
+def _merge(data, frame):
+    right = QuantcoDataFrame({'House': houses, 'points': [1, 2, 3, 4]})
+    return lambda: frame.merge(right, on="House")
+
+
+cases = [
+    Case("construct_series", lambda data, frame: lambda: QuantcoSeries(data["price"])),
+    Case("construct_frame", lambda data, frame: lambda: QuantcoDataFrame(data)),
+    Case("from_records", _from_records),
+    Case("from_rows", _from_rows),
+    Case("add_value", _binary(add, "price", 5.0), False),
+    Case("sub_series", _binary(sub, "price", "sales"), False),
+    Case("mul_series", _binary(mul, "sales", "sales"), False),
+    Case("truediv_value", _binary(truediv, "price", 2.0), False),
+    Case("gt_value", _binary(gt, "price", 10.0), False),
+    Case("ge_value", _binary(ge, "sales", 50), False),
+    Case("lt_value", _binary(lt, "sales", 50), False),
+    Case("le_series", _binary(le, "price", "sales"), False),
+    Case("eq_value", _binary(eq, "House", "Gryffindor")),
+    Case("ne_value", _binary(ne, "SKU", "A1B")),
+    Case("and_series", _binary(and_, "taxed", "taxed"), False),
+    Case("or_series", _binary(or_, "taxed", "taxed"), False),
+    Case("xor_series", _binary(xor, "taxed", "taxed"), False),
+    Case("invert", lambda data, frame: lambda: invert(frame["taxed"])),
+    Case("isin", lambda data, frame: lambda: frame["House"].isin(["Gryffindor", "Ravenclaw"])),
+    Case("filter_series", _filter_series),
+    Case("filter_frame", _filter_frame),
+    Case("readme_query", _readme_query, False),
+    Case("sum", lambda data, frame: lambda: frame["price"].sum(skip_none=True)),
+    Case("groupby", lambda data, frame: lambda: frame.groupby("House").agg({"sales": "sum", "price": ["mean", "max"]})),
+    Case("merge", _merge),
+]
@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from benchmarks.cases import Case, cases, generate
+from pandas_exp.dataframe import QuantcoDataFrame
+
+# Run from the root of the repository:
+#   PYTHONPATH=src:test python -m benchmarks --save baseline.json
+#   PYTHONPATH=src:test python -m benchmarks --compare baseline.json
+# The comparison fails (exit code 1) when a benchmark of the baseline got slower or uses more memory than the
+# tolerance allows. Timings depend on the machine, so the baseline should be saved on the machine comparing it.
+default_sizes = [1_000, 100_000]
+default_null_densities = [0.0, 0.1, 0.5]
+default_columns = [5, 20]
+# The modules whose import is timed, each in a new interpreter, by the benchmark import[module].
+import_modules = ["pandas_exp", "pandas_exp.dataframe"]
+
+
+def run(sizes:List[int], null_densities:List[float], columns:List[int], repeat:int=5, selected:Optional[List[str]]=None) -> Dict[str, dict]:
+    results = {}
+    if not selected or "import" in selected:
+        for module in import_modules:
+            key = f"import[{module}]"
+            results[key] = measure_import(module, repeat)
+            print(_format(key, results[key]), flush=True)
+    for rows in sizes:
+        for null_density in null_densities:
+            for column_count in columns:
+                data = generate(rows, null_density, column_count)
+                frame = QuantcoDataFrame(data)
+                for case in cases:
+                    if (selected and case.name not in selected) or (null_density and not case.nullable):
+                        continue
+                    key = f"{case.name}[rows={rows},nulls={null_density},columns={column_count}]"
+                    results[key] = measure(case, data, frame, repeat)
+                    print(_format(key, results[key]), flush=True)
+    return results
+
+
+def measure(case:Case, data, frame:QuantcoDataFrame, repeat:int) -> dict:
+    # The best of `repeat` timed runs, and the peak of the memory allocated by a separate run under tracemalloc.
+    # The caches of the buffers (statistics, indexes) are cleared before every run, so that each run does the work.
+    timings = []
+    for _ in range(repeat):
+        function = _setup(case, data, frame)
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    function = _setup(case, data, frame)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    seconds = min(timings)
+    rows = frame.rows
+    return {"seconds": seconds, "rows_per_second": rows / seconds if seconds else None, "peak_memory": peak}
+
+
+def measure_import(module:str, repeat:int) -> dict:
+    # The best of `repeat` imports of the module reported by -X importtime, so the startup of the interpreter isn't
+    # counted, and the peak of the memory allocated by a separate import under tracemalloc.
+    timings = []
+    for _ in range(repeat):
+        output = _python("-X", "importtime", "-c", f"import {module}").stderr
+        line = [line for line in output.splitlines() if line.split("|")[-1].strip() == module][-1]
+        timings.append(int(line.split("|")[1]) / 1e6)
+    peak = int(_python("-c", f"import tracemalloc; tracemalloc.start(); import {module}; print(tracemalloc.get_traced_memory()[1])").stdout)
+    return {"seconds": min(timings), "rows_per_second": None, "peak_memory": peak}
+
+
+def compare(results:Dict[str, dict], baseline:Dict[str, dict], tolerance:float=0.25) -> List[str]:
+    # The regressions of the results against the baseline: the benchmarks more than `tolerance` slower, or allocating
+    # more than `tolerance` more memory at their peak. The benchmarks missing from either side are skipped.
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric in ("seconds", "peak_memory"):
+            if result[metric] > baseline[key][metric] * (1 + tolerance):
+                regressions.append(f"{key}: the {metric} went from {baseline[key][metric]:.6g} to {result[metric]:.6g}.")
+    return regressions
+
+
+def main(arguments:Optional[List[str]]=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks of QuantcoSeries and QuantcoDataFrame.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes, help="numbers of rows, e.g. 1000 100000 10000000")
+    parser.add_argument("--nulls", type=float, nargs="+", default=default_null_densities, help="probabilities of a value being None")
+    parser.add_argument("--columns", type=int, nargs="+", default=default_columns, help="numbers of columns of the frames")
+    parser.add_argument("--cases", nargs="+", help="names of the benchmarks to run (import for the import time), all by default")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs of each benchmark, the best is reported")
+    parser.add_argument("--save", help="writes the results to a baseline json file")
+    parser.add_argument("--compare", help="compares the results to a baseline json file and fails on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression, 0.25 by default")
+    options = parser.parse_args(arguments)
+
+    results = run(options.sizes, options.nulls, options.columns, options.repeat, options.cases)
+    if options.save:
+        with open(options.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if options.compare:
+        with open(options.compare) as file:
+            regressions = compare(results, json.load(file), options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def _python(*arguments:str) -> subprocess.CompletedProcess:
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run([sys.executable, *arguments], capture_output=True, text=True, check=True, env=environment)
+
+
+def _setup(case:Case, data, frame:QuantcoDataFrame):
+    for series in frame._frame.values():
+        series._buffer._cache.clear()
+    return case.setup(data, frame)
+
+
+def _format(key:str, result:dict) -> str:
+    throughput = "-" if result["rows_per_second"] is None else f"{result['rows_per_second']:,.0f}"
+    return f"{key:<60} {result['seconds'] * 1000:>12.3f} ms {throughput:>16} rows/s {result['peak_memory'] / 1024:>12,.1f} KiB"
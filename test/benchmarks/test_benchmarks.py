@@ -0,0 +1,100 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from benchmarks.cases import cases, generate
+from benchmarks.runner import compare, import_modules, main, measure_import, run
+
+@pytest.mark.parametrize("null_density", [0.0, 0.5])
+def test_benchmarks_run(null_density):
+    # Given
+    sizes, columns = [100], [5, 8]
+
+    # When
+    results = run(sizes, [null_density], columns, repeat=1, selected=[case.name for case in cases])
+
+    # Then
+    expected_cases = [case.name for case in cases if case.nullable or not null_density]
+    assert len(results) == len(expected_cases) * len(columns)
+    for key, result in results.items():
+        assert key.split("[")[0] in expected_cases
+        assert result["seconds"] > 0
+        assert result["peak_memory"] > 0
+
+def test_generated_columns():
+    # Given
+
+    # When
+    data = generate(1000, 0.5, 8)
+
+    # Then
+    assert list(data.keys()) == ['SKU', 'price', 'sales', 'taxed', 'House', 'column_5', 'column_6', 'column_7']
+    assert all(len(values) == 1000 for values in data.values())
+    assert 400 < data["price"].count(None) < 600
+    assert generate(1000, 0.5, 8) == data
+
+@pytest.mark.parametrize("seconds, peak_memory, expected_regressions",[
+    (0.012, 1000, []),
+    (0.013, 1000, ["sum[rows=100,nulls=0.0,columns=5]: the seconds went from 0.01 to 0.013."]),
+    (0.01, 2000, ["sum[rows=100,nulls=0.0,columns=5]: the peak_memory went from 1000 to 2000."]),
+])
+def test_compare_with_baseline(seconds, peak_memory, expected_regressions):
+    # Given
+    baseline = {"sum[rows=100,nulls=0.0,columns=5]": {"seconds": 0.01, "peak_memory": 1000}}
+    results = {
+        "sum[rows=100,nulls=0.0,columns=5]": {"seconds": seconds, "peak_memory": peak_memory},
+        "sum[rows=1000,nulls=0.0,columns=5]": {"seconds": 1.0, "peak_memory": 1000},
+    }
+
+    # When
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    # Then
+    assert regressions == expected_regressions
+
+def test_main_fails_on_regression(tmp_path):
+    # Given
+    path = str(tmp_path / "baseline.json")
+    arguments = ["--sizes", "100", "--nulls", "0", "--columns", "5", "--cases", "sum", "--repeat", "1"]
+    main(arguments + ["--save", path])
+    with open(path) as file:
+        baseline = json.load(file)
+    for result in baseline.values():
+        result["seconds"] = 0.0
+
+    # When
+    with open(path, "w") as file:
+        json.dump(baseline, file)
+    exit_code = main(arguments + ["--compare", path])
+
+    # Then
+    assert list(baseline.keys()) == ["sum[rows=100,nulls=0.0,columns=5]"]
+    assert exit_code == 1
+
+@pytest.mark.parametrize("module", import_modules)
+def test_import_time_is_measured(module):
+    # Given
+
+    # When
+    result = measure_import(module, repeat=1)
+
+    # Then
+    assert 0 < result["seconds"] < 1
+    assert result["peak_memory"] > 0
+
+@pytest.mark.parametrize("module, unexpected_modules",[
+    ("pandas_exp", ["pandas_exp."]),
+    ("pandas_exp.dataframe", ["concurrent.futures", "multiprocessing", "json", "mmap", "tracemalloc", "pandas_exp.storage"]),
+])
+def test_import_does_no_work(module, unexpected_modules):
+    # Given
+    code = f"import sys; import {module}; print(' '.join(sys.modules))"
+
+    # When
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={"PYTHONPATH": os.pathsep.join(sys.path)})
+
+    # Then
+    imported_modules = result.stdout.split()
+    assert len(result.stdout.splitlines()) == 1
+    assert [name for name in imported_modules if any(name.startswith(prefix) for prefix in unexpected_modules)] == []
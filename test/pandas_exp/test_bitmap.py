@@ -0,0 +1,73 @@
+from operator import and_, or_, xor
+import pytest
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.series import QuantcoSeries
+
+@pytest.mark.parametrize("flags",[
+    [],
+    [1],
+    [0, 1, 1, 0, 1, 0, 0, 1],
+    [1, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1],
+    [1] * 64 + [0] * 63 + [1],
+])
+def test_bitmap_from_bytes(flags):
+    # Given
+
+    # When
+    bitmap = QuantcoBitmap.from_bytes(bytes(flags))
+
+    # Then
+    assert len(bitmap) == len(flags)
+    assert len(bitmap.data) == (len(flags) + 7) // 8
+    assert bitmap.tolist() == flags
+    assert [bitmap[i] for i in range(len(flags))] == flags
+    assert bitmap.count(1) == flags.count(1)
+    assert bitmap.count(0) == flags.count(0)
+    assert bitmap.find(0) == (flags.index(0) if 0 in flags else -1)
+    assert bitmap.find(1, 2) == (flags.index(1, 2) if 1 in flags[2:] else -1)
+    assert bitmap[3:10].tolist() == flags[3:10]
+
+@pytest.mark.parametrize("operator",[and_, or_, xor])
+def test_bitmap_operators(operator):
+    # Given
+    left = [1, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1]
+    right = [0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0]
+
+    # When
+    result = operator(QuantcoBitmap.from_bytes(bytes(left)), QuantcoBitmap.from_bytes(bytes(right)))
+    inverted = ~QuantcoBitmap.from_bytes(bytes(left))
+
+    # Then
+    assert result.tolist() == [operator(l, r) for l, r in zip(left, right)]
+    assert inverted.tolist() == [1 - l for l in left]
+    assert inverted.data[-1] >> 3 == 0
+
+def test_bitmap_set_and_append():
+    # Given
+    bitmap = QuantcoBitmap.zeros(7)
+
+    # When
+    bitmap[2] = True
+    bitmap[-1] = 1
+    bitmap.append(1)
+    bitmap.append(0)
+    bitmap[2] = False
+
+    # Then
+    assert bitmap.tolist() == [0, 0, 0, 0, 0, 0, 1, 1, 0]
+    with pytest.raises(IndexError):
+        bitmap[9] = 1
+
+def test_boolean_operations_on_bitmaps():
+    # Given
+    left = QuantcoSeries([True, False, True, None] * 20)
+    right = QuantcoSeries([True, True, False, False] * 20)
+
+    # When
+    result = ~left[[True, True, True, False] * 20] & right[[True, True, True, False] * 20] | QuantcoSeries([False, False, True] * 20)
+
+    # Then
+    assert type(result._buffer.values) == QuantcoBitmap
+    assert result.series == [False, True, True] * 20
+    with pytest.raises(TypeError):
+        left & right
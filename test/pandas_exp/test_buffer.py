@@ -0,0 +1,59 @@
+from array import array
+import pytest
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.series import QuantcoSeries
+
+@pytest.mark.parametrize("series_name, series, series_type, storage_type, null_count",[
+    ("Empty Series", [], type(None), list, 0),
+    ("Int Series", [1, 2, 3], int, array, 0),
+    ("Int Series with None", [None, 2, None], int, array, 2),
+    ("Float Series", [1.0, None, 3.0], float, array, 1),
+    ("Boolean Series", [True, None, False], bool, QuantcoBitmap, 1),
+    ("String Series", ["Test", None], str, list, 1),
+    ("None Series", [None, None], type(None), list, 2),
+    ("Int Series larger than 64 bits", [2**70, None], int, list, 1)
+])
+def test_buffer_from_list(series_name, series, series_type, storage_type, null_count):
+    # Given
+
+    # When
+    buffer = QuantcoBuffer.from_list(series, series_type)
+
+    # Then
+    assert type(buffer.values) == storage_type
+    assert buffer.type == series_type
+    assert buffer.null_count() == null_count
+    assert len(buffer) == len(series)
+    assert buffer.to_list() == series
+    for i in range(len(series)):
+        assert buffer[i] == series[i]
+        assert type(buffer[i]) == type(series[i])
+
+@pytest.mark.parametrize("series_name, series, storage_type",[
+    ("Int Series", [1, 2, 3], array),
+    ("Float Series", [1.0, None, 3.0], array),
+    ("Boolean Series", [True, None, False], QuantcoBitmap),
+])
+def test_series_is_stored_in_typed_buffer(series_name, series, storage_type):
+    # Given
+
+    # When
+    quantco_series = QuantcoSeries(series)
+
+    # Then
+    assert type(quantco_series._buffer.values) == storage_type
+    assert quantco_series.series == series
+    assert quantco_series[-1] == series[-1]
+
+def test_series_list_is_not_shared_with_buffer():
+    # Given
+    series = ["Test", None]
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    series.append("Test1")
+    quantco_series.series.append("Test2")
+
+    # Then
+    assert quantco_series.series == ["Test", None]
@@ -1,4 +1,6 @@
 
+import pickle
+from pandas_exp import execution
 from pandas_exp.dataframe import QuantcoDataFrame
 from pandas_exp.exception import QuantcoException
 
@@ -435,4 +437,124 @@ def test_invalid_read_operator_with_list_for_quantcoframes(data_frame, series_li
         quantoco_dataframe[series_list]
 
     # Then
-    assert e.value.args[0] == error_message
\ No newline at end of file
+    assert e.value.args[0] == error_message
+def test_chained_filters_compose_selection():
+    # Given
+    quantoco_dataframe = QuantcoDataFrame({
+        'Name' : ["Test", "Test1", "Test2", None, "Test4"],
+        'Number': [23.0, 34.8, None, 98.343, 1.0]
+    })
+
+    # When
+    result = quantoco_dataframe[[True, False, True, True, True]]
+    chained_result = result[[False, True, True, None]]
+
+    # Then
+    assert result.size() == (4, 2)
+    assert chained_result.size() == (2, 2)
+    assert list(chained_result._selection) == [2, 3]
+    assert chained_result._frame is quantoco_dataframe._frame
+    assert chained_result._columns == {}
+    assert chained_result["Name"].series == ["Test2", None]
+    assert chained_result["Number"].series == [None, 98.343]
+    assert chained_result["Number"].type == float
+    assert chained_result.frame["Name"]._buffer.values is chained_result["Name"]._buffer.values
+
+def test_chained_filter_with_wrong_length():
+    # Given
+    result = QuantcoDataFrame({'Name' : ["Test", "Test1", "Test2"]})[[True, False, True]]
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        result[[True, False, True]]
+
+    # Then
+    assert e.value.args[0] == "The length of the series and the filter list/series is not equal."
+
+def test_column_views_copy_on_write():
+    # Given
+    series = QuantcoSeries([7.0, 3.5, 8.0, 6.0])
+    quantoco_dataframe = QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X"],
+        'price' : series
+    })
+    column = quantoco_dataframe["price"]
+    filtered_dataframe = quantoco_dataframe[quantoco_dataframe["price"] > 5.0]
+    subset = quantoco_dataframe.select(["SKU"])
+
+    # When
+    series[0] = 1.0
+    column[1] = None
+    quantoco_dataframe["SKU"][0] = "Test"
+
+    # Then
+    assert column._buffer.values is not series._buffer.values
+    assert series.series == [1.0, 3.5, 8.0, 6.0]
+    assert column.series == [7.0, None, 8.0, 6.0]
+    assert quantoco_dataframe["price"].series == [7.0, 3.5, 8.0, 6.0]
+    assert quantoco_dataframe["SKU"].series == ["X4E", "T3B", "F8D", "C7X"]
+    assert filtered_dataframe["price"].series == [7.0, 8.0, 6.0]
+    assert subset.size() == (4, 1)
+    assert subset["SKU"]._buffer.values is quantoco_dataframe["SKU"]._buffer.values
+
+def test_set_column_on_filtered_dataframe():
+    # Given
+    quantoco_dataframe = QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X"],
+        'price' : [7.0, 3.5, 8.0, 6.0]
+    })
+    filtered_dataframe = quantoco_dataframe[[True, False, True, False]]
+
+    # When
+    filtered_dataframe["sales"] = [5, 1]
+    quantoco_dataframe["taxed"] = QuantcoSeries([False, False, True, False])
+
+    # Then
+    assert filtered_dataframe.size() == (2, 3)
+    assert filtered_dataframe["SKU"].series == ["X4E", "F8D"]
+    assert filtered_dataframe["sales"].series == [5, 1]
+    assert quantoco_dataframe.size() == (4, 3)
+    assert repr(quantoco_dataframe) == "QuantcoDataFrame(size=(4, 3), column_names=['SKU', 'price', 'taxed'])"
+    with pytest.raises(QuantcoException) as e:
+        quantoco_dataframe["sales"] = [1, 2]
+    assert e.value.args[0] == "The length of the series are not equal."
+
+@pytest.mark.parametrize("data_frame, column, row, error_message", [
+    ({'SKU' : ["X4E", "T3B", "F8D"], 'sales' : [5, 3, 1.0]}, "sales", 2, "The elements in the series are not of same type."),
+    ({'SKU' : ["X4E", None, 1], 'sales' : [5, 3, 1]}, "SKU", 2, "The elements in the series are not of same type."),
+    ({'SKU' : ["X4E", "T3B", "F8D"], 'sales' : [5, [3], 1.0]}, "sales", 1, "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+    ({'SKU' : ["X4E", "T3B"], 'sales' : [5]}, None, None, "The length of the series are not equal."),
+])
+def test_invalid_quantcoframes_report_column_and_row(data_frame, column, row, error_message):
+    # Given
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        QuantcoDataFrame(data_frame)
+
+    # Then
+    assert e.value.args[0] == f"The frame is malformed and couldn't be converted to a dataframe. The exception is: {error_message}"
+    assert (e.value.column, e.value.row) == (column, row)
+    assert (pickle.loads(pickle.dumps(e.value)).column, pickle.loads(pickle.dumps(e.value)).row) == (column, row)
+
+@pytest.mark.parametrize("backend", ["serial", "threads", "processes"])
+def test_quantcoframe_columns_are_ingested_on_execution_backend(backend):
+    # Given
+    data_frame = {
+        'SKU' : ["X4E", "T3B", None, "C7X"],
+        'price' : [7.0, 3.5, 8.0, None],
+        'sales' : [5, 3, 1, 10],
+        'taxed' : [False, None, True, False],
+        'House': [None, None, None, None],
+    }
+
+    # When
+    with execution.execution(backend, 2):
+        frame = QuantcoDataFrame(data_frame)
+        with pytest.raises(QuantcoException) as e:
+            QuantcoDataFrame({'SKU' : ["X4E", "T3B"], 'sales' : [5, "3"]})
+
+    # Then
+    for k in data_frame.keys():
+        assert frame[k].series == data_frame[k]
+    assert (e.value.column, e.value.row) == ("sales", 1)
@@ -0,0 +1,80 @@
+import pytest
+from pandas_exp import execution, expression, index
+from pandas_exp.buffer import QuantcoBuffer
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.expression import lazy
+from pandas_exp.series import QuantcoSeries
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X", "A1B", None, "B2C"],
+        'price' : [7.0, 3.5, 8.0, 6.0, None, 1.0, 2.5],
+        'sales' : [5, 3, 1, 10, 3, 7, 2],
+        'taxed' : [False, False, True, False, True, None, False],
+    })
+
+@pytest.mark.parametrize("backend", ["serial", "threads", "processes"])
+def test_operations_on_execution_backend(df, monkeypatch, backend):
+    # Given
+    monkeypatch.setattr(execution, "chunk_size", 2)
+    monkeypatch.setattr(expression, "chunk_size", 3)
+    expected_result = df[(df["sales"] * 2 > 5) & (df["SKU"] != "C7X")]
+
+    # When
+    with execution.execution(backend, 2):
+        mask = (df["sales"] * 2 > 5) & (df["SKU"] != "C7X")
+        with lazy():
+            predicate = (df["sales"] * 2 > 5) & (df["SKU"] != "C7X")
+        result = df[mask]
+        lazy_result = df[predicate]
+        frame = result.frame
+
+    # Then
+    assert execution.get_backend() == "serial"
+    assert mask.series == [True, True, False, False, True, True, False]
+    for k in frame.keys():
+        assert frame[k].series == expected_result[k].series
+        assert lazy_result[k].series == expected_result[k].series
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_first_exception_is_raised_on_execution_backend(df, monkeypatch, backend):
+    # Given
+    monkeypatch.setattr(execution, "chunk_size", 2)
+
+    # When
+    with execution.execution(backend):
+        with pytest.raises(TypeError) as e:
+            df["price"] / QuantcoSeries([1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0])
+
+    # Then
+    assert e.value.args[0] == "unsupported operand type(s) for /: 'NoneType' and 'float'"
+
+def test_indexed_buffer_is_not_split_when_its_index_is_empty(monkeypatch):
+    # Given
+    monkeypatch.setattr(execution, "chunk_size", 2)
+    buffer = QuantcoBuffer.from_list([None] * 5, int)
+    assert len(index.create_sorted_index(buffer)) == 0
+
+    # When
+    with execution.execution("threads"):
+        result = execution.run(lambda operator, *buffers: buffers, None, buffer)
+
+    # Then
+    assert result[0] is buffer
+
+@pytest.mark.parametrize("backend, workers, error_message",[
+    ("gpu", None, "The execution backend gpu is not supported. The supported backends are: serial, threads, processes."),
+    ("threads", 0, "The number of workers should be a positive integer. The provided number is 0."),
+])
+def test_invalid_execution_backend(backend, workers, error_message):
+    # Given
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        execution.set_backend(backend, workers)
+
+    # Then
+    assert e.value.args[0] == error_message
+    assert execution.get_backend() == "serial"
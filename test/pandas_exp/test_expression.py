@@ -0,0 +1,101 @@
+import pytest
+from pandas_exp import expression
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.expression import QuantcoExpression, lazy
+from pandas_exp.series import QuantcoSeries
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X"],
+        'price' : [7.0, 3.5, 8.0, 6.0],
+        'sales' : [5, 3, 1, 10],
+        'taxed' : [False, False, True, False]
+    })
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+def test_lazy_filter_on_dataframe(df, monkeypatch, chunk_size):
+    # Given
+    monkeypatch.setattr(expression, "chunk_size", chunk_size)
+    expected_result = df[(df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]]
+
+    # When
+    with lazy():
+        predicate = (df["price"] + 5.0 > 10.0) & (df["sales"] > 3) & ~df["taxed"]
+    result = df[predicate]
+
+    # Then
+    assert type(predicate) == QuantcoExpression
+    assert predicate.type == bool
+    assert len(predicate) == 4
+    assert result.size() == expected_result.size()
+    for k in result.frame.keys():
+        assert result[k].series == expected_result[k].series
+    assert result["SKU"].series == ["X4E", "C7X"]
+
+def test_lazy_expression_is_evaluated_on_access(df):
+    # Given
+    with lazy():
+        expression_series = (df["price"] * 2 - df["sales"]) / 2
+
+    # When
+    result = expression_series.series
+
+    # Then
+    assert repr(expression_series) == "QuantcoExpression(len=4, operator=truediv, type=<class 'float'>)"
+    assert result == [4.5, 2.0, 7.5, 1.0]
+    assert type(expression_series.evaluate()) == QuantcoSeries
+
+def test_lazy_expression_checks_types_when_built(df):
+    # Given
+
+    # When
+    with lazy():
+        with pytest.raises(QuantcoException) as e:
+            (df["price"] > 3) & df["SKU"]
+
+    # Then
+    assert e.value.args[0] == "The boolean operations don't work on <class 'bool'> type series and <class 'str'> type operand list. The boolean operation work on only bool type series."
+
+def test_lazy_and_short_circuits_chunks(monkeypatch):
+    # Given
+    monkeypatch.setattr(expression, "chunk_size", 2)
+    left = QuantcoSeries([False, False, True, True])
+    right = QuantcoSeries([True, None, True, False])
+
+    # When
+    with lazy():
+        predicate = left & right
+
+    # Then
+    # The None value is in a chunk where the left side is only False, so the right side is not evaluated.
+    assert predicate.series == [False, False, True, False]
+    with pytest.raises(TypeError):
+        (QuantcoSeries([True, False, True, True]) & right).series
+
+def test_lazy_short_circuit_skips_division_by_zero(monkeypatch):
+    # Given
+    monkeypatch.setattr(expression, "chunk_size", 2)
+    df = QuantcoDataFrame({'t' : [False, False, True, True], 'a' : [1.0, 2.0, 3.0, 4.0], 'b' : [1.0, 0.0, 1.0, 2.0]})
+
+    # When
+    with lazy():
+        predicate = df["t"] & (df["a"] / df["b"] > 1.0)
+
+    # Then
+    assert predicate.series == [False, False, True, True]
+
+def test_lazy_expression_keeps_the_series_it_was_built_from():
+    # Given
+    quantco_series = QuantcoSeries([1, 2, 3])
+    with lazy():
+        predicate = quantco_series > 1
+
+    # When
+    quantco_series[0] = 100
+
+    # Then
+    assert predicate.series == [False, True, True]
+    assert quantco_series.series == [100, 2, 3]
+    assert (quantco_series > 1).series == [True, True, True]
@@ -0,0 +1,115 @@
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'House' : ["Gryffindor", "Slytherin", "Gryffindor", "Ravenclaw", "Slytherin", "Gryffindor"],
+        'taxed' : [False, False, True, False, None, True],
+        'price' : [7.0, 3.5, 8.0, None, 6.0, 4.0],
+        'sales' : [5, 3, 1, 10, 2, 7],
+        'SKU' : ["X4E", "T3B", "F8D", "C7X", None, "A1B"],
+    })
+
+def test_groupby_aggregations(df):
+    # Given
+    grouped = df.groupby("House")
+
+    # When
+    result = grouped.agg({"sales": "sum", "price": ["count", "mean", "min", "max", "var"], "SKU": ["min", "count"]})
+
+    # Then
+    assert repr(grouped) == "QuantcoGroupBy(keys=['House'], groups=3)"
+    assert list(result.frame.keys()) == ["House", "sales", "price_count", "price_mean", "price_min", "price_max", "price_var", "SKU_min", "SKU_count"]
+    assert result.size() == (3, 9)
+    assert result["House"].series == ["Gryffindor", "Slytherin", "Ravenclaw"]
+    assert result["sales"].series == [13, 5, 10]
+    assert result["sales"].type == int
+    assert result["price_count"].series == [3, 2, 0]
+    assert result["price_mean"].series == [pytest.approx(19.0 / 3), 4.75, None]
+    assert result["price_min"].series == [4.0, 3.5, None]
+    assert result["price_max"].series == [8.0, 6.0, None]
+    assert result["price_var"].series == [pytest.approx(13.0 / 3), 3.125, None]
+    assert result["SKU_min"].series == ["A1B", "T3B", "C7X"]
+    assert result["SKU_count"].series == [3, 1, 1]
+
+def test_groupby_multiple_keys(df):
+    # Given
+
+    # When
+    result = df.groupby(["House", "taxed"]).agg({"sales": "sum"})
+
+    # Then
+    assert result["House"].series == ["Gryffindor", "Slytherin", "Gryffindor", "Ravenclaw", "Slytherin"]
+    assert result["taxed"].series == [False, False, True, False, None]
+    assert result["sales"].series == [5, 3, 8, 10, 2]
+
+def test_groupby_filtered_frame(df):
+    # Given
+    filtered = df[df["sales"] > 2]
+
+    # When
+    result = filtered.groupby("House").agg({"price": "mean"})
+
+    # Then
+    assert result["House"].series == ["Gryffindor", "Slytherin", "Ravenclaw"]
+    assert result["price"].series == [5.5, 3.5, None]
+
+def test_groupby_empty_frame():
+    # Given
+    df = QuantcoDataFrame({'House' : [], 'sales' : []})
+
+    # When
+    result = df.groupby("House").agg({"sales": "count"})
+
+    # Then
+    assert result.size() == (0, 2)
+
+@pytest.mark.parametrize("keys, aggregation_dict, error_message",[
+    ("House", {"SKU": "sum"}, "The aggregation sum doesn't work on <class 'str'> type series. The aggregation works on only int and float type series."),
+    ("House", {"taxed": "mean"}, "The aggregation mean doesn't work on <class 'bool'> type series. The aggregation works on only int and float type series."),
+    ("House", {"sales": "median"}, "The aggregation median is not supported. The supported aggregations are: sum, count, mean, min, max, var."),
+    ("House", {"Name": "sum"}, "The series with name: Name doesn't exist in the frame."),
+    ("Name", {"sales": "sum"}, "The series with name: Name doesn't exist in the frame."),
+    ([], {"sales": "sum"}, "The frame can't be grouped without the names of the key series."),
+])
+def test_invalid_groupby(df, keys, aggregation_dict, error_message):
+    # Given
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        df.groupby(keys).agg(aggregation_dict)
+
+    # Then
+    assert e.value.args[0] == error_message
+
+def test_groupby_sum_which_is_not_finite():
+    # Given
+    df = QuantcoDataFrame({
+        'House' : ["Gryffindor", "Slytherin", "Gryffindor", "Slytherin"],
+        'price' : [float("inf"), 1e308, float("-inf"), 1e308],
+    })
+
+    # When
+    result = df.groupby("House").agg({"price": ["sum", "mean"]})
+
+    # Then
+    assert [str(value) for value in result["price_sum"].series] == ["nan", "inf"]
+    assert [str(value) for value in result["price_mean"].series] == ["nan", "1e+308"]
+
+def test_groupby_filtered_frame_holding_only_none_values(df):
+    # Given
+    filtered = df[df["sales"] > 8]
+
+    # When
+    result = filtered.groupby("House").agg({"price": ["sum", "count", "mean", "min", "var"]})
+
+    # Then
+    assert filtered["price"].type == type(None)
+    assert result["House"].series == ["Ravenclaw"]
+    assert result["price_sum"].series == [0]
+    assert result["price_count"].series == [0]
+    assert result["price_mean"].series == [None]
+    assert result["price_min"].series == [None]
+    assert result["price_var"].series == [None]
@@ -0,0 +1,169 @@
+from operator import eq, ge, gt, le, lt, ne
+import pytest
+from pandas_exp import kernels
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.series import QuantcoSeries
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X", "A1B", "B2C"],
+        'price' : [7.0, 3.5, 8.0, 6.0, 3.5, None],
+        'sales' : [5, 3, 1, 10, 3, 7],
+    })
+
+@pytest.mark.parametrize("column, operator, operand",[
+    ("sales", gt, 3),
+    ("sales", ge, 3),
+    ("sales", lt, 5),
+    ("sales", le, 5),
+    ("sales", eq, 3),
+    ("sales", ne, 3),
+    ("sales", ge, 4.5),
+    ("price", eq, 3.5),
+    ("price", ne, 3.5),
+    ("SKU", gt, "C"),
+    ("SKU", eq, "F8D"),
+])
+def test_comparison_with_sorted_index(df, monkeypatch, column, operator, operand):
+    # Given
+    expected_result = operator(df[column], operand).series
+    df[column].create_sorted_index()
+    def fail(*args, **kwargs):
+        raise AssertionError("The rows were compared.")
+    monkeypatch.setattr(kernels, "_collect", fail)
+    monkeypatch.setattr(kernels, "_generic", fail)
+
+    # When
+    result = operator(df[column], operand)
+    filtered = df[result]
+
+    # Then
+    assert result.series == expected_result
+    assert filtered["SKU"].series == [sku for sku, selected in zip(df["SKU"].series, expected_result) if selected]
+
+def test_sorted_index_of_sorted_series():
+    # Given
+    quantco_series = QuantcoSeries([1, 3, 3, 5, 8]).create_sorted_index()
+
+    # When
+    result = quantco_series >= 3
+
+    # Then
+    assert repr(quantco_series._buffer._cache["sorted_index"]) == "QuantcoSortedIndex(len=5, sorted=True)"
+    assert result.series == [False, True, True, True, True]
+
+def test_sorted_index_is_dropped_on_setitem(df):
+    # Given
+    series = df["sales"].create_sorted_index()
+
+    # When
+    series[0] = 100
+
+    # Then
+    assert "sorted_index" not in series._buffer._cache
+    assert "sorted_index" in df["sales"]._buffer._cache
+    assert (series > 7).series == [True, False, False, True, False, False]
+
+def test_sorted_index_keeps_exceptions(df):
+    # Given
+    df["price"].create_sorted_index()
+
+    # When
+    with pytest.raises(TypeError) as e:
+        df["price"] > 5.0
+
+    # Then
+    assert e.value.args[0] == "'>' not supported between instances of 'NoneType' and 'float'"
+
+@pytest.mark.parametrize("series, error_message",[
+    ([None, None], "The sorted index can't be created on a series of type <class 'NoneType'>."),
+    ([1.0, float("nan")], "The sorted index can't be created on a series holding NaN values."),
+])
+def test_invalid_sorted_index(series, error_message):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        quantco_series.create_sorted_index()
+
+    # Then
+    assert e.value.args[0] == error_message
+
+@pytest.mark.parametrize("keys, expected_skus",[
+    ("F8D", ["F8D"]),
+    ("Z9Z", []),
+    (["C7X", "X4E", "C7X", "Z9Z"], ["X4E", "C7X"]),
+])
+def test_lookup_with_hash_index(df, keys, expected_skus):
+    # Given
+    df.create_index("SKU")
+
+    # When
+    result = df.lookup("SKU", keys)
+
+    # Then
+    assert result.size() == (len(expected_skus), 3)
+    assert result["SKU"].series == expected_skus
+    assert "hash_index" in df["SKU"]._buffer._cache
+
+def test_lookup_on_filtered_frame(df):
+    # Given
+    filtered = df[df["sales"] > 2]
+
+    # When
+    result = filtered.lookup("sales", [3, 7])
+
+    # Then
+    assert result["SKU"].series == ["T3B", "A1B", "B2C"]
+    assert repr(filtered["sales"]._buffer._cache["hash_index"]) == "QuantcoHashIndex(len=5, keys=4)"
+
+@pytest.mark.parametrize("operator, operand",[
+    (eq, "T3B"),
+    (ne, "T3B"),
+    (eq, "Z9Z"),
+])
+def test_comparison_with_hash_index(df, monkeypatch, operator, operand):
+    # Given
+    expected_result = operator(df["SKU"], operand).series
+    df["SKU"].create_index()
+    def fail(*args, **kwargs):
+        raise AssertionError("The rows were compared.")
+    monkeypatch.setattr(kernels, "_collect", fail)
+    monkeypatch.setattr(kernels, "_generic", fail)
+
+    # When
+    result = operator(df["SKU"], operand)
+
+    # Then
+    assert result.series == expected_result
+
+@pytest.mark.parametrize("series, values, expected_series",[
+    ([5, 3, None, 10, 3], [3, 10], [False, True, False, True, True]),
+    (["X4E", None, "F8D"], ["F8D", None], [False, True, True]),
+    ([5, 3], [], [False, False]),
+])
+def test_isin(series, values, expected_series):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = quantco_series.isin(values)
+    indexed_result = quantco_series.create_index().isin(values)
+
+    # Then
+    assert result.series == expected_series
+    assert indexed_result.series == expected_series
+
+def test_isin_without_list():
+    # Given
+    quantco_series = QuantcoSeries([5, 3])
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        quantco_series.isin(3)
+
+    # Then
+    assert e.value.args[0] == "A valid list was not provided to check the values of the series."
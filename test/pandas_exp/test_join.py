@@ -0,0 +1,85 @@
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+
+@pytest.fixture
+def products():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", None, "C7X"],
+        'price' : [7.0, 3.5, 8.0, 1.0, 6.0],
+    })
+
+@pytest.fixture
+def sales():
+    return QuantcoDataFrame({
+        'SKU' : ["T3B", "X4E", "T3B", "Z9Z", None],
+        'sales' : [3, 5, 1, 10, 2],
+        'price' : [3.0, None, 3.5, 1.0, 2.0],
+    })
+
+def test_inner_merge(products, sales):
+    # Given
+
+    # When
+    result = products.merge(sales, on="SKU")
+
+    # Then
+    assert list(result.frame.keys()) == ["SKU", "price_x", "sales", "price_y"]
+    assert result.size() == (3, 4)
+    assert result["SKU"].series == ["X4E", "T3B", "T3B"]
+    assert result["price_x"].series == [7.0, 3.5, 3.5]
+    assert result["sales"].series == [5, 3, 1]
+    assert result["price_y"].series == [None, 3.0, 3.5]
+
+def test_left_merge(products, sales):
+    # Given
+
+    # When
+    result = products.merge(sales.select(["SKU", "sales"]), on="SKU", how="left")
+
+    # Then
+    assert result["SKU"].series == ["X4E", "T3B", "T3B", "F8D", None, "C7X"]
+    assert result["price"].series == [7.0, 3.5, 3.5, 8.0, 1.0, 6.0]
+    assert result["sales"].series == [5, 3, 1, None, None, None]
+    assert result["sales"].type == int
+
+def test_merge_on_multiple_keys_of_filtered_frames(products, sales):
+    # Given
+    left = products[products["price"] > 3.0]
+    right = sales[sales["sales"] < 5]
+
+    # When
+    result = left.merge(right, on=["SKU", "price"], how="left")
+
+    # Then
+    assert result["SKU"].series == ["X4E", "T3B", "F8D", "C7X"]
+    assert result["sales"].series == [None, 1, None, None]
+
+def test_left_merge_without_matches(products):
+    # Given
+    right = QuantcoDataFrame({'SKU' : ["Z9Z"], 'House' : ["Gryffindor"]})
+
+    # When
+    result = products.merge(right, on="SKU", how="left")
+
+    # Then
+    assert result["House"].series == [None] * 5
+    assert result["House"].type == type(None)
+
+@pytest.mark.parametrize("on, how, error_message",[
+    ("sales", "inner", "The series with name: sales doesn't exist in both frames."),
+    ("SKU", "outer", "The join outer is not supported. The supported joins are: inner, left."),
+    ([], "inner", "The frames can't be joined without the names of the key series."),
+    (["SKU", "House"], "inner", "The series with name: House can't be joined. The types of the series are <class 'str'> and <class 'int'>."),
+])
+def test_invalid_merge(on, how, error_message):
+    # Given
+    left = QuantcoDataFrame({'SKU' : ["X4E"], 'House' : ["Gryffindor"]})
+    right = QuantcoDataFrame({'SKU' : ["X4E"], 'House' : [1], 'sales' : [5]})
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        left.merge(right, on=on, how=how)
+
+    # Then
+    assert e.value.args[0] == error_message
@@ -0,0 +1,173 @@
+from array import array
+from operator import add, eq, gt, le, mul, ne, sub, truediv
+import pytest
+from pandas_exp import kernels
+from pandas_exp.bitmap import QuantcoBitmap
+from pandas_exp.buffer import QuantcoBuffer, QuantcoDictionaryValues, QuantcoScalar
+from pandas_exp.series import QuantcoSeries
+
+@pytest.mark.parametrize("series_name, series, operand, operator, expected_series, expected_type",[
+    ("Int series add int series", [1, 2, 3], [4, 5, 6], add, [5, 7, 9], int),
+    ("Int series divide int series", [1, 2, 3], [2, 2, 2], truediv, [0.5, 1.0, 1.5], float),
+    ("Int series multiply float series", [1, 2, 3], [0.5, 0.5, 0.5], mul, [0.5, 1.0, 1.5], float),
+    ("Float series subtract int series", [1.5, 2.5], [1, 2], sub, [0.5, 0.5], float),
+    ("Int series overflowing 64 bits", [2**62, 2**62], [2**62, 2**62], add, [2**63, 2**63], int),
+    ("String series add string series", ["Test", "Test1"], ["1", "2"], add, ["Test1", "Test12"], str),
+])
+def test_valid_arithmetic_kernels(series_name, series, operand, operator, expected_series, expected_type):
+    # Given
+    left = QuantcoSeries(series)._buffer
+    right = QuantcoSeries(operand)._buffer
+
+    # When
+    result = kernels.arithmetic(operator, left, right)
+
+    # Then
+    assert result.type == expected_type
+    assert result.to_list() == expected_series
+
+@pytest.mark.parametrize("series_name, series, operand, exception, error_message",[
+    ("Division by zero before None", [1.0, 2.0, None], [1.0, 0.0, 1.0], ZeroDivisionError, "float division by zero"),
+    ("None before division by zero", [1.0, None, 2.0], [1.0, 1.0, 0.0], TypeError, "unsupported operand type(s) for /: 'NoneType' and 'float'"),
+    ("None in the operand", [1, 2, 3], [1, None, 0], TypeError, "unsupported operand type(s) for /: 'int' and 'NoneType'"),
+    ("Int division by zero", [1, 2, 3], [1, 0, 1], ZeroDivisionError, "division by zero"),
+])
+def test_invalid_arithmetic_kernels(series_name, series, operand, exception, error_message):
+    # Given
+    left = QuantcoSeries(series)._buffer
+    right = QuantcoSeries(operand)._buffer
+
+    # When
+    with pytest.raises(exception) as e:
+        kernels.arithmetic(truediv, left, right)
+
+    # Then
+    assert e.value.args[0] == error_message
+
+def test_arithmetic_result_is_stored_in_typed_buffer():
+    # Given
+    quantco_series = QuantcoSeries([7.0, 3.5, 8.0, 6.0])
+
+    # When
+    result = quantco_series + QuantcoSeries([5.0] * 4)
+
+    # Then
+    assert type(result._buffer) == QuantcoBuffer
+    assert type(result._buffer.values) == array
+    assert result.type == float
+    assert result.series == [12.0, 8.5, 13.0, 11.0]
+
+@pytest.mark.parametrize("series_name, series, operand, operator, expected_series",[
+    ("Int series equal to int", [1, None, 3], 3, eq, [False, False, True]),
+    ("Int series not equal to int", [1, None, 3], 3, ne, [True, True, False]),
+    ("Boolean series equal to boolean", [True, None, False], False, eq, [False, False, True]),
+    ("String series not equal to string", ["Gryffindor", None, "Slytherin"], "Gryffindor", ne, [False, True, True]),
+    ("Float series less than or equal to float", [7.0, 3.5, 8.0], 7.0, le, [True, True, False]),
+])
+def test_compare_kernels_with_scalar(series_name, series, operand, operator, expected_series):
+    # Given
+    quantco_series = QuantcoSeries(series)
+    scalar = QuantcoScalar(operand, len(series), type(operand))
+
+    # When
+    result = kernels.compare(operator, quantco_series._buffer, scalar)
+
+    # Then
+    assert result.type == bool
+    assert result.to_list() == expected_series
+
+def test_compare_kernels_fail_on_none():
+    # Given
+    quantco_series = QuantcoSeries([7.0, 3.5, None])
+    scalar = QuantcoScalar(5, 3, int)
+
+    # When
+    with pytest.raises(TypeError) as e:
+        kernels.compare(gt, quantco_series._buffer, scalar)
+
+    # Then
+    assert e.value.args[0] == "'>' not supported between instances of 'NoneType' and 'int'"
+
+def test_scalar_operand_is_not_expanded():
+    # Given
+    quantco_series = QuantcoSeries([5, 3, 1, 10])
+
+    # When
+    operand = quantco_series.__convert_object_to_quantco_series__(3)
+    result = quantco_series > 3
+
+    # Then
+    assert type(operand._buffer) == QuantcoScalar
+    assert operand.type == int
+    assert len(operand) == 4
+    assert result.series == [True, False, False, True]
+
+@pytest.mark.parametrize("series_name, series, mask, expected_series, expected_type",[
+    ("Int series", [1, 2, 3, 4, None], [True, False, True, False, True], [1, 3, None], int),
+    ("Float series filtered to None", [1.0, None, 3.0], [False, True, None], [None], type(None)),
+    ("String series", ["Test", None, "Test1"], [True, True, False], ["Test", None], str),
+    ("Boolean series filtered to empty", [True, False], [False, False], [], type(None)),
+])
+def test_filter_kernel(series_name, series, mask, expected_series, expected_type):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = quantco_series[mask]
+
+    # Then
+    assert result.series == expected_series
+    assert result.type == expected_type
+
+def test_derived_series_are_not_validated_again(monkeypatch):
+    # Given
+    quantco_series = QuantcoSeries([7.0, 3.5, 8.0, 6.0])
+    def fail(*args, **kwargs):
+        raise AssertionError("The derived series was validated again.")
+    monkeypatch.setattr(QuantcoSeries, "__check_type_of_each_element_same__", fail)
+
+    # When
+    mask = ~((quantco_series + 5.0 > 10.0) & (quantco_series < 8.0) | (quantco_series == 3.5))
+    result = quantco_series[mask]
+
+    # Then
+    assert mask.series == [False, False, True, False]
+    assert result.series == [8.0]
+
+@pytest.mark.parametrize("series_name, series, operand, operator, expected_series",[
+    ("Equal to string", ["Gryffindor", None, "Slytherin", "Gryffindor"], "Gryffindor", eq, [True, False, False, True]),
+    ("Not equal to string", ["Gryffindor", None, "Slytherin", "Gryffindor"], "Gryffindor", ne, [False, True, True, False]),
+    ("Equal to string not in dictionary", ["Gryffindor", None], "Hufflepuff", eq, [False, False]),
+    ("Not equal to string not in dictionary", ["Gryffindor", None], "Hufflepuff", ne, [True, True]),
+])
+def test_compare_dictionary_encoded_series(series_name, series, operand, operator, expected_series):
+    # Given
+    quantco_series = QuantcoSeries(series).dictionary_encode()
+
+    # When
+    result = operator(quantco_series, operand)
+
+    # Then
+    assert type(quantco_series._buffer.values) == QuantcoDictionaryValues
+    assert type(result._buffer.values) == QuantcoBitmap
+    assert result.series == expected_series
+    assert result.series == operator(QuantcoSeries(series), operand).series
+
+def test_dictionary_encoded_series_keeps_encoding():
+    # Given
+    quantco_series = QuantcoSeries(["Gryffindor", "Slytherin", "Gryffindor", None]).dictionary_encode()
+    view = quantco_series[[True, True, True, True]]
+
+    # When
+    filtered = quantco_series[quantco_series != "Slytherin"]
+    view[1] = "Hufflepuff"
+    view[2] = None
+
+    # Then
+    assert quantco_series._buffer.values.dictionary == ["Gryffindor", "Slytherin"]
+    assert type(filtered._buffer.values) == QuantcoDictionaryValues
+    assert filtered.series == ["Gryffindor", "Gryffindor", None]
+    assert view.series == ["Gryffindor", "Hufflepuff", None, None]
+    assert quantco_series.series == ["Gryffindor", "Slytherin", "Gryffindor", None]
+    assert quantco_series.type == str
+    assert quantco_series._buffer.null_count() == 1
@@ -0,0 +1,115 @@
+import json
+import pytest
+from pandas_exp import profiling
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.expression import lazy
+from pandas_exp.series import QuantcoSeries
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X"],
+        'price' : [7.0, 3.5, 8.0, 6.0],
+        'sales' : [5, 3, 1, 10],
+        'taxed' : [False, False, True, False],
+    })
+
+def test_profile_operations(df):
+    # Given
+
+    # When
+    with profiling.profile() as profiler:
+        mask = (df["price"] + 5 > 10.0) & ~df["taxed"]
+        result = df[mask]
+        QuantcoSeries([1, 2, 3])
+
+    # Then
+    assert profiling.profiler is None
+    assert [record.operation for record in profiler.records] == [
+        "QuantcoDataFrame.__getitem__", "QuantcoSeries.__add__", "QuantcoSeries.__gt__", "QuantcoDataFrame.__getitem__",
+        "QuantcoSeries.__invert__", "QuantcoSeries.__and__", "QuantcoDataFrame.__getitem__", "QuantcoSeries.__init__",
+    ]
+    assert [(record.input_rows, record.output_rows) for record in profiler.records][-2:] == [(4, 2), (3, 3)]
+    assert all(record.depth == 0 and record.seconds >= 0 and record.allocated_bytes is None for record in profiler.records)
+    assert profiler.records[1].caller.endswith('mask = (df["price"] + 5 > 10.0) & ~df["taxed"]')
+    assert profiler.counters()["QuantcoDataFrame.__getitem__"]["calls"] == 3
+    assert profiler.counters()["QuantcoDataFrame.__getitem__"]["input_rows"] == 12
+    assert profiler.counters()["QuantcoDataFrame.__getitem__"]["output_rows"] == 10
+    assert result.rows == 2
+
+def test_profile_nested_operations_and_memory(df):
+    # Given
+    records = []
+
+    # When
+    with profiling.profile(memory=True, trace=False, hook=records.append) as profiler:
+        df[[True, False, True, False]]
+        QuantcoSeries(list(range(10000)))
+
+    # Then
+    assert profiler.records == []
+    assert [(record.operation, record.depth) for record in records] == [
+        ("QuantcoSeries.__init__", 1), ("QuantcoDataFrame.__getitem__", 0), ("QuantcoSeries.__init__", 0),
+    ]
+    assert records[-1].allocated_bytes >= 80000
+    assert profiler.counters()["QuantcoSeries.__init__"]["allocated_bytes"] >= 80000
+
+def test_profile_lazy_expression(df):
+    # Given
+
+    # When
+    with profiling.profile() as profiler, lazy():
+        df["price"] * 2 > 10.0
+
+    # Then
+    assert [(record.operation, record.output_rows) for record in profiler.records] == [
+        ("QuantcoDataFrame.__getitem__", 4), ("QuantcoSeries.__mul__", 4), ("QuantcoSeries.__gt__", 4),
+    ]
+
+def test_profile_keeps_exceptions(df):
+    # Given
+
+    # When
+    with profiling.profile() as profiler:
+        with pytest.raises(TypeError):
+            QuantcoSeries([1, None]) + 1
+        df["sales"] * 2
+
+    # Then
+    assert [record.operation for record in profiler.records] == [
+        "QuantcoSeries.__init__", "QuantcoDataFrame.__getitem__", "QuantcoSeries.__mul__",
+    ]
+
+def test_save_profile(df, tmp_path):
+    # Given
+    path = str(tmp_path / "profile.json")
+    with profiling.profile() as profiler:
+        df["sales"] > 3
+
+    # When
+    profiler.save(path)
+
+    # Then
+    with open(path) as file:
+        saved = json.load(file)
+    assert list(saved["counters"].keys()) == ["QuantcoDataFrame.__getitem__", "QuantcoSeries.__gt__"]
+    assert saved["counters"]["QuantcoSeries.__gt__"]["output_rows"] == 4
+    assert [record["operation"] for record in saved["trace"]] == ["QuantcoDataFrame.__getitem__", "QuantcoSeries.__gt__"]
+
+@pytest.mark.parametrize("series, error_message",[
+    (None, "The series can't be None"),
+    (5, "A valid list was not provided to construct the series."),
+    ([[1]], "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+])
+def test_profile_keeps_exceptions_of_invalid_series(series, error_message):
+    # Given
+
+    # When
+    with profiling.profile() as profiler:
+        with pytest.raises(QuantcoException) as e:
+            QuantcoSeries(series)
+
+    # Then
+    assert e.value.args[0] == error_message
+    assert profiler.records == []
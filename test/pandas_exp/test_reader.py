@@ -0,0 +1,176 @@
+import pytest
+from array import array
+from pandas_exp.buffer import QuantcoBufferBuilder
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.reader import parse_value, read_csv
+
+def write_file(tmp_path, content):
+    path = tmp_path / "frame.csv"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+def test_read_csv_infers_types(tmp_path):
+    # Given
+    path = write_file(tmp_path, "SKU,price,sales,taxed,House\nX4E,7.0,5,False,\nT3B,,3,,\n,8,1,True,\n\"C,7X\",6.0,10,False,\n")
+
+    # When
+    result = QuantcoDataFrame.read_csv(path)
+
+    # Then
+    assert result.size() == (4, 5)
+    assert result["SKU"].series == ["X4E", "T3B", None, "C,7X"]
+    assert result["price"].series == [7.0, None, 8.0, 6.0]
+    assert result["sales"].series == [5, 3, 1, 10]
+    assert result["taxed"].series == [False, None, True, False]
+    assert result["House"].series == [None, None, None, None]
+    assert [result[k].type for k in ["SKU", "price", "sales", "taxed", "House"]] == [str, float, int, bool, type(None)]
+    assert type(result["sales"]._buffer.values) == array
+
+def test_read_csv_in_chunks(tmp_path):
+    # Given
+    path = write_file(tmp_path, "SKU,sales\n" + "".join(f"S{i},{i if i != 3 else ''}\n" for i in range(7)))
+
+    # When
+    chunks = read_csv(path, chunksize=3)
+    frames = list(chunks)
+
+    # Then
+    assert [frame.rows for frame in frames] == [3, 3, 1]
+    assert [frame["sales"].series for frame in frames] == [[0, 1, 2], [None, 4, 5], [6]]
+    assert [frame[frame["sales"] > 0]["SKU"].series for frame in frames[:1] + frames[2:]] == [["S1", "S2"], ["S6"]]
+
+@pytest.mark.parametrize("content, kwargs, error_message",[
+    ("sales\n1\n2.5\n", {"schema": {"sales": int}}, "The value '2.5' in the row 2 of the series with name: sales couldn't be read. The exception is: The elements in the series are not of same type."),
+    ("taxed\nTrue\nyes\n", {}, "The value 'yes' in the row 2 of the series with name: taxed couldn't be read. The exception is: The elements in the series are not of same type."),
+    ("SKU,sales\nX4E,1\nT3B\n", {}, "The row 2 of the file {path} has 1 values, the header has 2 columns."),
+    ("SKU,SKU\nX4E,T3B\n", {}, "The series with name: SKU is defined more than once."),
+    ("sales\n1\n", {"chunksize": 0}, "The chunk size should be a positive integer. The provided chunk size is 0."),
+    ("sales\n1\n", {"schema": {"sales": list}}, "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+])
+def test_read_csv_fails_fast(tmp_path, content, kwargs, error_message):
+    # Given
+    path = write_file(tmp_path, content)
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        frame = read_csv(path, **kwargs)
+        list(frame) if type(frame) != QuantcoDataFrame else frame
+
+    # Then
+    assert e.value.args[0] == error_message.format(path=path)
+
+def test_read_csv_sets_the_column_and_row_of_the_error(tmp_path):
+    # Given
+    path = write_file(tmp_path, "SKU,taxed\nX4E,True\nT3B,False\nF8D,yes\n")
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        read_csv(path)
+
+    # Then
+    assert e.value.column == "taxed"
+    assert e.value.row == 3
+
+def test_read_csv_widens_int_to_float(tmp_path):
+    # Given
+    path = write_file(tmp_path, "sales,units\n7,1\n,2\n3.5,3\n")
+
+    # When
+    result = read_csv(path)
+
+    # Then
+    assert result["sales"].series == [7.0, None, 3.5]
+    assert result["sales"].type == float
+    assert type(result["sales"]._buffer.values) == array
+    assert result["units"].type == int
+
+def test_read_csv_infers_float_from_nan(tmp_path):
+    # Given
+    path = write_file(tmp_path, "price\nnan\n1.5\n")
+
+    # When
+    result = read_csv(path)
+
+    # Then
+    assert result["price"].type == float
+    assert str(result["price"].series[0]) == "nan"
+    assert result["price"].series[1] == 1.5
+
+def test_read_csv_skips_blank_lines(tmp_path):
+    # Given
+    path = write_file(tmp_path, "SKU,sales\nX4E,1\n\nT3B,2\n\n")
+
+    # When
+    result = read_csv(path)
+
+    # Then
+    assert result.size() == (2, 2)
+    assert result["SKU"].series == ["X4E", "T3B"]
+    assert result["sales"].series == [1, 2]
+
+def test_read_csv_with_schema(tmp_path):
+    # Given
+    path = write_file(tmp_path, "SKU,price\n123,1\n,2.5\n")
+
+    # When
+    result = read_csv(path, schema={"SKU": str, "price": float})
+
+    # Then
+    assert result["SKU"].series == ["123", None]
+    assert result["price"].series == [1.0, 2.5]
+    assert result["price"].type == float
+
+@pytest.mark.parametrize("content, expected_size",[
+    ("", (0, 0)),
+    ("SKU,sales\n", (0, 2)),
+])
+def test_read_empty_csv(tmp_path, content, expected_size):
+    # Given
+    path = write_file(tmp_path, content)
+
+    # When
+    result = read_csv(path)
+
+    # Then
+    assert result.size() == expected_size
+
+@pytest.mark.parametrize("text, value_type, expected_value",[
+    ("", type(None), None),
+    ("True", type(None), True),
+    ("-12", type(None), -12),
+    ("1.5e3", type(None), 1500.0),
+    ("1e", type(None), "1e"),
+    ("-inf", type(None), float("-inf")),
+    ("Infinity", type(None), float("inf")),
+    ("infinite", type(None), "infinite"),
+    ("1", float, 1.0),
+    ("False", str, "False"),
+])
+def test_parse_value(text, value_type, expected_value):
+    # Given
+
+    # When
+    result = parse_value(text, value_type)
+
+    # Then
+    assert result == expected_value
+    assert type(result) == type(expected_value)
+
+def test_buffer_builder_types_the_values_when_the_first_value_arrives():
+    # Given
+    builder = QuantcoBufferBuilder()
+
+    # When
+    for value in [None, None, 3, None, 2**70]:
+        builder.append(value)
+    buffer = builder.finish()
+
+    # Then
+    assert buffer.type == int
+    assert buffer.to_list() == [None, None, 3, None, 2**70]
+    assert builder.type == int
+    assert len(builder) == 0
+    with pytest.raises(QuantcoException) as e:
+        builder.append("3")
+    assert e.value.args[0] == "The elements in the series are not of same type."
@@ -0,0 +1,125 @@
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+
+data_frame = {
+    'SKU' : ["X4E", "T3B", None, "C7X"],
+    'price' : [7.0, 3.5, 8.0, None],
+    'sales' : [5, 3, 1, 10],
+    'taxed' : [False, None, True, False],
+    'House': [None, None, None, None],
+}
+records = [dict(zip(data_frame.keys(), row)) for row in zip(*data_frame.values())]
+rows = list(zip(*data_frame.values()))
+
+@pytest.mark.parametrize("frame_name, construct",[
+    ("Records", lambda: QuantcoDataFrame.from_records(records)),
+    ("Records as a generator", lambda: QuantcoDataFrame.from_records(record for record in records)),
+    ("Rows", lambda: QuantcoDataFrame.from_rows(rows, list(data_frame.keys()))),
+    ("Rows as a generator", lambda: QuantcoDataFrame.from_rows(iter(rows), list(data_frame.keys()))),
+])
+def test_frame_from_rows(frame_name, construct):
+    # Given
+    expected_frame = QuantcoDataFrame(data_frame)
+
+    # When
+    frame = construct()
+
+    # Then
+    assert frame.size() == expected_frame.size()
+    assert repr(frame) == repr(expected_frame)
+    for k in data_frame.keys():
+        assert frame[k].series == data_frame[k]
+        assert frame[k].type == expected_frame[k].type
+        assert type(frame[k]._buffer.values) == type(expected_frame[k]._buffer.values)
+
+@pytest.mark.parametrize("rows_to_convert", [records, iter(records)])
+def test_frame_from_records_with_columns_and_schema(rows_to_convert):
+    # Given
+    columns = ["sales", "House", "price"]
+
+    # When
+    frame = QuantcoDataFrame.from_records(rows_to_convert, columns, schema={"House": str})
+
+    # Then
+    assert frame.size() == (4, 3)
+    assert repr(frame) == "QuantcoDataFrame(size=(4, 3), column_names=['sales', 'House', 'price'])"
+    assert frame["sales"].series == [5, 3, 1, 10]
+    assert frame["House"].series == [None, None, None, None]
+    assert frame["House"].type == str
+
+@pytest.mark.parametrize("as_generator", [False, True])
+def test_schema_type_of_column_holding_only_none_values(as_generator):
+    # Given
+    rows_to_convert = [(None, None)]
+
+    # When
+    frame = QuantcoDataFrame.from_rows(iter(rows_to_convert) if as_generator else rows_to_convert, ["a", "b"], schema={"a": int})
+
+    # Then
+    assert frame["a"].type == int
+    assert frame["a"].series == [None]
+    assert frame["b"].type == type(None)
+
+@pytest.mark.parametrize("construct, size",[
+    (lambda: QuantcoDataFrame.from_records([]), (0, 0)),
+    (lambda: QuantcoDataFrame.from_records(iter([])), (0, 0)),
+    (lambda: QuantcoDataFrame.from_records([], ["SKU", "sales"]), (0, 2)),
+    (lambda: QuantcoDataFrame.from_rows([], ["SKU", "sales"], {"sales": int}), (0, 2)),
+])
+def test_empty_frame_from_rows(construct, size):
+    # Given
+
+    # When
+    frame = construct()
+
+    # Then
+    assert frame.size() == size
+
+@pytest.mark.parametrize("rows_to_convert, columns, schema, column, row, error_message",[
+    ([("X4E", 5), ("T3B", 3.0)], ["SKU", "sales"], {}, "sales", 1, "The value 3.0 in the row 1 of the series with name: sales couldn't be read. The exception is: The elements in the series are not of same type."),
+    ([("X4E", 5), ("T3B", [3])], ["SKU", "sales"], {}, "sales", 1, "The value [3] in the row 1 of the series with name: sales couldn't be read. The exception is: The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+    ([("X4E", None), ("T3B", True)], ["SKU", "sales"], {"sales": int}, "sales", 1, "The value True in the row 1 of the series with name: sales couldn't be read. The exception is: The elements in the series are not of same type."),
+    ([("X4E", 5), ("T3B",)], ["SKU", "sales"], {}, None, 1, "The row 1 has 1 values, the frame has 2 columns."),
+    ([("X4E", 5)], ["SKU", "SKU"], {}, None, None, "The series with name: SKU is defined more than once."),
+    ([("X4E", 5)], ["SKU", None], {}, None, None, "The name of the series can't be None."),
+    ([("X4E", 5)], ["SKU", "sales"], {"sales": list}, "sales", None, "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+    ([({1: 2},)], ["a"], {}, "a", 0, "The value {1: 2} in the row 0 of the series with name: a couldn't be read. The exception is: The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+    ([([1],), ([2],)], ["a"], {}, "a", 0, "The value [1] in the row 0 of the series with name: a couldn't be read. The exception is: The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+])
+@pytest.mark.parametrize("as_generator", [False, True])
+def test_invalid_rows(rows_to_convert, columns, schema, column, row, error_message, as_generator):
+    # Given
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        QuantcoDataFrame.from_rows(iter(rows_to_convert) if as_generator else rows_to_convert, columns, schema)
+
+    # Then
+    assert e.value.args[0] == error_message
+    assert (e.value.column, e.value.row) == (column, row)
+
+@pytest.mark.parametrize("as_generator", [False, True])
+def test_record_without_value(as_generator):
+    # Given
+    rows_to_convert = [{"SKU": "X4E", "sales": 5}, {"SKU": "T3B"}]
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        QuantcoDataFrame.from_records(iter(rows_to_convert) if as_generator else rows_to_convert)
+
+    # Then
+    assert e.value.args[0] == "The row 1 has no value for the series with name: sales."
+    assert (e.value.column, e.value.row) == ("sales", 1)
+
+def test_record_with_value_of_type_not_allowed():
+    # Given
+    rows_to_convert = [{"a": [1]}]
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        QuantcoDataFrame.from_records(rows_to_convert)
+
+    # Then
+    assert e.value.args[0] == "The value [1] in the row 0 of the series with name: a couldn't be read. The exception is: The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."
+    assert (e.value.column, e.value.row) == ("a", 0)
@@ -1,3 +1,4 @@
+import math
 from operator import add, and_, eq, ge, gt, invert, le, lt, mul, ne, or_, sub, truediv, xor
 from typing import Any, List
 import pytest
@@ -47,7 +48,8 @@ def test_valid_series(series_name, series, series_type):
     ("List of List", [[]], "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
     ("Mixed Series of type", [False, "Test", 1.2], "The elements in the series are not of same type."),
     ("Mixed Series with List", [1.0,[],3.0], "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
-    ("Mixed Series with Int and Float", [1,2,3,4.0,5.0], "The elements in the series are not of same type.")
+    ("Mixed Series with Int and Float", [1,2,3,4.0,5.0], "The elements in the series are not of same type."),
+    ("Mixed Series with None in between", ["Test", None, 1], "The elements in the series are not of same type.")
 ])
 def test_invalid_series(series_name, series, error_message):
     # Given
@@ -444,3 +446,133 @@ def test_get_item_invalid_series(series_name, series, filter, exception, error_m
 
     # Then
     assert e.value.args[0] == error_message
+
+@pytest.mark.parametrize("series_name, series, position, value, expectation, series_type",[
+    ("Int series", [1, 2, 3], 0, 5, [5, 2, 3], int),
+    ("Int series set None", [1, 2, 3], -1, None, [1, 2, None], int),
+    ("Float series set value over None", [1.0, None], 1, 2.0, [1.0, 2.0], float),
+    ("String series", ["Test", None], 1, "Test1", ["Test", "Test1"], str),
+    ("None series set value", [None, None], 0, True, [True, None], bool),
+    ("Int series set last value to None", [None, 1], 1, None, [None, None], type(None)),
+])
+def test_set_item_valid_series(series_name, series, position, value, expectation, series_type):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    quantco_series[position] = value
+
+    # Then
+    assert quantco_series.series == expectation
+    assert quantco_series.type == series_type
+
+@pytest.mark.parametrize("series_name, series, position, value, exception, error_message",[
+    ("Int series set float", [1, 2, 3], 0, 5.0, QuantcoException, "The elements in the series are not of same type."),
+    ("Int series set list", [1, 2, 3], 0, [5], QuantcoException, "The type of elements in the series are not allowed. The allowed types are: String, Boolean, Int and Float."),
+    ("Int series set through a float", [1, 2, 3], 0.0, 5, QuantcoException, "Unsupported operation. Assignment to the series could be performed only using an integer."),
+    ("Int series out of bound", [1, 2, 3], 3, 5, IndexError, "list assignment index out of range"),
+])
+def test_set_item_invalid_series(series_name, series, position, value, exception, error_message):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    with pytest.raises(exception) as e:
+        quantco_series[position] = value
+
+    # Then
+    assert e.value.args[0] == error_message
+
+def test_dictionary_encode_non_str_series():
+    # Given
+    quantco_series = QuantcoSeries([1, 2, 1])
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        quantco_series.dictionary_encode()
+
+    # Then
+    assert e.value.args[0] == "Unsupported operation. The dictionary encoding works on only str type series. The provided type is <class 'int'>."
+
+@pytest.mark.parametrize("series_name, series, skip_none, expected_values",[
+    ("Int series", [5, 3, 1, 10], False, (19, 4.75, 1, 10, 4)),
+    ("Float series", [0.1] * 10, False, (1.0, 0.1, 0.1, 0.1, 10)),
+    ("Float series with large values", [1e100, 1.0, -1e100], False, (1.0, 1.0 / 3, -1e100, 1e100, 3)),
+    ("Int series with None", [5, None, 1], True, (6, 3.0, 1, 5, 2)),
+    ("Int series larger than 64 bits", [2**70, 1], False, (2**70 + 1, (2**70 + 1) / 2, 1, 2**70, 2)),
+    ("None series", [None, None], True, (0, None, None, None, 0)),
+    ("Empty series", [], False, (0, None, None, None, 0)),
+])
+def test_numeric_reductions(series_name, series, skip_none, expected_values):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = (quantco_series.sum(skip_none), quantco_series.mean(skip_none), quantco_series.min(skip_none), quantco_series.max(skip_none), quantco_series.count())
+
+    # Then
+    assert result == expected_values
+
+@pytest.mark.parametrize("series_name, series, expected_sum, expected_mean",[
+    ("Float series with inf and -inf", [float("inf"), 1.0, float("-inf")], "nan", "nan"),
+    ("Float series with inf", [float("inf"), 1.0], float("inf"), float("inf")),
+    ("Float series overflowing", [1e308, 1e308], float("inf"), float("inf")),
+])
+def test_numeric_reductions_which_are_not_finite(series_name, series, expected_sum, expected_mean):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = (quantco_series.sum(), quantco_series.mean())
+
+    # Then
+    assert [str(value) for value in result] == [str(expected_sum), str(expected_mean)]
+
+@pytest.mark.parametrize("series_name, series, skip_none, expected_values",[
+    ("All True", [True, True], False, (True, True)),
+    ("Some True", [False, True], False, (True, False)),
+    ("All False", [False, False], False, (False, False)),
+    ("True with None", [True, None], True, (True, True)),
+    ("False with None", [False, None], True, (False, False)),
+    ("Empty series", [], False, (False, True)),
+])
+def test_boolean_reductions(series_name, series, skip_none, expected_values):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = (quantco_series.any(skip_none), quantco_series.all(skip_none))
+
+    # Then
+    assert result == expected_values
+
+@pytest.mark.parametrize("series_name, series, reduction, error_message",[
+    ("Sum with None", [5, None, 1], "sum", "The sum of the series can't be computed. The series holds 1 None values, use skip_none=True to skip them."),
+    ("Min with None", ["X4E", None], "min", "The min of the series can't be computed. The series holds 1 None values, use skip_none=True to skip them."),
+    ("All with None", [True, None], "all", "The all of the series can't be computed. The series holds 1 None values, use skip_none=True to skip them."),
+    ("Sum of strings", ["X4E"], "sum", "The sum of the series with type <class 'str'> is not supported."),
+    ("Mean of booleans", [True], "mean", "The mean of the series with type <class 'bool'> is not supported."),
+    ("Any of ints", [1], "any", "The any of the series with type <class 'int'> is not supported."),
+])
+def test_invalid_reductions(series_name, series, reduction, error_message):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        getattr(quantco_series, reduction)()
+
+    # Then
+    assert e.value.args[0] == error_message
+
+def test_min_max_of_strings_and_nan():
+    # Given
+    strings = QuantcoSeries(["T3B", "X4E", "C7X"])
+    floats = QuantcoSeries([7.0, float("nan"), 3.5])
+
+    # When
+    result = (strings.min(), strings.max(), floats.min(), floats.max())
+
+    # Then
+    assert result[:2] == ("C7X", "X4E")
+    assert math.isnan(result[2]) and math.isnan(result[3])
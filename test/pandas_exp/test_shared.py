@@ -0,0 +1,105 @@
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.shared import QuantcoSharedFrame
+
+@pytest.fixture
+def df():
+    return QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", None, "C7X"],
+        'price' : [7.0, 3.5, 8.0, None],
+        'sales' : [5, 3, 1, 10],
+        'taxed' : [False, None, True, False],
+        'House': [None, None, None, None],
+    })
+
+def total_sales(shared):
+    frame = shared.frame
+    return type(frame["sales"]._buffer.values) == memoryview, frame[frame["sales"] > 1]["sales"].sum()
+
+def test_attach_shared_frame(df):
+    # Given
+    with df.to_shared_memory() as shared:
+
+        # When
+        result = QuantcoDataFrame.from_shared_memory(shared.name)
+
+        # Then
+        assert repr(result) == repr(df)
+        for k in df.frame.keys():
+            assert result[k].series == df[k].series
+            assert result[k].type == df[k].type
+        assert type(result["price"]._buffer.values) == memoryview
+        assert result["price"]._buffer.values.readonly
+        assert len(pickle.dumps(shared)) < 100
+
+@pytest.mark.parametrize("name, position, value",[
+    ("sales", 0, 100),
+    ("taxed", 1, True),
+    ("SKU", 2, None),
+    ("House", 0, "Gryffindor"),
+])
+def test_shared_frame_is_read_only(df, name, position, value):
+    # Given
+    with df.to_shared_memory() as shared:
+        frame = QuantcoDataFrame.from_shared_memory(shared.name)
+
+        # When
+        with pytest.raises(QuantcoException) as e:
+            frame[name][position] = value
+
+        # Then
+        assert e.value.args[0] == "The series is read-only. Its values are in shared memory."
+        assert frame[name].series == df[name].series
+
+def test_filtered_shared_frame_can_be_modified(df):
+    # Given
+    with df.to_shared_memory() as shared:
+        sales = shared.frame[shared.frame["sales"] > 1]["sales"]
+
+        # When
+        sales[0] = 100
+
+        # Then
+        assert sales.series == [100, 3, 10]
+        assert shared.frame["sales"].series == [5, 3, 1, 10]
+
+def test_shared_frame_in_worker_processes(df):
+    # Given
+    with df.to_shared_memory() as shared, ProcessPoolExecutor(2) as pool:
+
+        # When
+        results = list(pool.map(total_sales, [shared, shared]))
+
+    # Then
+    assert results == [(True, 18), (True, 18)]
+
+def test_shared_frame_outlives_process_attaching_it(df):
+    # Given
+    code = "import sys; from pandas_exp.dataframe import QuantcoDataFrame; print(QuantcoDataFrame.from_shared_memory(sys.argv[1])['sales'].sum())"
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    with df.to_shared_memory() as shared:
+
+        # When
+        output = subprocess.run([sys.executable, "-c", code, shared.name], capture_output=True, text=True, env=environment, check=True).stdout
+
+        # Then
+        assert output == "19\n"
+        assert QuantcoDataFrame.from_shared_memory(shared.name)["sales"].series == [5, 3, 1, 10]
+
+def test_attach_invalid_shared_memory_block():
+    # Given
+    with QuantcoSharedFrame.create(QuantcoDataFrame({'sales' : [5, 3]})) as shared:
+        shared._memory.buf[:4] = b"CSV,"
+
+        # When
+        with pytest.raises(QuantcoException) as e:
+            QuantcoDataFrame.from_shared_memory(shared.name)
+
+    # Then
+    assert e.value.args[0] == f"The shared memory block {shared.name} is not a QuantcoDataFrame file."
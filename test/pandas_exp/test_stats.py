@@ -0,0 +1,165 @@
+from operator import eq, ge, gt, le, lt, ne
+import pytest
+from pandas_exp import kernels
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.reader import read_csv
+from pandas_exp.records import from_records, from_rows
+from pandas_exp.series import QuantcoSeries
+from pandas_exp.stats import QuantcoStatistics
+
+@pytest.mark.parametrize("series_name, series, null_count, minimum, maximum, distinct_count, is_sorted",[
+    ("Int series", [5, 3, 1, 10, 3], 0, 1, 10, 4, False),
+    ("Sorted int series", [1, 3, 3, 10], 0, 1, 10, 3, True),
+    ("Float series with None", [7.0, None, 3.5], 1, 3.5, 7.0, 2, False),
+    ("Float series with NaN", [7.0, float("nan"), 3.5], 0, None, None, 3, False),
+    ("Boolean series", [False, None, False], 1, False, False, 1, False),
+    ("String series", ["T3B", "X4E", None, "C7X"], 1, "C7X", "X4E", 3, False),
+    ("None series", [None, None], 2, None, None, 0, False),
+    ("Empty series", [], 0, None, None, 0, True),
+    ("Int series larger than 64 bits", [2**70, 1], 0, 1, 2**70, 2, False),
+])
+def test_statistics_of_series(series_name, series, null_count, minimum, maximum, distinct_count, is_sorted):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    statistics = quantco_series.statistics
+
+    # Then
+    assert statistics.null_count == null_count
+    assert statistics.minimum == minimum
+    assert type(statistics.minimum) == type(minimum)
+    assert statistics.maximum == maximum
+    assert statistics.distinct_count == distinct_count
+    assert statistics.is_sorted == is_sorted
+    assert quantco_series.statistics is statistics
+
+def test_statistics_of_dictionary_encoded_series():
+    # Given
+    quantco_series = QuantcoSeries(["Slytherin", "Gryffindor", "Slytherin"]).dictionary_encode()
+
+    # When
+    quantco_series[1] = "Ravenclaw"
+
+    # Then
+    assert quantco_series.statistics.minimum == "Ravenclaw"
+    assert quantco_series.statistics.distinct_count == 2
+
+def test_statistics_are_computed_again_after_setitem():
+    # Given
+    quantco_series = QuantcoSeries([5, 3, 1, 10])
+    view = QuantcoDataFrame({'sales': quantco_series})["sales"]
+    statistics = quantco_series.statistics
+
+    # When
+    view[0] = 100
+
+    # Then
+    assert view.statistics.maximum == 100
+    assert quantco_series.statistics is statistics
+    assert quantco_series.statistics.maximum == 10
+
+@pytest.mark.parametrize("series, operator, operand, expected_value",[
+    ([5, 3, 1, 10], gt, 1000, False),
+    ([5, 3, 1, 10], gt, 0.5, True),
+    ([5, 3, 1, 10], ge, 1, True),
+    ([5, 3, 1, 10], lt, 1, False),
+    ([5, 3, 1, 10], le, 10, True),
+    ([5, None, 1, 10], eq, 11, False),
+    ([5, None, 1, 10], ne, 0, True),
+    ([3, 3], eq, 3, True),
+    (["T3B", "X4E"], lt, "A", False),
+])
+def test_comparison_is_pruned(monkeypatch, series, operator, operand, expected_value):
+    # Given
+    quantco_series = QuantcoSeries(series)
+    def fail(*args, **kwargs):
+        raise AssertionError("The rows were compared.")
+    monkeypatch.setattr(kernels, "_collect", fail)
+    monkeypatch.setattr(kernels, "_generic", fail)
+
+    # When
+    result = operator(quantco_series, operand)
+
+    # Then
+    assert result.series == [expected_value] * len(series)
+
+@pytest.mark.parametrize("series, operator, operand, expected_series",[
+    ([5, 3, 1, 10], gt, 3, [True, False, False, True]),
+    ([5, None, 1, 10], eq, 5, [True, False, False, False]),
+    ([7.0, float("nan")], lt, 100.0, [True, False]),
+])
+def test_comparison_is_not_pruned(series, operator, operand, expected_series):
+    # Given
+    quantco_series = QuantcoSeries(series)
+
+    # When
+    result = operator(quantco_series, operand)
+
+    # Then
+    assert result.series == expected_series
+
+def write_file(tmp_path, content):
+    path = tmp_path / "frame.csv"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+@pytest.mark.parametrize("build",[
+    lambda tmp_path: QuantcoDataFrame({'sales' : [5, 3, 1, 10]}),
+    lambda tmp_path: from_records([{"sales": 5}, {"sales": 3}, {"sales": 1}, {"sales": 10}]),
+    lambda tmp_path: from_rows(iter([(5,), (3,), (1,), (10,)]), ["sales"]),
+    lambda tmp_path: read_csv(write_file(tmp_path, "sales\n5\n3\n1\n10\n")),
+    lambda tmp_path: next(read_csv(write_file(tmp_path, "sales\n5\n3\n1\n10\n"), chunksize=2)),
+])
+def test_comparison_of_ingested_series_is_pruned(tmp_path, monkeypatch, build):
+    # Given
+    df = build(tmp_path)
+    def fail(*args, **kwargs):
+        raise AssertionError("The rows were compared.")
+    monkeypatch.setattr(kernels, "_collect", fail)
+    monkeypatch.setattr(kernels, "_generic", fail)
+
+    # When
+    result = df["sales"] > 1000
+
+    # Then
+    assert result.series == [False] * df.rows
+
+def test_comparison_of_derived_series_does_not_compute_statistics():
+    # Given
+    quantco_series = QuantcoSeries([7.0, 3.5, 8.0, 6.0]) + 5.0
+
+    # When
+    result = quantco_series > 10.0
+
+    # Then
+    assert result.series == [True, False, True, True]
+    assert "statistics" not in quantco_series._buffer._cache
+
+def test_pruning_keeps_exceptions():
+    # Given
+    quantco_series = QuantcoSeries([5, None, 1, 10])
+
+    # When
+    with pytest.raises(TypeError) as e:
+        quantco_series > 1000
+
+    # Then
+    assert e.value.args[0] == "'>' not supported between instances of 'NoneType' and 'int'"
+
+def test_saved_statistics_are_read_with_the_frame(tmp_path, monkeypatch):
+    # Given
+    path = str(tmp_path / "frame.qcdf")
+    QuantcoDataFrame({'sales' : [5, 3, None, 10], 'SKU' : ["X4E", "T3B", "F8D", "C7X"]}).save(path)
+    def fail(*args, **kwargs):
+        raise AssertionError("The statistics were computed.")
+    monkeypatch.setattr(QuantcoStatistics, "__bounds__", fail)
+    monkeypatch.setattr(QuantcoStatistics, "__null_count__", fail)
+
+    # When
+    frame = QuantcoDataFrame.open(path)
+
+    # Then
+    assert frame["sales"].statistics.to_dict() == {"null_count": 1, "minimum": 3, "maximum": 10, "is_sorted": False}
+    assert frame["SKU"].statistics.minimum == "C7X"
+    assert frame[frame["SKU"] == "A1B"].size() == (0, 2)
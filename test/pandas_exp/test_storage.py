@@ -0,0 +1,90 @@
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.storage import QuantcoStringValues
+
+@pytest.mark.parametrize("data_frame", [
+    ({
+
+    }),
+    ({
+        'Name' : [],
+        'Number': []
+    }),
+    ({
+        'SKU' : ["X4E", "T3B", None, "C7X", ""],
+        'price' : [7.0, 3.5, 8.0, None, 1.0],
+        'sales' : [5, 3, 1, 10, -1],
+        'taxed' : [False, None, True, False, True],
+        'House': [None, None, None, None, None],
+        'Unicode': ["Gryffindor", "Hufflepuff", "Ravenclaw", "Slytherin", "Durmstrang é"]
+    })
+])
+def test_save_and_open_quantcoframes(tmp_path, data_frame):
+    # Given
+    path = str(tmp_path / "frame.qcdf")
+    frame = QuantcoDataFrame(data_frame)
+
+    # When
+    frame.save(path)
+    result = QuantcoDataFrame.open(path)
+
+    # Then
+    assert result.size() == frame.size()
+    assert repr(result) == repr(frame)
+    for k in data_frame.keys():
+        assert result[k].series == data_frame[k]
+        assert result[k].type == frame[k].type
+
+def test_opened_frame_is_memory_mapped(tmp_path):
+    # Given
+    path = str(tmp_path / "frame.qcdf")
+    QuantcoDataFrame({
+        'SKU' : ["X4E", "T3B", "F8D", "C7X"],
+        'price' : [7.0, 3.5, 8.0, 6.0],
+    }).save(path)
+    frame = QuantcoDataFrame.open(path)
+
+    # When
+    price = frame["price"]
+    price[0] = 1.0
+    result = frame[frame["price"] > 5.0]
+
+    # Then
+    assert type(frame._frame["price"]._buffer.values) == memoryview
+    assert frame._frame["price"]._buffer.values.readonly
+    assert type(frame._frame["SKU"]._buffer.values) == QuantcoStringValues
+    assert price.series == [1.0, 3.5, 8.0, 6.0]
+    assert frame["price"].series == [7.0, 3.5, 8.0, 6.0]
+    assert result["SKU"].series == ["X4E", "F8D", "C7X"]
+
+def test_save_int_series_larger_than_64_bits(tmp_path):
+    # Given
+    frame = QuantcoDataFrame({'Number': [2**70]})
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        frame.save(str(tmp_path / "frame.qcdf"))
+
+    # Then
+    assert e.value.args[0] == "The series with name: Number can't be saved. The values don't fit into 64 bits."
+
+@pytest.mark.parametrize("truncate",[
+    lambda data: b"SKU,price\n",
+    lambda data: b"",
+    lambda data: data[:20],
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-8],
+])
+def test_open_invalid_file(tmp_path, truncate):
+    # Given
+    path = tmp_path / "frame.qcdf"
+    QuantcoDataFrame({'SKU': ["X4E", "T3B"], 'price': [7.0, None]}).save(str(path))
+    path.write_bytes(truncate(path.read_bytes()))
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        QuantcoDataFrame.open(str(path))
+
+    # Then
+    assert e.value.args[0] == f"The file {path} is not a QuantcoDataFrame file."
@@ -0,0 +1,104 @@
+import pytest
+from pandas_exp.dataframe import QuantcoDataFrame
+from pandas_exp.exception import QuantcoException
+from pandas_exp.reader import read_csv
+from pandas_exp.streaming import QuantcoStream, concat
+
+def chunks():
+    yield QuantcoDataFrame({'SKU' : ["X4E", "T3B"], 'price' : [7.0, 3.5], 'sales' : [5, 3]})
+    yield QuantcoDataFrame({'SKU' : ["F8D"], 'price' : [None], 'sales' : [1]})
+    yield QuantcoDataFrame({'SKU' : ["C7X", "A1B"], 'price' : [6.0, 12.0], 'sales' : [10, 2]})
+
+def test_filter_stream_of_chunks():
+    # Given
+    stream = QuantcoStream(chunks())
+
+    # When
+    result = list(stream.filter(lambda df: df["sales"] > 2).filter(lambda df: df["price"] > 5.0).select(["SKU"]))
+
+    # Then
+    assert [chunk.size() for chunk in result] == [(1, 1), (1, 1)]
+    assert [chunk["SKU"].series for chunk in result] == [["X4E"], ["C7X"]]
+
+def test_collect_and_aggregate_stream():
+    # Given
+    stream = QuantcoStream(list(chunks())).filter(lambda df: df["sales"] < 10)
+
+    # When
+    result = stream.collect()
+    count = stream.count()
+    total = stream.aggregate(lambda total, df: total + sum(df["sales"].series), 0)
+
+    # Then
+    assert result.size() == (4, 3)
+    assert result["SKU"].series == ["X4E", "T3B", "F8D", "A1B"]
+    assert result["price"].series == [7.0, 3.5, None, 12.0]
+    assert result["price"].type == float
+    assert count == 4
+    assert total == 11
+
+def test_stream_from_csv(tmp_path):
+    # Given
+    path = tmp_path / "frame.csv"
+    path.write_text("SKU,sales\n" + "".join(f"S{i},{i}\n" for i in range(10)), encoding="utf-8")
+
+    # When
+    result = QuantcoStream(read_csv(str(path), chunksize=4)).filter(lambda df: df["sales"] > 6).collect()
+
+    # Then
+    assert result["SKU"].series == ["S7", "S8", "S9"]
+
+def test_stream_from_csv_with_null_in_its_own_chunk(tmp_path):
+    # Given
+    path = tmp_path / "frame.csv"
+    path.write_text("k,p\n1,c\n2,\n3,d\n4,c\n", encoding="utf-8")
+
+    # When
+    chunks = list(read_csv(str(path), chunksize=1))
+    result = QuantcoStream(read_csv(str(path), chunksize=1)).filter(lambda df: df["p"] == "c").collect()
+
+    # Then
+    assert [chunk["p"].type for chunk in chunks] == [str, str, str, str]
+    assert result["k"].series == [1, 4]
+    assert result["p"].series == ["c", "c"]
+    assert QuantcoStream(read_csv(str(path), chunksize=1)).collect()["p"].series == ["c", None, "d", "c"]
+
+def test_stream_from_csv_with_int_column_widened_to_float(tmp_path):
+    # Given
+    path = tmp_path / "frame.csv"
+    path.write_text("a\n1\n2\n3.5\n4\n", encoding="utf-8")
+
+    # When
+    chunks = list(read_csv(str(path), chunksize=2))
+    result = QuantcoStream(read_csv(str(path), chunksize=2)).collect()
+
+    # Then
+    assert [chunk["a"].type for chunk in chunks] == [int, float]
+    assert result["a"].series == [1.0, 2.0, 3.5, 4.0]
+    assert result["a"].type == float
+    assert result["a"].series == read_csv(str(path))["a"].series
+
+@pytest.mark.parametrize("stream, error_message",[
+    (QuantcoStream(chunks()).filter(lambda df: "sales"), "Unsupported operation. The predicate of the stream should return a bool type series/list. The provided type is <class 'str'>."),
+    (QuantcoStream([{'SKU' : ["X4E"]}]), "Unsupported operation. The stream works on QuantcoDataFrame chunks. The provided type is <class 'dict'>."),
+    (QuantcoStream([QuantcoDataFrame({'SKU' : ["X4E"]}), QuantcoDataFrame({'SKU' : [1]})]), "The frames can't be concatenated. The series with name: SKU has elements of different types."),
+    (QuantcoStream([QuantcoDataFrame({'SKU' : ["X4E"]}), QuantcoDataFrame({'Name' : ["X4E"]})]), "The frames can't be concatenated. The names of the series are not equal."),
+])
+def test_invalid_stream(stream, error_message):
+    # Given
+
+    # When
+    with pytest.raises(QuantcoException) as e:
+        stream.collect()
+
+    # Then
+    assert e.value.args[0] == error_message
+
+def test_concat_without_frames():
+    # Given
+
+    # When
+    result = concat([])
+
+    # Then
+    assert result.size() == (0, 0)